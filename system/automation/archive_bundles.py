@@ -0,0 +1,194 @@
+"""
+Archive Bundles - pack old archive months into single compressed files
+
+After a few years ``archive/daily`` and ``archive/meetings`` hold tens of
+thousands of small markdown files. pack_month() folds one month into a
+single zip bundle next to the loose folders:
+
+    archive/daily/2025-11-week-45/2025-11-05.md  ->  archive/daily/2025-11.zip
+                                                      member 2025-11-week-45/2025-11-05.md
+    archive/meetings/2025-11/2025-11-05-sync.md  ->  archive/meetings/2025-11.zip
+                                                      member 2025-11/2025-11-05-sync.md
+
+The zip central directory is the offset index, so a single file is read by
+name without unpacking the bundle. read_text() and exists() accept the
+original (loose) path and transparently fall back to the bundle, so readers
+and the archive manifest keep using the same paths before and after
+compaction.
+"""
+
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+BUNDLE_SUFFIX = ".zip"
+MONTH_PREFIX = re.compile(r'^(\d{4}-\d{2})')
+
+_open_bundles: Dict[str, Tuple[int, zipfile.ZipFile]] = {}
+
+
+def _bundle_for(path: Path) -> Optional[Tuple[Path, str]]:
+    """Bundle path and member name that would hold a loose archive path."""
+    path = Path(path)
+    if len(path.parts) < 2:
+        return None
+
+    folder = path.parent
+    match = MONTH_PREFIX.match(folder.name)
+    if not match:
+        return None
+
+    bundle = folder.parent / f"{match.group(1)}{BUNDLE_SUFFIX}"
+    return bundle, f"{folder.name}/{path.name}"
+
+
+def _open_bundle(bundle: Path) -> Optional[zipfile.ZipFile]:
+    """Open (and cache) a bundle, reopening if it was rewritten."""
+    try:
+        mtime_ns = os.stat(bundle).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    key = str(bundle)
+    cached = _open_bundles.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    if cached:
+        cached[1].close()
+
+    archive = zipfile.ZipFile(bundle)
+    _open_bundles[key] = (mtime_ns, archive)
+    return archive
+
+
+def exists(path: Path) -> bool:
+    """True if a file exists loose or inside its month bundle."""
+    path = Path(path)
+    if path.exists():
+        return True
+
+    located = _bundle_for(path)
+    if not located:
+        return False
+
+    archive = _open_bundle(located[0])
+    if archive is None:
+        return False
+
+    try:
+        archive.getinfo(located[1])
+        return True
+    except KeyError:
+        return False
+
+
+def read_text(path: Path, encoding: str = 'utf-8') -> str:
+    """Read a file loose or, if it has been packed, from its month bundle.
+
+    Raises:
+        FileNotFoundError: if the file is in neither place
+    """
+    path = Path(path)
+    if path.exists():
+        return path.read_text(encoding=encoding)
+
+    located = _bundle_for(path)
+    archive = _open_bundle(located[0]) if located else None
+    if archive is None:
+        raise FileNotFoundError(path)
+
+    try:
+        return archive.read(located[1]).decode(encoding)
+    except KeyError:
+        raise FileNotFoundError(path)
+
+
+def iter_archive_files(archive_root: Path, pattern: str = "*.md") -> Iterator[Path]:
+    """Yield every archived file path under archive_root, loose or bundled.
+
+    Bundled files are yielded under their original loose paths, so they can
+    be passed straight to read_text().
+    """
+    archive_root = Path(archive_root)
+    if not archive_root.exists():
+        return
+
+    for folder in sorted(p for p in archive_root.iterdir() if p.is_dir()):
+        yield from sorted(folder.glob(pattern))
+
+    for bundle in sorted(archive_root.glob(f"*{BUNDLE_SUFFIX}")):
+        archive = _open_bundle(bundle)
+        for name in archive.namelist():
+            member = Path(name)
+            if member.match(pattern):
+                yield archive_root / member
+
+
+def pack_month(archive_root: Path, month: str) -> Dict[str, any]:
+    """Pack every ``<month>*`` folder under archive_root into ``<month>.zip``.
+
+    Only markdown files are packed. Files already in the bundle are kept;
+    loose files are added (replacing older bundled copies) and removed only
+    after the bundle is written and verified. Anything else (attachments,
+    exports) stays loose, and so does its folder.
+
+    Args:
+        archive_root: archive/daily or archive/meetings
+        month: 'YYYY-MM'
+
+    Returns:
+        Dict with bundle path and number of files packed
+    """
+    archive_root = Path(archive_root)
+    folders = sorted(p for p in archive_root.glob(f"{month}*") if p.is_dir())
+    loose = [f for folder in folders for f in sorted(folder.glob('*.md')) if f.is_file()]
+
+    bundle = archive_root / f"{month}{BUNDLE_SUFFIX}"
+    if not loose:
+        return {'bundle': str(bundle), 'files_packed': 0}
+
+    members = {f"{f.parent.name}/{f.name}": f for f in loose}
+    tmp_bundle = bundle.with_suffix('.tmp')
+
+    with zipfile.ZipFile(tmp_bundle, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as out:
+        existing = _open_bundle(bundle)
+        if existing is not None:
+            for info in existing.infolist():
+                if info.filename not in members:
+                    out.writestr(info, existing.read(info.filename))
+
+        for name, loose_file in members.items():
+            out.write(loose_file, name)
+
+    with zipfile.ZipFile(tmp_bundle) as check:
+        if check.testzip() is not None:
+            tmp_bundle.unlink()
+            raise IOError(f"Bundle verification failed for {bundle}")
+
+    os.replace(tmp_bundle, bundle)
+
+    for loose_file in loose:
+        loose_file.unlink()
+    for folder in folders:
+        try:
+            folder.rmdir()
+        except OSError:
+            pass  # Non-markdown leftovers; keep the folder
+
+    return {'bundle': str(bundle), 'files_packed': len(loose)}
+
+
+def loose_months(archive_root: Path) -> List[str]:
+    """Months ('YYYY-MM') that still have loose folders under archive_root."""
+    archive_root = Path(archive_root)
+    if not archive_root.exists():
+        return []
+
+    months = set()
+    for folder in archive_root.iterdir():
+        match = MONTH_PREFIX.match(folder.name)
+        if folder.is_dir() and match:
+            months.add(match.group(1))
+    return sorted(months)
@@ -0,0 +1,227 @@
+"""
+Archive Journal - crash-safe, all-or-nothing archival
+
+archive_week_command() moves every daily and old meeting file, then writes
+the week review, active context and archive manifest. If the process dies
+halfway the workspace is left half-archived. ArchiveJournal makes the whole
+run one transaction:
+
+1. Plan: moves and writes are registered; new file contents are staged and
+   existing targets are backed up in ``archive/.archive-staging/``.
+2. Commit: the plan is written atomically to ``archive/.archive-journal.json``
+   (the write-ahead log), then applied with ``os.replace`` (atomic on the
+   same filesystem).
+3. Cleanup: backups, the staging folder and the journal are removed.
+
+Every step is idempotent and its state can be read back from the
+filesystem (is the source gone? is the staged file gone?), so recover()
+can either replay the rest of an interrupted commit or roll back the part
+that was applied. A run that died while planning leaves only the staging
+folder, which recover() throws away.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import content_hash, file_hash, fsync_dir, write_atomic, write_synced
+from tracing import span, traced
+
+JOURNAL_NAME = ".archive-journal.json"
+STAGING_NAME = ".archive-staging"
+STAGED_SUFFIX = ".journal-new"
+BACKUP_SUFFIX = ".journal-bak"
+
+
+class ArchiveJournal:
+    """Write-ahead journal of planned moves and writes."""
+
+    def __init__(self, workspace_root: Path):
+        """Initialize an empty plan.
+
+        Args:
+            workspace_root: Project root; the journal lives in archive/
+        """
+        self.workspace_root = Path(workspace_root)
+        self.path = self.workspace_root / "archive" / JOURNAL_NAME
+        self.staging_dir = self.path.parent / STAGING_NAME
+        self.operations: List[Dict[str, str]] = []
+
+    # -- planning -----------------------------------------------------------
+
+    def add_move(self, src: Path, dst: Path) -> None:
+        """Plan moving src to dst."""
+        self.operations.append({'op': 'move', 'src': str(src), 'dst': str(dst)})
+
+    def add_write(self, path: Path, content: str, before_moves: bool = False) -> None:
+        """Plan replacing path's content; the new content is staged now.
+
+        Nothing is planned if the file already holds exactly this content.
+
+        Args:
+            path: File to write
+            content: New content
+            before_moves: Apply ahead of every planned move, e.g. to rewrite a
+                file at its current path before it is moved
+        """
+        path = Path(path)
+        if file_hash(path) == content_hash(content):
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+
+        # Numbered so two targets with the same name don't share a staging file
+        stem = f"{len(self.operations):04d}-{path.name}"
+        staged = self.staging_dir / (stem + STAGED_SUFFIX)
+        write_synced(staged, content)
+
+        backup = None
+        if path.exists():
+            backup = self.staging_dir / (stem + BACKUP_SUFFIX)
+            shutil.copy2(path, backup)
+
+        operation = {
+            'op': 'write',
+            'path': str(path),
+            'staged': str(staged),
+            'backup': str(backup) if backup else None,
+        }
+        if before_moves:
+            moves = [i for i, planned in enumerate(self.operations) if planned['op'] == 'move']
+            self.operations.insert(moves[0] if moves else len(self.operations), operation)
+        else:
+            self.operations.append(operation)
+
+    def discard(self) -> None:
+        """Drop an uncommitted plan and its staged files.
+
+        No-op once commit() has persisted the journal; recover() owns it then.
+        """
+        if self.path.exists():
+            return
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.operations = []
+
+    # -- commit -------------------------------------------------------------
+
+    @traced('archive.commit')
+    def commit(self) -> int:
+        """Persist the plan, apply it, then clean up.
+
+        Returns:
+            Number of operations applied
+
+        Raises:
+            RuntimeError: if another journal is pending (run recover() first)
+        """
+        if not self.operations:
+            return 0
+
+        if self.path.exists():
+            raise RuntimeError(f"Pending archive journal at {self.path}; run recovery first")
+
+        write_atomic(self.path, json.dumps({'state': 'prepared', 'operations': self.operations}, indent=2))
+
+        for operation in self.operations:
+            with span(f"archive.{operation['op']}", path=operation.get('dst') or operation.get('path')):
+                self._apply(operation)
+
+        self._finish(self.operations)
+        return len(self.operations)
+
+    def _apply(self, operation: Dict[str, str]) -> None:
+        """Apply one operation; safe to call again if it already happened."""
+        if operation['op'] == 'move':
+            src, dst = Path(operation['src']), Path(operation['dst'])
+            if not src.exists() and dst.exists():
+                return  # Already applied
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(src, dst)
+            fsync_dir(dst.parent)
+        else:
+            staged, path = Path(operation['staged']), Path(operation['path'])
+            if not staged.exists():
+                return  # Already applied
+            os.replace(staged, path)
+            fsync_dir(path.parent)
+
+    def _undo(self, operation: Dict[str, str]) -> None:
+        """Revert one operation if it was applied."""
+        if operation['op'] == 'move':
+            src, dst = Path(operation['src']), Path(operation['dst'])
+            if dst.exists() and not src.exists():
+                src.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(dst, src)
+        else:
+            staged, path = Path(operation['staged']), Path(operation['path'])
+            backup = Path(operation['backup']) if operation.get('backup') else None
+            if staged.exists():
+                staged.unlink()  # Never applied
+            elif backup and backup.exists():
+                os.replace(backup, path)
+            elif not backup and path.exists():
+                path.unlink()  # File was created by this journal
+
+    def _finish(self, operations: List[Dict[str, str]]) -> None:
+        """Drop backups, leftover staging files and the journal itself."""
+        for operation in operations:
+            for key in ('backup', 'staged'):
+                leftover = operation.get(key)
+                if leftover and Path(leftover).exists():
+                    Path(leftover).unlink()
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.path.unlink()
+        fsync_dir(self.path.parent)
+
+    # -- recovery -----------------------------------------------------------
+
+    def pending(self) -> bool:
+        """True if an interrupted journal or plan is waiting for recovery."""
+        return self.path.exists() or self.staging_dir.exists()
+
+    def recover(self, mode: str = 'replay') -> Dict[str, any]:
+        """Finish or undo an interrupted commit.
+
+        Args:
+            mode: 'replay' to apply the remaining operations (falls back to
+                rollback if an operation can no longer be applied) or
+                'rollback' to revert the applied ones
+
+        Returns:
+            Dict describing what recovery did
+        """
+        if not self.path.exists():
+            if not self.staging_dir.exists():
+                return {'recovered': False}
+            # Died while planning: nothing was applied, only staged
+            shutil.rmtree(self.staging_dir)
+            return {'recovered': True, 'action': 'discarded-uncommitted-plan'}
+
+        try:
+            journal = json.loads(self.path.read_text())
+        except ValueError:
+            # Unreadable journal: nothing was applied yet
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            self.path.unlink()
+            return {'recovered': True, 'action': 'discarded-incomplete-journal'}
+
+        operations = journal.get('operations', [])
+
+        if mode == 'replay':
+            try:
+                for operation in operations:
+                    self._apply(operation)
+                self._finish(operations)
+                return {'recovered': True, 'action': 'replayed', 'operations': len(operations)}
+            except OSError as e:
+                print(f"⚠️  Replay failed ({e}), rolling back")
+
+        for operation in reversed(operations):
+            self._undo(operation)
+        self._finish(operations)
+        return {'recovered': True, 'action': 'rolled-back', 'operations': len(operations)}
@@ -0,0 +1,125 @@
+"""
+Archive Manifest - resolve archived daily files in one lookup
+
+WeeklyArchival.archive_week() moves dailies into ``archive/daily/<week-id>/``.
+The week folder name depends on the Monday's month and a zero-padded ISO
+week number, which readers kept re-deriving (and getting wrong) by probing
+paths. Instead, archive_week() records every move in
+``archive/daily/manifest.json``:
+
+    {"2025-11-05": ["archive/daily/2025-11-week-45/2025-11-05.md"], ...}
+
+Readers resolve archived files through get_archive_manifest(), which loads
+the manifest once per process and reloads it only if the file changes.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_bundles import iter_archive_files
+
+MANIFEST_NAME = "manifest.json"
+
+
+class ArchiveManifest:
+    """Date -> archived path map stored alongside the daily archive."""
+
+    def __init__(self, workspace_root: Path):
+        """Load (or build) the manifest for a workspace.
+
+        Args:
+            workspace_root: Project root containing archive/daily/
+        """
+        self.workspace_root = Path(workspace_root)
+        self.archive_dir = self.workspace_root / "archive" / "daily"
+        self.path = self.archive_dir / MANIFEST_NAME
+        self.entries: Dict[str, List[str]] = {}
+        self.mtime_ns = None
+        self.load()
+
+    def load(self) -> None:
+        """Read the manifest, building it from the archive tree if missing."""
+        if not self.path.exists():
+            if self.archive_dir.exists():
+                self.rebuild()
+            return
+
+        try:
+            self.entries = json.loads(self.path.read_text())
+            self.mtime_ns = os.stat(self.path).st_mtime_ns
+        except (ValueError, OSError) as e:
+            print(f"⚠️  Archive manifest unreadable ({e}), rebuilding")
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recreate the manifest by scanning archive/daily/ once.
+
+        Only needed to migrate archives written before the manifest existed.
+        Covers both loose week folders and packed month bundles.
+        """
+        self.entries = {}
+        for daily_file in iter_archive_files(self.archive_dir, "????-??-??*.md"):
+            self.record(daily_file.name[:10], daily_file)
+        self.save()
+
+    def is_stale(self) -> bool:
+        """True if the manifest file changed since it was loaded."""
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime_ns
+        except FileNotFoundError:
+            return self.mtime_ns is not None
+
+    def record(self, date_str: str, archived_path: Path) -> None:
+        """Record that a daily file for date_str now lives at archived_path."""
+        rel_path = str(Path(archived_path).relative_to(self.workspace_root))
+        paths = self.entries.setdefault(date_str, [])
+        if rel_path not in paths:
+            paths.append(rel_path)
+            paths.sort()
+
+    def to_json(self) -> str:
+        """Serialized manifest, as written by save()."""
+        return json.dumps(self.entries, indent=2, sort_keys=True)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(self.to_json())
+        os.replace(tmp_path, self.path)
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+
+    def resolve(self, date_str: str) -> List[Path]:
+        """Archived daily files for a date (empty if none)."""
+        return [self.workspace_root / rel_path for rel_path in self.entries.get(date_str, [])]
+
+    def resolve_one(self, date_str: str, filename: str = None) -> Optional[Path]:
+        """Archived daily file for a date, preferring an exact filename match."""
+        paths = self.resolve(date_str)
+        if filename:
+            for path in paths:
+                if path.name == filename:
+                    return path
+        return paths[0] if paths else None
+
+
+_manifests: Dict[str, ArchiveManifest] = {}
+
+
+def get_archive_manifest(workspace_root: Path) -> ArchiveManifest:
+    """Shared ArchiveManifest for a workspace, reloaded only if the file changed."""
+    key = str(Path(workspace_root).resolve())
+    manifest = _manifests.get(key)
+
+    if manifest is None:
+        manifest = ArchiveManifest(workspace_root)
+        _manifests[key] = manifest
+    elif manifest.is_stale():
+        manifest.load()
+
+    return manifest
@@ -0,0 +1,162 @@
+"""
+Atomic Write - crash-safe file writes that skip unchanged content
+
+Every generated file goes through write_if_changed(): the new content is
+hashed and compared with what's on disk, and if they match nothing is
+touched (no new mtime, so editors, file watchers and sync tools stay
+quiet). Otherwise it is written to a temp file in the same directory,
+fsynced and renamed over the target, so readers only ever see the old or
+the new file, never a partial one.
+
+Files that are generated once and then edited by hand (week files) use
+GeneratedFiles, which remembers the hash of what was last generated and
+refuses to overwrite a file whose content has changed since:
+
+    generated = GeneratedFiles(weeks_dir / ".generated.json")
+    generated.write(week_file, content)   # 'written', 'unchanged' or 'edited'
+
+A file that already exists but was never recorded (e.g. written before it
+was tracked) is adopted: its current content counts as generated.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of text content (UTF-8)."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def file_hash(path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def fsync_dir(directory: Path) -> None:
+    """Flush a directory entry update to disk (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_synced(path: Path, content: str) -> None:
+    """Write a file in place and fsync it before returning."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write via temp file + fsync + rename, so the target is never partial."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_name, path.stat().st_mode & 0o777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    fsync_dir(path.parent)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content unless the file already holds exactly it.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if file_hash(path) == content_hash(content):
+        return False
+    write_atomic(path, content)
+    return True
+
+
+class GeneratedFiles:
+    """Hashes of generated files, to avoid overwriting hand edits."""
+
+    def __init__(self, state_path: Path):
+        """Load the hashes recorded in state_path (a small JSON file)."""
+        self.state_path = Path(state_path)
+        self.hashes: Dict[str, str] = {}
+        if self.state_path.exists():
+            try:
+                self.hashes = json.loads(self.state_path.read_text())
+            except (ValueError, OSError):
+                self.hashes = {}
+
+    def is_edited(self, path: Path) -> bool:
+        """True if the file changed since it was last generated.
+
+        A file that exists but was never recorded is not edited (it is
+        adopted on the next write).
+        """
+        path = Path(path)
+        recorded = self.hashes.get(path.name)
+        if recorded is None:
+            return False
+        on_disk = file_hash(path)
+        return on_disk is not None and on_disk != recorded
+
+    def record(self, path: Path, content: str) -> bool:
+        """Remember content as what was generated for path (in memory).
+
+        Returns:
+            True if the recorded hash changed, i.e. the state needs saving
+        """
+        new_hash = content_hash(content)
+        if self.hashes.get(Path(path).name) == new_hash:
+            return False
+        self.hashes[Path(path).name] = new_hash
+        return True
+
+    def to_json(self) -> str:
+        """Serialized hashes, as written to state_path."""
+        return json.dumps(self.hashes, indent=2, sort_keys=True)
+
+    def write(self, path: Path, content: str, force: bool = False) -> str:
+        """Write generated content unless it would clobber hand edits.
+
+        Args:
+            path: Target file
+            content: Newly generated content
+            force: Overwrite even if the file was edited
+
+        Returns:
+            'written', 'unchanged' or 'edited' (left alone because it was edited)
+        """
+        path = Path(path)
+        if not force and self.is_edited(path) and file_hash(path) != content_hash(content):
+            return 'edited'
+
+        status = 'written' if write_if_changed(path, content) else 'unchanged'
+        if self.record(path, content):
+            write_atomic(self.state_path, self.to_json())
+        return status
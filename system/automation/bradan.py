@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+bradan - one command for all workspace automation
+
+Each subcommand imports its module only when it runs, and logging is set
+up by the commands that log, so `bradan daily` doesn't pay for archival,
+recommender or Slack imports:
+
+    bradan daily [--date YYYY-MM-DD] [--events events.json]
+    bradan week [YYYY-MM-DD] [--events events.json]
+    bradan archive --week-start YYYY-MM-DD [--dry-run] [--recover replay|rollback]
+    bradan link-notes [--date today] --docs gemini-docs.json
+    bradan summary [WEEKS_BACK]
+    bradan rollup [--month YYYY-MM | --quarter YYYY-QN]
+    bradan inbox --emails emails.json --slack messages.json
+    bradan jobs [list | run JOB... | tick | serve]
+    bradan links [broken | backlinks PATH | links PATH]
+    bradan serve | status | stop
+
+Add --server to daily/week/archive/link-notes to run them in a warm
+`bradan serve` process, --timing to print startup and run times, and
+--trace to record timing spans (JSONL) and print where the time went,
+and --profile for a cProfile/tracemalloc report plus a flamegraph file:
+
+    bradan --trace week 2025-11-10
+    bradan trace automation/traces/20251110-090000-week.jsonl
+    bradan --profile archive --week-start 2025-11-03
+
+Install as a command with:
+    ln -s "$PWD/system/automation/bradan.py" ~/.local/bin/bradan
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# The only sys.path setup needed: every automation module imports its siblings by name
+AUTOMATION_DIR = str(Path(__file__).resolve().parent)
+if AUTOMATION_DIR not in sys.path:
+    sys.path.insert(0, AUTOMATION_DIR)
+
+_import_seconds = 0.0
+
+
+def _lazy(module: str):
+    """Import a module on first use, counting the time toward startup."""
+    global _import_seconds
+    import importlib
+
+    tracing = sys.modules.get('tracing')
+    start = time.perf_counter()
+    if tracing and tracing.is_enabled() and module not in sys.modules:
+        with tracing.span(f"import {module}"):
+            loaded = importlib.import_module(module)
+    else:
+        loaded = importlib.import_module(module)
+    _import_seconds += time.perf_counter() - start
+    return loaded
+
+
+def _read_json(path: str, default):
+    """JSON from a file path, '-' for stdin, or default when no path was given."""
+    if not path:
+        return default
+    if path == '-':
+        return json.load(sys.stdin)
+    return json.loads(Path(path).read_text())
+
+
+def _this_monday() -> str:
+    from datetime import datetime, timedelta
+
+    today = datetime.now()
+    return (today - timedelta(days=today.weekday())).strftime('%Y-%m-%d')
+
+
+def _print_json(result) -> None:
+    print(json.dumps(result, indent=2, default=str))
+
+
+def _via_server(command: str, request_args: dict) -> int:
+    """Run a command in the warm server and print its output."""
+    server = _lazy('bradan_server')
+    try:
+        response = server.call(command, request_args)
+    except ConnectionError as e:
+        print(f"❌ {e} - start one with `bradan serve`")
+        return 1
+    if response.get('output'):
+        print(response['output'], end='')
+    _print_json(response.get('result', response.get('error')))
+    return 0 if response['ok'] else 1
+
+
+# -- commands ---------------------------------------------------------------
+
+def cmd_daily(args) -> int:
+    request = {
+        'date': args.date,
+        'calendar_events': _read_json(args.events, []),
+        'enable_slack': not args.no_slack,
+    }
+    if args.server:
+        return _via_server('daily', request)
+
+    from datetime import date
+
+    generator = _lazy('cursor_generate_daily').CursorDailyGenerator(enable_slack=request['enable_slack'])
+    target_date = date.fromisoformat(args.date) if args.date else date.today()
+    result = generator.generate_daily_file(target_date, request['calendar_events'])
+    return 0 if result else 1
+
+
+def cmd_week(args) -> int:
+    request = {'week_start': args.week_start or _this_monday(), 'calendar_events': _read_json(args.events, None),
+               'force': args.force}
+    if args.server:
+        return _via_server('week', request)
+
+    result = _lazy('week_generator').generate_week_file(request['week_start'], calendar_events=request['calendar_events'],
+                                                        force=args.force)
+    if result['write_status'] == 'edited':
+        print(f"⚠️  Kept your edits: {result['file_path']} changed since it was generated (use --force to overwrite)")
+        return 0
+    print(f"✅ Generated: {result['file_path']}")
+    print(f"📅 Week: {result['week_start']} to {result['week_end']}")
+    return 0
+
+
+def cmd_archive(args) -> int:
+    if args.recover:
+        _print_json(_lazy('weekly_archival').WeeklyArchival().recover_archive(args.recover))
+        return 0
+    if not args.week_start:
+        print("❌ --week-start is required unless --recover is given")
+        return 2
+
+    request = {
+        'week_start': args.week_start,
+        'dry_run': args.dry_run,
+        'weekly_summary': args.weekly_summary,
+        'context_weeks': args.context_weeks,
+    }
+    if args.server:
+        return _via_server('archive', request)
+
+    weekly_archival = _lazy('weekly_archival')
+    result = weekly_archival.archive_week_command(
+        args.week_start, args.dry_run, args.weekly_summary, args.context_weeks
+    )
+    if args.compact is not None:
+        result['compaction'] = weekly_archival.WeeklyArchival().compact_archives(args.compact, dry_run=args.dry_run)
+    _print_json(result)
+    return 1 if 'error' in result else 0
+
+
+def cmd_link_notes(args) -> int:
+    request = {'date': args.date, 'gemini_docs': _read_json(args.docs, [])}
+    if args.server:
+        return _via_server('link-notes', request)
+
+    _lazy('link_gemini_notes').link_notes_command(request['date'], request['gemini_docs'])
+    return 0
+
+
+def cmd_summary(args) -> int:
+    _lazy('config').setup_logging()
+    summary = _lazy('weekly_meeting_summary').WeeklyMeetingSummaryGenerator()
+    summary_path = summary.generate_summary(args.weeks_back)
+    if not summary_path:
+        print("❌ Failed to generate weekly summary")
+        return 1
+    print(f"✅ Weekly summary saved to: {summary_path}")
+    return 0
+
+
+def cmd_rollup(args) -> int:
+    rollup_generator = _lazy('rollup_generator')
+    if args.quarter:
+        result = rollup_generator.generate_quarter_rollup(args.quarter, refresh=args.refresh)
+    else:
+        from datetime import datetime, timedelta
+
+        month = args.month or (datetime.now().replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+        result = rollup_generator.generate_month_rollup(month, refresh=args.refresh)
+    print(f"✅ Generated: {result['file_path']}")
+    return 0
+
+
+def cmd_inbox(args) -> int:
+    priority_inbox = _lazy('priority_inbox')
+    inbox = priority_inbox.PriorityInbox(args.user_id)
+    inbox.add_emails(_read_json(args.emails, []))
+    inbox.add_slack_messages(_read_json(args.slack, []))
+    print(priority_inbox.format_one_screen_output(inbox.get_prioritized_summary(args.max_items)))
+    return 0
+
+
+def cmd_jobs(args) -> int:
+    job_scheduler = _lazy('job_scheduler')
+    scheduler = job_scheduler.default_scheduler()
+    if args.action == 'run':
+        if not args.jobs:
+            print("❌ Name the jobs to run (see: bradan jobs list)")
+            return 2
+        try:
+            results = scheduler.run(args.jobs)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+        return 1 if 'failed' in results.values() else 0
+    if args.action == 'tick':
+        results = scheduler.tick()
+        return 1 if 'failed' in results.values() else 0
+    if args.action == 'serve':
+        scheduler.serve()
+        return 0
+    print(job_scheduler.format_jobs(scheduler))
+    return 0
+
+
+def cmd_links(args) -> int:
+    from pathlib import Path
+
+    graph = _lazy('link_graph').get_link_graph(Path(args.workspace or _lazy('config').PROJECT_ROOT))
+    if args.action in ('backlinks', 'links') and not args.path:
+        print(f"❌ bradan links {args.action} needs a file path")
+        return 2
+    if args.action == 'backlinks':
+        for source in graph.linked_from(args.path):
+            print(source)
+    elif args.action == 'links':
+        for link in graph.links_from(args.path):
+            print(f"{link['raw']} -> {link['target']}")
+    else:
+        broken = graph.broken_links(args.path)
+        for link in broken:
+            print(f"{link['source']}: {link['raw']}")
+        print(f"\n🔗 {len(graph.files)} files indexed, {len(broken)} broken links")
+        return 1 if broken else 0
+    return 0
+
+
+def cmd_serve(args) -> int:
+    _lazy('bradan_server').serve(args.workspace)
+    return 0
+
+
+def cmd_status(args) -> int:
+    return _via_server('ping', {})
+
+
+def cmd_stop(args) -> int:
+    return _via_server('shutdown', {})
+
+
+def cmd_trace(args) -> int:
+    tracing = _lazy('tracing')
+    print(tracing.summary_tree(tracing.load(args.file), min_ms=args.min_ms))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='bradan', description='Workspace automation')
+    parser.add_argument('--timing', action='store_true', help='Print startup and run times')
+    parser.add_argument('--trace', action='store_true', help='Record timing spans and print a summary tree')
+    parser.add_argument('--trace-file', type=Path, help='JSONL file for --trace (default: automation/traces/)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write cProfile/tracemalloc report and collapsed stacks to automation/profiles/')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    daily = sub.add_parser('daily', help='Create a daily file from calendar events')
+    daily.add_argument('--date', help='YYYY-MM-DD (default: today)')
+    daily.add_argument('--events', help="Calendar events JSON file ('-' for stdin)")
+    daily.add_argument('--no-slack', action='store_true', help='Skip the Slack notification data')
+    daily.set_defaults(func=cmd_daily)
+
+    week = sub.add_parser('week', help='Generate the consolidated week file')
+    week.add_argument('week_start', nargs='?', help='Monday YYYY-MM-DD (default: this week)')
+    week.add_argument('--events', help="This week's calendar events JSON file ('-' for stdin)")
+    week.add_argument('--force', action='store_true', help='Overwrite the week file even if it was edited by hand')
+    week.set_defaults(func=cmd_week)
+
+    archive = sub.add_parser('archive', help='Archive a week of dailies')
+    archive.add_argument('--week-start', help='Week start date (YYYY-MM-DD, Monday)')
+    archive.add_argument('--dry-run', action='store_true', help='Show what would happen without moving files')
+    archive.add_argument('--weekly-summary', help='Path to weekly summary file')
+    archive.add_argument('--context-weeks', type=int, default=2, help='Weeks kept in the active context')
+    archive.add_argument('--compact', type=int, metavar='KEEP_MONTHS',
+                         help='Also pack archive months older than KEEP_MONTHS into bundles')
+    archive.add_argument('--recover', choices=['replay', 'rollback'],
+                         help='Only recover an interrupted archival run')
+    archive.set_defaults(func=cmd_archive)
+
+    link = sub.add_parser('link-notes', help='Link Gemini notes to meeting stubs')
+    link.add_argument('--date', default='today', help='YYYY-MM-DD, today or yesterday')
+    link.add_argument('--docs', help="Gemini docs JSON file from Drive search ('-' for stdin)")
+    link.set_defaults(func=cmd_link_notes)
+
+    for command in (daily, week, archive, link):
+        command.add_argument('--server', action='store_true', help='Run in the warm bradan server')
+
+    summary = sub.add_parser('summary', help='Weekly meeting summary from Gemini notes')
+    summary.add_argument('weeks_back', nargs='?', type=int, default=1)
+    summary.set_defaults(func=cmd_summary)
+
+    rollup = sub.add_parser('rollup', help='Monthly or quarterly rollup')
+    group = rollup.add_mutually_exclusive_group()
+    group.add_argument('--month', help='YYYY-MM (default: last month)')
+    group.add_argument('--quarter', help='YYYY-QN, e.g. 2025-Q4')
+    rollup.add_argument('--refresh', action='store_true', help='Re-extract weeks instead of using cached aggregates')
+    rollup.set_defaults(func=cmd_rollup)
+
+    inbox = sub.add_parser('inbox', help='One-screen priority inbox from emails and Slack messages')
+    inbox.add_argument('--emails', help='Emails JSON file from Gmail MCP')
+    inbox.add_argument('--slack', help='Slack messages JSON file')
+    inbox.add_argument('--user-id', help='Your Slack user ID (surfaces threads awaiting your reply)')
+    inbox.add_argument('--max-items', type=int, default=25)
+    inbox.set_defaults(func=cmd_inbox)
+
+    jobs = sub.add_parser('jobs', help='Scheduled jobs: list, run with dependencies, tick or serve')
+    jobs.add_argument('action', nargs='?', default='list', choices=['list', 'run', 'tick', 'serve'])
+    jobs.add_argument('jobs', nargs='*', help='Jobs to run (required for run)')
+    jobs.set_defaults(func=cmd_jobs)
+
+    links = sub.add_parser('links', help='Backlinks and broken links from the link graph index')
+    links.add_argument('action', nargs='?', default='broken', choices=['broken', 'backlinks', 'links'])
+    links.add_argument('path', nargs='?', help='Workspace-relative file (required for backlinks/links)')
+    links.add_argument('--workspace', type=Path, help='Workspace root (default: this repo)')
+    links.set_defaults(func=cmd_links)
+
+    serve = sub.add_parser('serve', help='Keep a warm server running on a Unix socket')
+    serve.add_argument('--workspace', type=Path, help='Workspace root (default: this repo)')
+    serve.set_defaults(func=cmd_serve)
+
+    sub.add_parser('status', help='Ping the warm server').set_defaults(func=cmd_status)
+    sub.add_parser('stop', help='Stop the warm server').set_defaults(func=cmd_stop)
+
+    trace = sub.add_parser('trace', help='Print the summary tree of a recorded trace')
+    trace.add_argument('file', type=Path, help='JSONL trace file')
+    trace.add_argument('--min-ms', type=float, default=0.0, help='Hide spans faster than this')
+    trace.set_defaults(func=cmd_trace)
+
+    return parser
+
+
+def _run_traced(args) -> int:
+    """Run a command with tracing on, then print the span tree."""
+    from datetime import datetime
+
+    tracing = _lazy('tracing')
+    trace_file = args.trace_file or (
+        _lazy('config').LOG_FILE.parent / "traces" / f"{datetime.now():%Y%m%d-%H%M%S}-{args.command}.jsonl"
+    )
+
+    tracing.enable(trace_file)
+    try:
+        with tracing.span(args.command):
+            code = args.func(args)
+    finally:
+        spans = tracing.disable()
+
+    print(f"\n🔍 Trace ({len(spans)} spans) -> {trace_file}", file=sys.stderr)
+    print(tracing.summary_tree(spans), file=sys.stderr)
+    return code
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    ready = time.perf_counter()
+
+    run = _run_traced if args.trace else args.func
+    if args.profile:
+        code, _ = _lazy('profiling').profile_call(args.command, run, args)
+    else:
+        code = run(args)
+
+    if args.timing:
+        done = time.perf_counter()
+        print(
+            f"⏱️  startup {(ready - _START) * 1000:.1f} ms, "
+            f"imports {_import_seconds * 1000:.1f} ms, "
+            f"{args.command} {(done - ready - _import_seconds) * 1000:.1f} ms",
+            file=sys.stderr
+        )
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
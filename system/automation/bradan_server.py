@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Bradan Server - keep the automation warm between requests
+
+Every "Good morning" or "Archive this week" normally starts a fresh Python
+process that re-imports modules, re-reads templates and rescans the
+workspace. ``serve`` instead keeps one process running with those modules
+imported and their caches (daily template, date index, archive manifest,
+week aggregates, priority patterns) resident, answering JSON requests on a
+Unix socket.
+
+Protocol: one JSON object per line each way.
+
+    -> {"command": "week", "args": {"week_start": "2025-11-10"}}
+    <- {"ok": true, "result": {...}, "output": "<printed text>", "elapsed_ms": 41.2}
+
+Commands map onto the existing entry points:
+    daily       CursorDailyGenerator.generate_daily_file(date, calendar_events)
+    week        generate_week_file(week_start, base_dir, calendar_events, force)
+    archive     archive_week_command(week_start, dry_run, weekly_summary, context_weeks)
+    link-notes  link_notes_command(date, gemini_docs)
+    ping / shutdown
+
+Usage:
+    python system/automation/bradan_server.py serve
+    python system/automation/bradan_server.py call week '{"week_start": "2025-11-10"}'
+    python system/automation/bradan_server.py call daily - < events.json
+    python system/automation/bradan_server.py stop
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+DEFAULT_WORKSPACE = Path(__file__).parent.parent.parent
+
+
+def default_socket_path() -> Path:
+    """Socket path: $BRADAN_SOCKET, or one per user in the temp dir."""
+    if os.environ.get('BRADAN_SOCKET'):
+        return Path(os.environ['BRADAN_SOCKET'])
+    return Path(tempfile.gettempdir()) / f"bradan-{os.getuid()}.sock"
+
+
+class BradanService:
+    """Command handlers sharing one set of warm modules and caches."""
+
+    def __init__(self, workspace_root: Path):
+        self.workspace_root = Path(workspace_root).resolve()
+        self.started = time.time()
+        self.requests = 0
+        self._daily_generators: Dict[bool, Any] = {}
+
+        self.handlers: Dict[str, Callable[[Dict], Any]] = {
+            'ping': self.ping,
+            'daily': self.daily,
+            'week': self.week,
+            'archive': self.archive,
+            'link-notes': self.link_notes,
+        }
+
+    def warm(self) -> None:
+        """Import every handler's modules and load the shared caches once."""
+        from archive_manifest import get_archive_manifest
+        from date_index import get_date_index
+        from priority_patterns import get_priority_patterns
+        from week_aggregates import get_week_aggregates
+        import link_gemini_notes  # noqa: F401
+        import week_generator  # noqa: F401
+        import weekly_archival  # noqa: F401
+
+        get_date_index(self.workspace_root / "work" / "daily")
+        get_archive_manifest(self.workspace_root)
+        get_week_aggregates(self.workspace_root)
+        get_priority_patterns(self.workspace_root)
+
+        generator = self._daily_generator(True)
+        if generator.template_path.exists():
+            generator._load_template()
+
+    def _daily_generator(self, enable_slack: bool):
+        from cursor_generate_daily import CursorDailyGenerator
+
+        if enable_slack not in self._daily_generators:
+            self._daily_generators[enable_slack] = CursorDailyGenerator(self.workspace_root, enable_slack)
+        return self._daily_generators[enable_slack]
+
+    # -- handlers -----------------------------------------------------------
+
+    def ping(self, args: Dict) -> Dict:
+        return {
+            'workspace': str(self.workspace_root),
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': self.requests,
+        }
+
+    def daily(self, args: Dict) -> Any:
+        target_date = date.fromisoformat(args['date']) if args.get('date') else date.today()
+        generator = self._daily_generator(args.get('enable_slack', True))
+        return generator.generate_daily_file(target_date, args.get('calendar_events', []))
+
+    def week(self, args: Dict) -> Dict:
+        from week_generator import generate_week_file
+
+        return generate_week_file(args['week_start'], args.get('base_dir'), args.get('calendar_events'),
+                                  args.get('force', False))
+
+    def archive(self, args: Dict) -> Dict:
+        from weekly_archival import archive_week_command
+
+        return archive_week_command(
+            args['week_start'],
+            args.get('dry_run', False),
+            args.get('weekly_summary'),
+            args.get('context_weeks', 2)
+        )
+
+    def link_notes(self, args: Dict) -> Dict:
+        from link_gemini_notes import link_notes_command
+
+        return link_notes_command(args.get('date', 'today'), args.get('gemini_docs', []))
+
+    def handle(self, request: Dict) -> Dict:
+        """Run one request, capturing what the handler prints."""
+        command = request.get('command')
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {'ok': False, 'error': f"Unknown command: {command}"}
+
+        self.requests += 1
+        output = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output):
+                result = handler(request.get('args') or {})
+            response = {'ok': True, 'result': result}
+        except Exception as e:
+            response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        response['output'] = output.getvalue()
+        response['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return response
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {'ok': False, 'error': f"Bad request: {e}"}
+        else:
+            if request.get('command') == 'shutdown':
+                response = {'ok': True, 'result': 'shutting down'}
+                # shutdown() waits for serve_forever() to return, so it can't run on this thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = self.server.service.handle(request)
+        self.wfile.write(json.dumps(response, default=str).encode() + b'\n')
+
+
+class BradanServer(socketserver.UnixStreamServer):
+    """Unix-socket server; requests run one at a time so handlers never race on files."""
+
+    def __init__(self, socket_path: Path, service: BradanService):
+        self.service = service
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def serve(workspace_root: Path = None, socket_path: Path = None) -> None:
+    """Run the daemon in the foreground until a shutdown request (or Ctrl-C)."""
+    socket_path = Path(socket_path or default_socket_path())
+    service = BradanService(workspace_root or DEFAULT_WORKSPACE)
+
+    if socket_path.exists():
+        if _is_listening(socket_path):
+            raise RuntimeError(f"bradan is already serving on {socket_path}")
+        socket_path.unlink()  # Left over from a crashed server
+
+    # Entry points like archive_week_command resolve the workspace from the cwd
+    os.chdir(service.workspace_root)
+
+    start = time.perf_counter()
+    service.warm()
+    print(f"🔥 Warmed up in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    server = BradanServer(socket_path, service)
+    os.chmod(socket_path, 0o600)
+    print(f"🚀 Serving {service.workspace_root} on {socket_path}")
+    try:
+        server.serve_forever(poll_interval=0.2)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+        print("👋 bradan server stopped")
+
+
+def call(command: str, args: Dict = None, socket_path: Path = None, timeout: float = 300) -> Dict:
+    """Send one request to a running server.
+
+    Args:
+        command: Command name (daily, week, archive, link-notes, ping, shutdown)
+        args: Keyword arguments for the command
+        socket_path: Server socket (defaults to default_socket_path())
+        timeout: Seconds to wait for the response
+
+    Returns:
+        Response dict with 'ok' and 'result' or 'error'
+
+    Raises:
+        ConnectionError: If no server is listening
+    """
+    socket_path = Path(socket_path or default_socket_path())
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            raise ConnectionError(f"No bradan server on {socket_path} ({e})") from e
+        sock.sendall(json.dumps({'command': command, 'args': args or {}}).encode() + b'\n')
+        with sock.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Warm automation server on a Unix socket')
+    parser.add_argument('--socket', type=Path, help='Socket path (default: $BRADAN_SOCKET or temp dir)')
+    sub = parser.add_subparsers(dest='action', required=True)
+
+    serve_parser = sub.add_parser('serve', help='Run the server in the foreground')
+    serve_parser.add_argument('--workspace', type=Path, help='Workspace root (default: this repo)')
+
+    call_parser = sub.add_parser('call', help='Send one request to the server')
+    call_parser.add_argument('command', help='daily, week, archive, link-notes or ping')
+    call_parser.add_argument('args', nargs='?', default='{}', help="JSON arguments ('-' reads stdin)")
+
+    sub.add_parser('status', help='Ping the server')
+    sub.add_parser('stop', help='Ask the server to shut down')
+
+    cli_args = parser.parse_args()
+
+    if cli_args.action == 'serve':
+        serve(cli_args.workspace, cli_args.socket)
+        raise SystemExit(0)
+
+    command = {'call': None, 'status': 'ping', 'stop': 'shutdown'}[cli_args.action] or cli_args.command
+    request_args = {}
+    if cli_args.action == 'call':
+        request_args = json.loads(sys.stdin.read() if cli_args.args == '-' else cli_args.args)
+
+    try:
+        response = call(command, request_args, cli_args.socket)
+    except ConnectionError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    if response.get('output'):
+        print(response['output'], end='')
+    print(json.dumps(response.get('result', response.get('error')), indent=2, default=str))
+    if 'elapsed_ms' in response:
+        print(f"⏱️  {response['elapsed_ms']} ms in server", file=sys.stderr)
+    raise SystemExit(0 if response['ok'] else 1)
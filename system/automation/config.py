@@ -1,6 +1,8 @@
 """Configuration settings for task management automation."""
 
+import logging
 import os
+import sys
 from pathlib import Path
 
 # Project paths (now in system/automation/ so go up 2 levels)
@@ -29,6 +31,28 @@ MEETING_FILE_PATTERN = "{date}-{meeting_slug}.md"
 LOG_LEVEL = "INFO"
 LOG_FILE = PROJECT_ROOT / "automation" / "automation.log"
 
+_logging_configured = False
+
+def setup_logging():
+    """Configure the automation log (file + stdout) on first call.
+
+    Called from entry points rather than at import time, so importing a
+    module (e.g. from the bradan CLI or server) doesn't open the log file.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_FILE),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    _logging_configured = True
+
 def ensure_directories():
     """Ensure all required directories exist."""
     DAILY_DIR.mkdir(parents=True, exist_ok=True)
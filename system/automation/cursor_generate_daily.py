@@ -16,7 +16,15 @@ import re
 import sys
 
 # Add automation directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "automation"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_atomic
+from tracing import traced
+
+# Template path -> (mtime_ns, content); lets a long-running process (bradan serve)
+# reuse the parsed template until the file changes
+_template_cache: Dict[str, tuple] = {}
+
 
 class CursorDailyGenerator:
     """Generate daily files using real MCP data from Cursor environment."""
@@ -310,6 +318,7 @@ class CursorDailyGenerator:
 {description if description else ''}
 """
     
+    @traced()
     def generate_daily_file(self, target_date: date, calendar_events: List[Dict]) -> bool:
         """Generate daily file with real MCP calendar data."""
         try:
@@ -325,8 +334,7 @@ class CursorDailyGenerator:
                 print(f"Error: Template not found at {self.template_path}")
                 return False
             
-            with open(self.template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            template_content = self._load_template()
             
             # Process template
             content = template_content
@@ -359,8 +367,7 @@ class CursorDailyGenerator:
                 print(f"⚠️  Daily file already exists: {daily_file_path}")
                 return True
             
-            with open(daily_file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_atomic(daily_file_path, content)
             
             print(f"✅ Created daily file: {daily_file_path}")
             
@@ -384,6 +391,19 @@ class CursorDailyGenerator:
             traceback.print_exc()
             return False
     
+    def _load_template(self) -> str:
+        """Daily template content, cached until the file changes."""
+        mtime_ns = self.template_path.stat().st_mtime_ns
+        cached = _template_cache.get(str(self.template_path))
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with open(self.template_path, 'r', encoding='utf-8') as f:
+            template_content = f.read()
+        _template_cache[str(self.template_path)] = (mtime_ns, template_content)
+        return template_content
+    
+    @traced()
     def _create_meeting_stubs(self, target_date: date, events: List[Dict]):
         """Create meeting file stubs for calendar events."""
         for event in events:
@@ -401,8 +421,7 @@ class CursorDailyGenerator:
                 
                 meeting_content = self.create_meeting_content(event, target_date)
                 
-                with open(meeting_file_path, 'w', encoding='utf-8') as f:
-                    f.write(meeting_content)
+                write_atomic(meeting_file_path, meeting_content)
                 
                 print(f"✅ Created meeting stub: {meeting_file_path}")
                 
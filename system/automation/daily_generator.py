@@ -11,20 +11,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import (
     PROJECT_ROOT, DAILY_DIR, DAILY_TEMPLATE, DAILY_FILE_PATTERN,
-    CHECK_EXISTING_FILES, LOG_FILE, LOG_LEVEL, ensure_directories
+    CHECK_EXISTING_FILES, ensure_directories, setup_logging
 )
 from template_processor import TemplateProcessor, create_daily_context
 from calendar_sync import CalendarSync
+from tracing import span, traced
+from atomic_write import write_atomic, write_if_changed
 
-# Set up logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Logging is configured by setup_logging() when an entry point runs
 logger = logging.getLogger(__name__)
 
 class DailyFileGenerator:
@@ -35,6 +29,7 @@ class DailyFileGenerator:
         self.calendar_sync = CalendarSync()
         ensure_directories()
     
+    @traced()
     def generate_daily_file(self, target_date: date = None) -> bool:
         """Generate a daily file for the specified date.
         
@@ -58,7 +53,8 @@ class DailyFileGenerator:
         try:
             # Get calendar events
             logger.info("Fetching calendar events...")
-            calendar_events = self.calendar_sync.get_formatted_events(target_date)
+            with span('mcp.calendar_events'):
+                calendar_events = self.calendar_sync.get_formatted_events(target_date)
             logger.info(f"Found {len(calendar_events)} calendar events")
             
             # Create template context
@@ -88,14 +84,15 @@ class DailyFileGenerator:
         return DAILY_DIR / filename
     
     def _write_daily_file(self, file_path: Path, content: str):
-        """Write content to daily file."""
+        """Write content to daily file (atomically; skipped if unchanged)."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if not write_if_changed(file_path, content):
+                logger.info(f"Daily file unchanged: {file_path}")
         except Exception as e:
             logger.error(f"Error writing daily file {file_path}: {e}")
             raise
     
+    @traced()
     def _create_meeting_stubs(self, target_date: date, events: list):
         """Create meeting file stubs for calendar events."""
         from config import MEETINGS_DIR, MEETING_FILE_PATTERN
@@ -121,8 +118,7 @@ class DailyFileGenerator:
                 meeting_content = self._create_meeting_content(event, target_date)
                 
                 # Write meeting file
-                with open(meeting_path, 'w', encoding='utf-8') as f:
-                    f.write(meeting_content)
+                write_atomic(meeting_path, meeting_content)
                 
                 logger.info(f"Created meeting stub: {meeting_path}")
                 
@@ -228,6 +224,7 @@ class DailyFileGenerator:
 
 def main():
     """Main entry point."""
+    setup_logging()
     logger.info("Starting daily file generation")
     
     generator = DailyFileGenerator()
@@ -236,16 +233,22 @@ def main():
     target_date = date.today()
     
     # Check command line arguments for custom date
-    if len(sys.argv) > 1:
+    profile = '--profile' in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg != '--profile']
+    if argv:
         try:
-            target_date = datetime.strptime(sys.argv[1], '%Y-%m-%d').date()
+            target_date = datetime.strptime(argv[0], '%Y-%m-%d').date()
             logger.info(f"Using custom date: {target_date}")
         except ValueError:
-            logger.error(f"Invalid date format: {sys.argv[1]}. Use YYYY-MM-DD format.")
+            logger.error(f"Invalid date format: {argv[0]}. Use YYYY-MM-DD format.")
             sys.exit(1)
     
     # Generate the daily file
-    success = generator.generate_daily_file(target_date)
+    if profile:
+        from profiling import profile_call
+        success, _ = profile_call('daily', generator.generate_daily_file, target_date)
+    else:
+        success = generator.generate_daily_file(target_date)
     
     if success:
         logger.info("Daily file generation completed successfully")
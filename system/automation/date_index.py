@@ -0,0 +1,156 @@
+"""
+Date Index - one directory scan, then dictionary lookups by date
+
+Daily files, meeting notes and decision logs are all named with a leading
+date (``YYYY-MM-DD-...`` or, for decision logs, ``YYYY-MM-...``). Instead of
+running ``exists()``/``glob`` once per day, each directory is scanned once
+with ``os.scandir`` into a date -> files map. Week, month and range lookups
+are then dictionary hits.
+
+Indexes are shared through get_date_index() and rebuilt only when the
+directory's modification time changes (i.e. a file was added, removed or
+renamed in it).
+"""
+
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Union
+
+DATED_NAME = re.compile(r'^(\d{4}-\d{2})(?:-(\d{2}))?(?=[-.])')
+
+DateLike = Union[date, datetime, str]
+
+
+def _day_key(day: DateLike) -> str:
+    """Normalize a date, datetime or 'YYYY-MM-DD' string to a day key."""
+    if isinstance(day, str):
+        return day
+    return day.strftime('%Y-%m-%d')
+
+
+class DateIndex:
+    """Map dates and months to the dated files in one directory."""
+
+    def __init__(self, directory: Path, suffix: str = '.md'):
+        """Scan a directory once.
+
+        Args:
+            directory: Directory to index (not recursive)
+            suffix: Only index files with this extension
+        """
+        self.directory = Path(directory)
+        self.suffix = suffix
+        self.by_day: Dict[str, List[Path]] = {}
+        self.by_month: Dict[str, List[Path]] = {}
+        self.mtime_ns = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rescan the directory."""
+        self.by_day = {}
+        self.by_month = {}
+
+        try:
+            self.mtime_ns = os.stat(self.directory).st_mtime_ns
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            self.mtime_ns = None
+            return
+
+        for entry in entries:
+            if entry.name.endswith(self.suffix) and entry.is_file():
+                self.add(Path(entry.path))
+
+        for files in self.by_day.values():
+            files.sort()
+        for files in self.by_month.values():
+            files.sort()
+
+    def add(self, path: Path) -> None:
+        """Index one file (no-op if its name has no leading date)."""
+        match = DATED_NAME.match(path.name)
+        if not match:
+            return
+
+        month, day = match.group(1), match.group(2)
+        self.by_month.setdefault(month, []).append(path)
+        if day:
+            self.by_day.setdefault(f"{month}-{day}", []).append(path)
+
+    def discard(self, path: Path) -> None:
+        """Remove one file from the index (e.g. after moving it away)."""
+        match = DATED_NAME.match(path.name)
+        if not match:
+            return
+
+        month, day = match.group(1), match.group(2)
+        buckets = [self.by_month.get(month)]
+        if day:
+            buckets.append(self.by_day.get(f"{month}-{day}"))
+
+        for files in buckets:
+            if files and path in files:
+                files.remove(path)
+
+    def is_stale(self) -> bool:
+        """True if the directory changed since the last scan."""
+        try:
+            return os.stat(self.directory).st_mtime_ns != self.mtime_ns
+        except FileNotFoundError:
+            return self.mtime_ns is not None
+
+    def for_day(self, day: DateLike) -> List[Path]:
+        """Files dated on a given day."""
+        return list(self.by_day.get(_day_key(day), []))
+
+    def for_range(self, start: DateLike, end: DateLike) -> List[Path]:
+        """Files dated between start and end (inclusive), in date order."""
+        if isinstance(start, str):
+            start = datetime.strptime(start, '%Y-%m-%d')
+        if isinstance(end, str):
+            end = datetime.strptime(end, '%Y-%m-%d')
+
+        files = []
+        day = start
+        while day <= end:
+            files.extend(self.by_day.get(_day_key(day), []))
+            day += timedelta(days=1)
+        return files
+
+    def for_week(self, week_start: DateLike, days: int = 7) -> List[Path]:
+        """Files dated in the `days` days starting at week_start."""
+        if isinstance(week_start, str):
+            week_start = datetime.strptime(week_start, '%Y-%m-%d')
+        return self.for_range(week_start, week_start + timedelta(days=days - 1))
+
+    def for_month(self, month: Union[DateLike, str]) -> List[Path]:
+        """Files dated in a month ('YYYY-MM', or any date in it).
+
+        Includes month-only names like decision logs ('YYYY-MM-topic.md').
+        """
+        if not isinstance(month, str):
+            month = month.strftime('%Y-%m')
+        return list(self.by_month.get(month[:7], []))
+
+    def dated_files(self) -> Dict[str, List[Path]]:
+        """All day-dated files, keyed by 'YYYY-MM-DD'."""
+        return self.by_day
+
+
+_indexes: Dict[str, DateIndex] = {}
+
+
+def get_date_index(directory: Path, suffix: str = '.md') -> DateIndex:
+    """Shared DateIndex for a directory, rescanned only if the directory changed."""
+    key = f"{Path(directory).resolve()}|{suffix}"
+    index = _indexes.get(key)
+
+    if index is None:
+        index = DateIndex(directory, suffix)
+        _indexes[key] = index
+    elif index.is_stale():
+        index.rebuild()
+
+    return index
@@ -0,0 +1,141 @@
+"""
+Event Index - sorted interval index over a week's calendar events
+
+Accepts events either as raw Google Calendar / MCP dicts ('summary',
+'start': {'dateTime': ...}, 'attendees': [{'email': ...}]) or in the
+parsed form produced by CursorDailyGenerator.parse_mcp_event() ('title',
+'date', 'start_time', 'end_time', 'attendees').
+
+Events are kept sorted by start time, and every title word and attendee
+name has its own start-sorted posting list. "When is the next meeting
+about any of these words?" is then one bisect per word:
+
+    index = EventIndex(calendar_events)
+    index.next_related(tokenize("Send Riley the SPIF draft"), after=now)
+"""
+
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tfidf_index import tokenize
+
+# Title words too common to link a task to a specific meeting
+GENERIC_TITLE_WORDS = {
+    'sync', 'meeting', 'weekly', 'daily', 'call', 'chat', 'check', 'update',
+    'standup', 'team', 'review', 'prep', 'block', 'focus', 'time', 'office',
+    'hours', 'lunch', 'one', 'all', 'hands', 'session', 'catch', 'biweekly',
+}
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO date/datetime to a naive local datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def normalize_event(event: Dict) -> Optional[Dict]:
+    """Event dict with 'title', 'start', 'end' (datetimes) and 'attendees'."""
+    title = event.get('title') or event.get('summary') or 'Untitled Event'
+
+    if 'date' in event and 'start_time' in event:
+        # Parsed form from CursorDailyGenerator.parse_mcp_event()
+        all_day = event['start_time'] == 'All day'
+        if all_day:
+            start = _parse_datetime(event['date'])
+            end = None
+        else:
+            start = _parse_datetime(f"{event['date']}T{event['start_time']}")
+            end = _parse_datetime(f"{event['date']}T{event.get('end_time') or event['start_time']}")
+    else:
+        start_info = event.get('start') or {}
+        end_info = event.get('end') or {}
+        all_day = 'dateTime' not in start_info
+        start = _parse_datetime(start_info.get('dateTime', start_info.get('date', '')))
+        end = _parse_datetime(end_info.get('dateTime', end_info.get('date', '')))
+
+    if start is None:
+        return None
+    if all_day and end is None:
+        end = start + timedelta(days=1)
+
+    attendees = []
+    for attendee in event.get('attendees', []):
+        if isinstance(attendee, dict):
+            attendee = attendee.get('displayName') or attendee.get('email', '')
+        attendees.append(attendee)
+
+    return {
+        'title': title,
+        'start': start,
+        'end': end if end and end >= start else start,
+        'attendees': attendees,
+        'all_day': all_day,
+    }
+
+
+def attendee_tokens(attendee: str) -> List[str]:
+    """Name tokens for an attendee ('andre.smith@x.com' -> ['andre', 'smith'])."""
+    name = attendee.split('@')[0]
+    return [token for token in re.split(r'[^a-z]+', name.lower()) if len(token) >= 3]
+
+
+class EventIndex:
+    """Start-sorted calendar events with per-token posting lists."""
+
+    def __init__(self, events: Iterable[Dict]):
+        """Normalize and index events (unparseable ones are skipped)."""
+        normalized = [e for e in (normalize_event(event) for event in events) if e]
+        self.events: List[Dict] = sorted(normalized, key=lambda e: e['start'])
+        self.starts: List[datetime] = [e['start'] for e in self.events]
+
+        # token -> positions in self.events (ascending, hence start-sorted)
+        self.postings: Dict[str, List[int]] = {}
+        for position, event in enumerate(self.events):
+            tokens = {t for t in tokenize(event['title']) if t not in GENERIC_TITLE_WORDS}
+            for attendee in event['attendees']:
+                tokens.update(attendee_tokens(attendee))
+            for token in tokens:
+                self.postings.setdefault(token, []).append(position)
+
+        self._starts_by_token: Dict[str, List[datetime]] = {
+            token: [self.starts[p] for p in positions] for token, positions in self.postings.items()
+        }
+
+    def between(self, start: datetime, end: datetime) -> List[Dict]:
+        """Events starting in [start, end)."""
+        return self.events[bisect_left(self.starts, start):bisect_left(self.starts, end)]
+
+    def next_related(self, tokens: Iterable[str], after: datetime) -> Optional[Dict]:
+        """Soonest event at or after `after` sharing a title/attendee token.
+
+        One bisect per token, so O(k log n) for k tokens and n events.
+        """
+        best_position = None
+        for token in set(tokens):
+            starts = self._starts_by_token.get(token)
+            if not starts:
+                continue
+            i = bisect_left(starts, after)
+            if i < len(starts):
+                position = self.postings[token][i]
+                if best_position is None or position < best_position:
+                    best_position = position
+        return self.events[best_position] if best_position is not None else None
+
+    def overlapping(self, moment: datetime) -> List[Dict]:
+        """Events in progress at a moment (started before, ending after)."""
+        started = self.events[:bisect_right(self.starts, moment)]
+        return [e for e in started if e['end'] > moment]
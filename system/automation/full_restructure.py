@@ -9,15 +9,22 @@ Then: python3 automation/full_restructure.py --execute
 
 import os
 import shutil
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_atomic
+from link_graph import get_link_graph
+
 class Restructure:
     def __init__(self, base_dir=None, dry_run=True):
         self.base = Path(base_dir) if base_dir else Path.cwd()
         self.dry_run = dry_run
         self.moves = []
         self.log = []
+        self.graph = None
         
     def log_action(self, action):
         """Log an action."""
@@ -33,8 +40,63 @@ class Restructure:
             full_path.mkdir(parents=True, exist_ok=True)
             self.log_action(f"✅ Created {path}")
     
+    def link_graph(self):
+        """Backlink index, synced with the disk once per run.
+        
+        Moves keep it current in memory (see track_move()); run() saves it at
+        the end unless this is a dry run.
+        """
+        if self.graph is None:
+            self.graph = get_link_graph(self.base, refresh=False)
+            self.graph.refresh()
+        return self.graph
+    
+    def update_links(self, src, dst):
+        """Rewrite links into src (a file or folder) to point at dst.
+        
+        Call before moving: referrers come from the backlink index and each
+        is written once, at its current path.
+        
+        Returns:
+            Workspace-relative paths of the rewritten referrers
+        """
+        plan = self.link_graph().plan_moves([(src, dst)])
+        rewrites = plan['rewrites']
+        if not rewrites:
+            return []
+        
+        links = sum(rewrite['links'] for rewrite in rewrites.values())
+        if self.dry_run:
+            self.log_action(f"  update {links} links in {len(rewrites)} files")
+            return []
+        
+        for referrer, rewrite in rewrites.items():
+            write_atomic(self.base / referrer, rewrite['content'])
+        self.log_action(f"  ✅ Updated {links} links in {len(rewrites)} files")
+        return list(rewrites)
+    
+    def track_move(self, src, dst, rewritten):
+        """Update the in-memory index after moving src to dst.
+        
+        Drops the moved files at their old paths, then re-parses them and
+        the rewritten referrers at their new paths.
+        """
+        graph = self.link_graph()
+        src, dst = graph.rel(src), graph.rel(dst)
+        
+        def new_path(rel_path):
+            if rel_path == src or rel_path.startswith(src + '/'):
+                return dst + rel_path[len(src):]
+            return rel_path
+        
+        moved = [rel_path for rel_path in graph.files if new_path(rel_path) != rel_path]
+        for rel_path in moved:
+            graph.remove_file(rel_path)
+        for rel_path in sorted({new_path(p) for p in moved + list(rewritten)}):
+            graph.update_file(rel_path)
+    
     def mv(self, src, dst):
-        """Move file or directory."""
+        """Move file or directory, updating links to it."""
         src_path = self.base / src
         dst_path = self.base / dst
         
@@ -44,10 +106,13 @@ class Restructure:
         
         if self.dry_run:
             self.log_action(f"mv {src} → {dst}")
+            self.update_links(src, dst)
         else:
+            rewritten = self.update_links(src, dst)
             # Ensure destination parent exists
             dst_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.move(str(src_path), str(dst_path))
+            self.track_move(src, dst, rewritten)
             self.log_action(f"✅ Moved {src} → {dst}")
     
     def flatten_meetings(self):
@@ -71,7 +136,10 @@ class Restructure:
                     if dest.exists():
                         # Add subdir prefix if name collision
                         dest = meetings_dir / f"{subdir}-{file.name}"
+                    src, dst = file.relative_to(self.base), dest.relative_to(self.base)
+                    rewritten = self.update_links(src, dst)
                     shutil.move(str(file), str(dest))
+                    self.track_move(src, dst, rewritten)
                     self.log_action(f"✅ Moved {file.name} to meetings/")
                 
                 # Remove empty subdirectory
@@ -159,6 +227,9 @@ class Restructure:
             self.log_action("Update README.md with new structure")
         print()
         
+        if self.graph is not None and not self.dry_run:
+            self.graph.save()
+        
         # Summary
         print("\n" + "="*60)
         print("SUMMARY")
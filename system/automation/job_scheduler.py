@@ -0,0 +1,505 @@
+"""
+Job Scheduler - one in-process scheduler for all workspace automation
+
+Replaces the separate cron/launchd entries (setup_automation.py,
+setup_weekly_summary.sh, setup_launchd_weekly_summary.sh) that each ran one
+script on its own. Jobs are declared with dependencies and optional
+cron-style triggers:
+
+    week        0 7 * * 1
+    summary     0 7 * * 1       after week
+    archive     0 17 * * 5
+    rollup      0 8 1 * *       after archive
+    ...
+
+When a trigger fires, the job runs together with every downstream job that
+has no trigger of its own. Running a job by hand runs its upstream
+dependencies first, like make. Jobs whose
+dependencies are all done run concurrently on a thread pool; a job whose
+dependency failed is skipped. Jobs that fire together and share state (week
+and summary both run bradan in this process) are ordered with 'after'.
+
+Jobs that need data only Cursor's MCP tools can fetch (Gemini docs, emails,
+Slack messages) read it from input files under inbox/, named per day, and are
+skipped until those files exist; a dependency skipped that way doesn't
+hold back the jobs after it. The daily file is not scheduled: the Good
+Morning workflow creates it with calendar events and meeting stubs, and a
+file pre-created by cron would stop that run early.
+
+Every run holds the workspace lock (workspace_lock.py), so a tick that
+overlaps a long archive (or a second scheduler) skips instead of racing it;
+manual and warm-server archive and week runs take the same lock. A tick
+that catches up on a missed trigger fills {today} and {monday} from the
+trigger time, so Friday's archive run late on Monday still archives Friday's
+week.
+Each job's duration and status go into a latency history
+(automation/job-history.json).
+
+A single crontab/launchd entry drives everything:
+
+    */5 * * * * cd <workspace> && python3 system/automation/bradan.py jobs tick
+
+or keep `bradan jobs serve` running. Jobs are bradan command lines by
+default; override or add them in automation/jobs.json:
+
+    {"inbox": {"cron": "30 8 * * 1-5"},
+     "rollup": null}
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_atomic
+from config import LOG_FILE, PROJECT_ROOT
+from workspace_lock import LOCK_NAME, WorkspaceLock
+
+JOBS_FILE = LOG_FILE.parent / "jobs.json"
+HISTORY_FILE = LOG_FILE.parent / "job-history.json"
+LOCK_FILE = LOG_FILE.parent / LOCK_NAME
+HISTORY_RUNS = 50        # Runs kept per job
+MAX_WORKERS = 4
+POLL_SECONDS = 30
+
+# Bradan command lines; {today} and {monday} are filled in from the trigger
+# time (or the start of the run, for jobs run by hand).
+# 'inputs' maps an option to a workspace-relative file passed with it; the
+# job is skipped while any of its input files is missing.
+DEFAULT_JOBS: Dict[str, Dict] = {
+    'link-notes': {'command': ['link-notes'], 'cron': '30 17 * * 1-5',
+                   'inputs': {'--docs': 'inbox/gemini-docs-{today}.json'}},
+    'inbox': {'command': ['inbox'], 'cron': '0 9 * * 1-5', 'after': ['link-notes'],
+              'inputs': {'--emails': 'inbox/emails-{today}.json', '--slack': 'inbox/slack-{today}.json'}},
+    'week': {'command': ['week', '{monday}'], 'cron': '0 7 * * 1'},
+    'summary': {'command': ['summary', '1'], 'cron': '0 7 * * 1', 'after': ['week']},
+    'archive': {'command': ['archive', '--week-start', '{monday}'], 'cron': '0 17 * * 5'},
+    'rollup': {'command': ['rollup'], 'cron': '0 8 1 * *', 'after': ['archive']},
+}
+
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week.
+
+    Fields accept *, numbers, ranges (1-5), lists (1,15) and steps (*/15,
+    0-30/10). Day of week is 0-6 from Sunday (7 is Sunday too). As in cron,
+    when both day fields are restricted a day matching either one fires.
+    """
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self.RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for part in field.split(','):
+            part, _, step = part.partition('/')
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-'))
+            else:
+                start = end = int(part)
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field out of range {low}-{high}: {field!r}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day:
+            return in_weekdays
+        if self.any_weekday:
+            return in_days
+        return in_days or in_weekdays
+
+    def matches(self, moment: datetime) -> bool:
+        return moment.minute in self.minutes and moment.hour in self.hours and self._day_matches(moment)
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        """First trigger time strictly after moment (None if there is none within 5 years)."""
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(366 * 5):
+            if self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        return None
+
+
+class Job:
+    """A named unit of work with dependencies and an optional cron trigger.
+
+    func is called with the run's moment: the trigger time for a scheduled
+    run, otherwise when the run started.
+    """
+
+    def __init__(self, name: str, func: Callable[[datetime], Optional[int]], after: Iterable[str] = (),
+                 cron: Optional[str] = None, description: str = '', inputs: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.after = list(after)
+        self.schedule = CronSchedule(cron) if cron else None
+        self.description = description
+        self.inputs = list(inputs)
+
+    def missing_inputs(self, moment: Optional[datetime] = None) -> List[str]:
+        """Input files (workspace-relative, placeholders filled in) that don't exist yet."""
+        values = _placeholders(moment)
+        paths = (path.format(**values) for path in self.inputs)
+        return [path for path in paths if not (PROJECT_ROOT / path).exists()]
+
+
+class JobHistory:
+    """Per-job run history (latency, status) plus the scheduler's last tick."""
+
+    def __init__(self, path: Path = HISTORY_FILE):
+        self.path = Path(path)
+        self.runs: Dict[str, List[Dict]] = {}
+        self.last_tick: Optional[str] = None
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self.runs = data.get('runs', {})
+                self.last_tick = data.get('last_tick')
+            except (ValueError, OSError):
+                pass
+
+    def record(self, name: str, started: datetime, duration_ms: float, status: str,
+               error: Optional[str] = None) -> None:
+        run = {'start': started.isoformat(timespec='seconds'), 'duration_ms': round(duration_ms, 1), 'status': status}
+        if error:
+            run['error'] = error
+        runs = self.runs.setdefault(name, [])
+        runs.append(run)
+        del runs[:-HISTORY_RUNS]
+
+    def latency(self, name: str) -> Dict[str, any]:
+        """Run count, failures and p50/p95/last duration of completed runs."""
+        runs = self.runs.get(name, [])
+        durations = sorted(run['duration_ms'] for run in runs if run['status'] in ('ok', 'failed'))
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not durations:
+                return None
+            return durations[min(len(durations) - 1, int(fraction * len(durations)))]
+
+        return {
+            'runs': len(runs),
+            'failures': sum(1 for run in runs if run['status'] == 'failed'),
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'last_ms': runs[-1]['duration_ms'] if runs else None,
+            'last_status': runs[-1]['status'] if runs else None,
+            'last_start': runs[-1]['start'] if runs else None,
+        }
+
+    def save(self) -> None:
+        write_atomic(self.path, json.dumps({'last_tick': self.last_tick, 'runs': self.runs}, indent=2))
+
+
+class JobScheduler:
+    """Runs a DAG of jobs concurrently under the workspace lock."""
+
+    def __init__(self, history: Optional[JobHistory] = None, lock: Optional[WorkspaceLock] = None,
+                 max_workers: int = MAX_WORKERS):
+        self.jobs: Dict[str, Job] = {}
+        self.history = history or JobHistory()
+        self.lock = lock or WorkspaceLock(LOCK_FILE)
+        self.max_workers = max_workers
+
+    def add(self, job: Job) -> Job:
+        self.jobs[job.name] = job
+        return job
+
+    def order(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """Topological order of the given jobs (default: all).
+
+        Raises:
+            ValueError: On an unknown job or dependency, or a cycle
+        """
+        selected = set(self.jobs if names is None else names)
+        for name in selected:
+            if name not in self.jobs:
+                raise ValueError(f"Unknown job: {name}")
+            for dependency in self.jobs[name].after:
+                if dependency not in self.jobs:
+                    raise ValueError(f"Job {name} depends on unknown job {dependency}")
+
+        pending = {name: {d for d in self.jobs[name].after if d in selected} for name in selected}
+        ordered = []
+        while pending:
+            ready = sorted(name for name, deps in pending.items() if not deps)
+            if not ready:
+                raise ValueError(f"Dependency cycle between jobs: {', '.join(sorted(pending))}")
+            for name in ready:
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+            ordered.extend(ready)
+        return ordered
+
+    def upstream(self, names: Iterable[str]) -> Set[str]:
+        """The jobs plus everything they depend on, transitively."""
+        found, stack = set(), list(names)
+        while stack:
+            name = stack.pop()
+            if name not in found:
+                if name not in self.jobs:
+                    raise ValueError(f"Unknown job: {name}")
+                found.add(name)
+                stack.extend(self.jobs[name].after)
+        return found
+
+    def downstream(self, names: Iterable[str]) -> Set[str]:
+        """The jobs plus their dependents that have no trigger of their own."""
+        found, stack = set(), list(names)
+        while stack:
+            name = stack.pop()
+            if name in found:
+                continue
+            found.add(name)
+            stack.extend(
+                job.name for job in self.jobs.values()
+                if name in job.after and job.schedule is None
+            )
+        return found
+
+    def due(self, since: datetime, now: datetime) -> Dict[str, datetime]:
+        """Jobs with a trigger time in (since, now], with their first such time."""
+        triggered = {}
+        for job in self.jobs.values():
+            next_run = job.schedule.next_after(since) if job.schedule else None
+            if next_run is not None and next_run <= now:
+                triggered[job.name] = next_run
+        return dict(sorted(triggered.items()))
+
+    def run(self, names: Iterable[str], with_dependencies: bool = True, blocking: bool = True,
+            moments: Optional[Dict[str, datetime]] = None) -> Dict[str, str]:
+        """Run jobs (and, by default, their upstream dependencies).
+
+        Dependencies outside the selected set count as satisfied.
+
+        Args:
+            moments: {job name: trigger time} for scheduled runs; other jobs
+                run as of now
+
+        Returns:
+            {job name: 'ok' | 'failed' | 'skipped'}, or {} if the lock was busy
+            and blocking is False
+
+        Raises:
+            ValueError: If no jobs are named, or on an unknown job
+        """
+        names = list(names)
+        if not names:
+            raise ValueError("No jobs named")
+        selected = self.upstream(names) if with_dependencies else set(names)
+        order = self.order(selected)
+        now = datetime.now()
+        moments = {name: (moments or {}).get(name, now) for name in order}
+        if not self.lock.acquire(blocking):
+            print("⏭️  Another run holds the workspace lock; skipping")
+            return {}
+        try:
+            return self._execute(order, moments)
+        finally:
+            self.history.save()
+            self.lock.release()
+
+    def _execute(self, order: List[str], moments: Dict[str, datetime]) -> Dict[str, str]:
+        status: Dict[str, str] = {}
+        no_input: Set[str] = set()  # Skipped for missing inputs: nothing to do, not a failure
+        waiting = list(order)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job') as pool:
+            while waiting or running:
+                for name in list(waiting):
+                    deps = [d for d in self.jobs[name].after if d in order and d not in no_input]
+                    if any(status.get(d) in ('failed', 'skipped') for d in deps):
+                        waiting.remove(name)
+                        status[name] = 'skipped'
+                        self.history.record(name, datetime.now(), 0.0, 'skipped', 'dependency did not succeed')
+                        print(f"⏭️  {name}: skipped (dependency did not succeed)")
+                    elif all(status.get(d) == 'ok' for d in deps):
+                        waiting.remove(name)
+                        missing = self.jobs[name].missing_inputs(moments[name])
+                        if missing:
+                            status[name] = 'skipped'
+                            no_input.add(name)
+                            reason = f"missing input {', '.join(missing)}"
+                            self.history.record(name, datetime.now(), 0.0, 'skipped', reason)
+                            print(f"⏭️  {name}: skipped ({reason})")
+                            continue
+                        print(f"▶️  {name}")
+                        running[pool.submit(self._run_job, self.jobs[name], moments[name])] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    started, duration_ms, error = future.result()
+                    status[name] = 'failed' if error else 'ok'
+                    self.history.record(name, started, duration_ms, status[name], error)
+                    if error:
+                        print(f"❌ {name}: {error} ({duration_ms:.0f} ms)")
+                    else:
+                        print(f"✅ {name} ({duration_ms:.0f} ms)")
+        return status
+
+    @staticmethod
+    def _run_job(job: Job, moment: datetime):
+        started = datetime.now()
+        start = time.perf_counter()
+        error = None
+        try:
+            code = job.func(moment)
+            if code:
+                error = f"exit code {code}"
+        except SystemExit as e:
+            if e.code:
+                error = f"exit code {e.code}"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return started, (time.perf_counter() - start) * 1000, error
+
+    def tick(self, now: Optional[datetime] = None) -> Dict[str, str]:
+        """Run whatever was triggered since the last tick, then record this one.
+
+        The first tick only records the time; later ones catch up once on
+        triggers missed while the machine was asleep. Each job runs as of its
+        trigger time (downstream jobs as of the trigger that pulled them in).
+        """
+        now = now or datetime.now()
+        since = datetime.fromisoformat(self.history.last_tick) if self.history.last_tick else now
+        triggered = self.due(since, now)
+        self.history.last_tick = now.isoformat(timespec='seconds')
+        if not triggered:
+            self.history.save()
+            return {}
+        print(f"⏰ {now:%Y-%m-%d %H:%M} triggered: {', '.join(triggered)}")
+
+        moments: Dict[str, datetime] = {}
+        for name, moment in sorted(triggered.items(), key=lambda item: item[1]):
+            for job_name in self.downstream([name]):
+                moments.setdefault(job_name, moment)
+        return self.run(moments, with_dependencies=False, blocking=False, moments=moments)
+
+    def serve(self, poll_seconds: int = POLL_SECONDS) -> None:
+        """Tick forever (Ctrl-C to stop)."""
+        print(f"🕒 Scheduler running {len(self.jobs)} jobs; Ctrl-C to stop")
+        try:
+            while True:
+                self.tick()
+                time.sleep(poll_seconds)
+        except KeyboardInterrupt:
+            print("\nScheduler stopped")
+
+
+def _placeholders(moment: Optional[datetime] = None) -> Dict[str, str]:
+    """Values for {today} and {monday} in job command lines and inputs, as of moment (default: now)."""
+    today = moment or datetime.now()
+    monday = today - timedelta(days=today.weekday())
+    return {'today': today.strftime('%Y-%m-%d'), 'monday': monday.strftime('%Y-%m-%d')}
+
+
+def command_job(name: str, command: List[str], after: Iterable[str] = (), cron: Optional[str] = None,
+                inputs: Optional[Dict[str, str]] = None) -> Job:
+    """A job that runs a bradan command line in this process.
+
+    Args:
+        inputs: {option: workspace-relative file}; each is appended to the
+            command line, and the job is skipped while a file is missing
+    """
+    inputs = inputs or {}
+
+    def run(moment: datetime) -> int:
+        import bradan
+
+        values = _placeholders(moment)
+        argv = [part.format(**values) for part in command]
+        for option, path in inputs.items():
+            argv += [option, str(PROJECT_ROOT / path.format(**values))]
+        return bradan.main(argv)
+
+    description = ' '.join(command + [f"{option} {path}" for option, path in inputs.items()])
+    return Job(name, run, after, cron, description=description, inputs=inputs.values())
+
+
+def load_jobs(jobs_file: Path = JOBS_FILE) -> Dict[str, Dict]:
+    """DEFAULT_JOBS merged with overrides from jobs.json (null removes a job)."""
+    jobs = {name: dict(spec) for name, spec in DEFAULT_JOBS.items()}
+    if jobs_file.exists():
+        for name, spec in json.loads(jobs_file.read_text()).items():
+            if spec is None:
+                jobs.pop(name, None)
+            else:
+                jobs[name] = {**jobs.get(name, {}), **spec}
+    return jobs
+
+
+def default_scheduler(jobs_file: Path = JOBS_FILE) -> JobScheduler:
+    """Scheduler with the workspace's bradan jobs, validated."""
+    scheduler = JobScheduler()
+    for name, spec in load_jobs(jobs_file).items():
+        scheduler.add(command_job(name, spec['command'], spec.get('after', ()), spec.get('cron'), spec.get('inputs')))
+    scheduler.order()
+    return scheduler
+
+
+def format_jobs(scheduler: JobScheduler) -> str:
+    """One line per job in dependency order, with its trigger and latency."""
+    lines = []
+    for name in scheduler.order():
+        job = scheduler.jobs[name]
+        trigger = job.schedule.expression if job.schedule else '-'
+        after = f" after {', '.join(job.after)}" if job.after else ''
+        stats = scheduler.history.latency(name)
+        latency = (f"p50 {stats['p50_ms']:.0f} ms, p95 {stats['p95_ms']:.0f} ms, {stats['runs']} runs"
+                   if stats['p50_ms'] is not None else 'never run')
+        lines.append(f"{name:12} {trigger:14} {job.description}{after}  [{latency}]")
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    scheduler = default_scheduler()
+    command = sys.argv[1] if len(sys.argv) > 1 else 'list'
+    if command == 'run':
+        if len(sys.argv) < 3:
+            print("❌ Name the jobs to run (see: job_scheduler.py list)")
+            sys.exit(2)
+        results = scheduler.run(sys.argv[2:])
+        sys.exit(1 if 'failed' in results.values() else 0)
+    elif command == 'tick':
+        scheduler.tick()
+    elif command == 'serve':
+        scheduler.serve()
+    else:
+        print(format_jobs(scheduler))
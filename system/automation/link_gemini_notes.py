@@ -12,10 +12,15 @@ Usage (via Cursor):
 
 import os
 import re
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_if_changed
+
 # Configuration
 MEETINGS_DIR = Path(__file__).parent.parent / "meetings"
 
@@ -197,9 +202,8 @@ class GeminiNotesLinker:
             # Append to end
             content += notes_section
         
-        # Write back
-        with open(stub_path, 'w') as f:
-            f.write(content)
+        # Write back (atomically, so an editor never sees a half-written stub)
+        write_if_changed(stub_path, content)
         
         return True
     
@@ -0,0 +1,539 @@
+"""
+Link Graph - backlink index for wiki links and meeting references
+
+Generated files link to each other in two ways:
+
+    [[archive/daily/2025-11-week-45/2025-11-05.md]]   wiki link (workspace-relative,
+    [[work/weeks/2025-11-10-week-46.md|Week 46]]      relative to the file, or a bare
+                                                      file name)
+    @meetings/2025-11-05-roadmap-sync.md              meeting reference (work/meetings/)
+
+The workspace is scanned once into a forward index (file -> links, stored in
+archive/link-graph.json with each file's mtime and size) and an in-memory
+reverse index (target -> files linking to it). refresh() then only re-reads
+files whose mtime or size changed, so "what links here" and "which links in
+this file are broken" are dictionary lookups instead of a grep over the tree.
+
+Links are resolved when their file is parsed, and re-resolved when a file
+they could point at (same name) is added or removed, so a broken link heals
+once its target appears. Archived files packed into month bundles
+(archive_bundles) are indexed too, and a link to a packed file is not
+broken.
+
+    graph = get_link_graph(workspace_root)
+    graph.linked_from('work/meetings/2025-11-05-roadmap-sync.md')
+    graph.broken_links()
+
+Before moving files, plan_moves() works out the new content of every file
+whose links the moves would break, reading only those files, so callers
+can write each one once alongside the moves.
+"""
+
+import json
+import os
+import posixpath
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import archive_bundles
+from atomic_write import write_if_changed
+
+GRAPH_NAME = "link-graph.json"
+GRAPH_VERSION = 1
+
+WIKI_LINK = re.compile(r'\[\[([^\[\]\n]+?)\]\]')
+MEETING_REF = re.compile(r'@meetings/([\w.-]+\.md)')
+MEETINGS_PREFIX = "work/meetings"
+SKIP_DIRS = {'__pycache__', 'node_modules'}
+
+
+def parse_links(content: str) -> List[Tuple[str, str]]:
+    """Raw links in a file, in order.
+
+    Returns:
+        (raw text, link target) pairs, e.g. ('[[a/b.md|B]]', 'a/b.md')
+        or ('@meetings/x.md', 'work/meetings/x.md'); the target is not resolved yet
+    """
+    links = []
+    for match in WIKI_LINK.finditer(content):
+        target = match.group(1).split('|', 1)[0].split('#', 1)[0].strip()
+        if target:
+            links.append((match.group(0), target))
+    for match in MEETING_REF.finditer(content):
+        links.append((match.group(0), f"{MEETINGS_PREFIX}/{match.group(1)}"))
+    return links
+
+
+def _link_name(target: str) -> str:
+    """File name a link target can resolve to, without '.md'.
+
+    Every way a target resolves (workspace root, linking folder, bare name)
+    ends in this name, so it keys the links a new or deleted file can affect.
+    """
+    name = posixpath.basename(target.rstrip('/'))
+    return name[:-3] if name.endswith('.md') else name
+
+
+def rewrite_link(raw: str, new_target: str) -> str:
+    """Link text pointing at new_target, keeping alias and heading.
+
+    Returns raw unchanged when it already resolves there: a meeting reference
+    to a file still in work/meetings/, a bare file name that still matches,
+    or a workspace-relative path. Anything else (a moved meeting, a path
+    relative to the linking file) becomes a workspace-relative wiki link.
+    """
+    name = posixpath.basename(new_target)
+    if raw.startswith('@meetings/'):
+        if new_target == f"{MEETINGS_PREFIX}/{name}":
+            return raw
+        return f"[[{new_target}]]"
+
+    inner = raw[2:-2]
+    cut = min([i for i in (inner.find('|'), inner.find('#')) if i >= 0] or [len(inner)])
+    target_text, suffix = inner[:cut], inner[cut:]
+    target = target_text.strip()
+    if '/' not in target.rstrip('/') and name in (target, target + '.md'):
+        return raw
+    direct = posixpath.normpath(target.lstrip('/'))
+    if new_target in (direct, direct + '.md'):
+        return raw
+    return f"[[{new_target}{'/' if target.endswith('/') else ''}{suffix}]]"
+
+
+class LinkGraph:
+    """Forward and reverse link index for the markdown files in a workspace."""
+
+    def __init__(self, workspace_root: Path):
+        """Load the stored index for a workspace (call refresh() to sync it).
+
+        Args:
+            workspace_root: Project root; the index lives in archive/
+        """
+        self.workspace_root = Path(workspace_root)
+        self.path = self.workspace_root / "archive" / GRAPH_NAME
+        self.files: Dict[str, Dict[str, any]] = {}
+        self.backlinks: Dict[str, Set[str]] = {}
+        self.by_name: Dict[str, Set[str]] = {}
+        self.by_link_name: Dict[str, Set[str]] = {}  # _link_name(target) -> files linking to it
+        self.mtime_ns = None
+        self._scanned: Set[str] = set()      # Files seen by the running refresh()
+        self._checked: Dict[str, bool] = {}  # Other targets looked up on disk during it
+        self.load()
+
+    def load(self) -> None:
+        """Read the index from disk (empty if missing, unreadable or outdated)."""
+        self.files = {}
+        self.mtime_ns = None
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get('version') == GRAPH_VERSION:
+                    self.files = data['files']
+                self.mtime_ns = os.stat(self.path).st_mtime_ns
+            except (ValueError, KeyError, OSError) as e:
+                print(f"⚠️  Link graph unreadable ({e}), rebuilding on refresh")
+                self.files = {}
+
+        self.backlinks = {}
+        self.by_name = {}
+        self.by_link_name = {}
+        for rel_path, entry in self.files.items():
+            self._index(rel_path, entry)
+
+    def is_stale(self) -> bool:
+        """True if the index file changed since it was loaded."""
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime_ns
+        except FileNotFoundError:
+            return self.mtime_ns is not None
+
+    def rel(self, path) -> str:
+        """Workspace-relative posix path for an absolute or relative path."""
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.workspace_root)
+        return posixpath.normpath(path.as_posix())
+
+    # -- scanning -----------------------------------------------------------
+
+    def _walk(self) -> Iterator[Tuple[str, int, int]]:
+        """(relative path, mtime_ns, size) of every loose markdown file."""
+        prefix = os.path.join(str(self.workspace_root), '')
+        stack = [str(self.workspace_root)]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    stat = entry.stat()
+                    yield entry.path[len(prefix):], stat.st_mtime_ns, stat.st_size
+
+    def _bundles(self) -> Dict[Path, Dict[str, int]]:
+        """Archive folders holding month bundles -> {bundle name: mtime_ns}."""
+        folders: Dict[Path, Dict[str, int]] = {}
+        archive_root = self.workspace_root / "archive"
+        if not archive_root.exists():
+            return folders
+        for folder in sorted(p for p in archive_root.iterdir() if p.is_dir()):
+            for bundle in sorted(folder.glob(f"*{archive_bundles.BUNDLE_SUFFIX}")):
+                folders.setdefault(folder, {})[bundle.name] = os.stat(bundle).st_mtime_ns
+        return folders
+
+    def refresh(self) -> Dict[str, int]:
+        """Re-parse files added or changed since the last refresh, drop deleted ones.
+
+        Returns:
+            Counts of 'added', 'updated' and 'removed' files
+        """
+        counts = {'added': 0, 'updated': 0, 'removed': 0}
+        seen = set()
+        changed = []
+
+        for rel_path, mtime_ns, size in self._walk():
+            seen.add(rel_path)
+            entry = self.files.get(rel_path)
+            if entry is None or entry.get('bundle') or entry['mtime_ns'] != mtime_ns or entry['size'] != size:
+                changed.append((rel_path, {'mtime_ns': mtime_ns, 'size': size}, entry is None))
+
+        # Files packed into month bundles are listed under their loose paths
+        for folder, bundles in self._bundles().items():
+            for member in archive_bundles.iter_archive_files(folder, "*.md"):
+                rel_path = self.rel(member)
+                month = archive_bundles.MONTH_PREFIX.match(member.parent.name)
+                if rel_path in seen or not month:
+                    continue
+                bundle_name = f"{month.group(1)}{archive_bundles.BUNDLE_SUFFIX}"
+                bundle_rel = self.rel(folder / bundle_name)
+                seen.add(rel_path)
+                entry = self.files.get(rel_path)
+                if entry is None or entry.get('bundle') != bundle_rel or entry['mtime_ns'] != bundles[bundle_name]:
+                    changed.append((rel_path, {'mtime_ns': bundles[bundle_name], 'size': 0, 'bundle': bundle_rel},
+                                    entry is None))
+
+        removed = [p for p in self.files if p not in seen]
+        for rel_path in removed:
+            self.remove_file(rel_path)
+            counts['removed'] += 1
+
+        self._scanned, self._checked = seen, {}
+
+        # Register every new name first so bare [[name.md]] links between new files resolve
+        for rel_path, _, is_new in changed:
+            if is_new:
+                self.by_name.setdefault(posixpath.basename(rel_path), set()).add(rel_path)
+        try:
+            for rel_path, stat, is_new in changed:
+                self._parse(rel_path, stat)
+                counts['added' if is_new else 'updated'] += 1
+            parsed = {rel_path for rel_path, _, _ in changed}
+            self._relink([p for p, _, is_new in changed if is_new] + removed, skip=parsed)
+        finally:
+            self._scanned, self._checked = set(), {}
+
+        return counts
+
+    def update_file(self, path) -> None:
+        """Re-parse one file now (after writing it), or drop it if it's gone."""
+        rel_path = self.rel(path)
+        is_new = rel_path not in self.files
+        try:
+            stat = os.stat(self.workspace_root / rel_path)
+        except FileNotFoundError:
+            if not is_new:
+                self.remove_file(rel_path)
+                self._relink([rel_path])
+            return
+        self._parse(rel_path, {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+        if is_new:
+            self._relink([rel_path], skip={rel_path})
+
+    def remove_file(self, path) -> None:
+        """Drop a file's outgoing links (links pointing at it are kept, now broken)."""
+        rel_path = self.rel(path)
+        entry = self.files.pop(rel_path, None)
+        if entry is None:
+            return
+        self._unindex(rel_path, entry)
+
+    def _parse(self, rel_path: str, stat: Dict[str, any]) -> None:
+        try:
+            if stat.get('bundle'):
+                content = archive_bundles.read_text(self.workspace_root / rel_path)
+            else:
+                with open(os.path.join(self.workspace_root, rel_path), encoding='utf-8') as f:
+                    content = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            self.remove_file(rel_path)
+            return
+
+        resolved: Dict[str, str] = {}
+        entry = dict(stat)
+        entry['links'] = []
+        for raw, target in parse_links(content):
+            if target not in resolved:
+                resolved[target] = self.resolve(target, rel_path)
+            entry['links'].append([raw, resolved[target]])
+        old = self.files.get(rel_path)
+        if old:
+            self._unindex(rel_path, old)
+        self.files[rel_path] = entry
+        self._index(rel_path, entry)
+
+    def _relink(self, paths: Iterable[str], skip: Set[str] = frozenset()) -> None:
+        """Re-resolve links in files that may point at added or removed paths.
+
+        Files in skip were just parsed and are already up to date.
+        """
+        referrers = set()
+        for rel_path in paths:
+            referrers.update(self.by_link_name.get(_link_name(rel_path), ()))
+
+        for referrer in sorted(referrers - skip):
+            entry = self.files.get(referrer)
+            if not entry:
+                continue
+            resolved: Dict[str, str] = {}
+            links = []
+            for raw, target in entry['links']:
+                if raw not in resolved:
+                    parsed = parse_links(raw)
+                    resolved[raw] = self.resolve(parsed[0][1], referrer) if parsed else target
+                links.append([raw, resolved[raw]])
+            if links != entry['links']:
+                self._unindex(referrer, entry)
+                entry['links'] = links
+                self._index(referrer, entry)
+
+    def _index(self, rel_path: str, entry: Dict[str, any]) -> None:
+        self.by_name.setdefault(posixpath.basename(rel_path), set()).add(rel_path)
+        for _, target in entry['links']:
+            self.backlinks.setdefault(target, set()).add(rel_path)
+            self.by_link_name.setdefault(_link_name(target), set()).add(rel_path)
+
+    def _unindex(self, rel_path: str, entry: Dict[str, any]) -> None:
+        names = self.by_name.get(posixpath.basename(rel_path))
+        if names:
+            names.discard(rel_path)
+        for _, target in entry['links']:
+            sources = self.backlinks.get(target)
+            if sources:
+                sources.discard(rel_path)
+                if not sources:
+                    del self.backlinks[target]
+            sources = self.by_link_name.get(_link_name(target))
+            if sources:
+                sources.discard(rel_path)
+                if not sources:
+                    del self.by_link_name[_link_name(target)]
+
+    # -- resolution and queries ---------------------------------------------
+
+    def exists(self, rel_path: str) -> bool:
+        """True if a link target exists (indexed, on disk, or in a bundle)."""
+        if rel_path in self.files or rel_path in self._scanned:
+            return True
+        if rel_path not in self._checked:
+            self._checked[rel_path] = archive_bundles.exists(self.workspace_root / rel_path)
+        return self._checked[rel_path]
+
+    def resolve(self, target: str, source: str) -> str:
+        """Workspace-relative path a link target points at.
+
+        Tries the workspace root, then the linking file's folder, then (for a
+        bare file name) any indexed file with that name. A target that
+        doesn't resolve is returned as a workspace-relative path, so it shows
+        up as broken.
+        """
+        target = target.lstrip('/')
+        direct = posixpath.normpath(target)
+        if self.exists(direct):
+            return direct
+
+        candidates = [direct, posixpath.normpath(posixpath.join(posixpath.dirname(source), target))]
+        if not posixpath.splitext(target)[1] and not target.endswith('/'):
+            candidates += [candidate + '.md' for candidate in candidates]
+
+        for candidate in candidates:
+            if not candidate.startswith('..') and self.exists(candidate):
+                return candidate
+
+        if '/' not in target.rstrip('/'):
+            for name in (target, target + '.md'):
+                matches = self.by_name.get(name)
+                if matches:
+                    return min(matches)
+        return candidates[0]
+
+    def links_from(self, path) -> List[Dict[str, str]]:
+        """Links in a file: [{'raw': ..., 'target': ...}]."""
+        entry = self.files.get(self.rel(path))
+        return [{'raw': raw, 'target': target} for raw, target in entry['links']] if entry else []
+
+    def linked_from(self, path) -> List[str]:
+        """Files that link to path ("what links here")."""
+        return sorted(self.backlinks.get(self.rel(path), ()))
+
+    def broken_links(self, path=None) -> List[Dict[str, str]]:
+        """Links whose target doesn't exist, in one file or across the workspace.
+
+        Returns:
+            [{'source': ..., 'raw': ..., 'target': ...}], sorted by source
+        """
+        sources = [self.rel(path)] if path is not None else sorted(self.files)
+        existing: Dict[str, bool] = {}
+        broken = []
+        for source in sources:
+            entry = self.files.get(source)
+            if not entry:
+                continue
+            for raw, target in entry['links']:
+                if target not in existing:
+                    existing[target] = self.exists(target)
+                if not existing[target]:
+                    broken.append({'source': source, 'raw': raw, 'target': target})
+        return broken
+
+    # -- moves --------------------------------------------------------------
+
+    def plan_moves(self, moves: Iterable[Tuple[Path, Path]]) -> Dict[str, any]:
+        """Link rewrites that keep links valid after moving files or folders.
+
+        Referrers come from the backlink index, so only files that link into
+        a moved path (plus moved files linking relative to their own folder)
+        are read. Each referrer gets one new content however many of its
+        links change. Nothing is written; refresh() picks up the moved and
+        rewritten files afterwards.
+
+        Args:
+            moves: (src, dst) pairs, absolute or workspace-relative; a src may
+                be a folder
+
+        Returns:
+            {'rewrites': {referrer at its current path: {'content': ..., 'links': n}},
+             'packed': referrers inside archive bundles, which can't be rewritten}
+        """
+        files_moved: Dict[str, str] = {}
+        dirs_moved: List[Tuple[str, str]] = []
+        for src, dst in moves:
+            src, dst = self.rel(src), self.rel(dst)
+            if (self.workspace_root / src).is_dir():
+                dirs_moved.append((src, dst))
+            else:
+                files_moved[src] = dst
+
+        def new_location(rel_path: str) -> Optional[str]:
+            if rel_path in files_moved:
+                return files_moved[rel_path]
+            for src_dir, dst_dir in dirs_moved:
+                if rel_path == src_dir or rel_path.startswith(src_dir + '/'):
+                    return dst_dir + rel_path[len(src_dir):]
+            return None
+
+        referrers: Set[str] = set()
+        for src in files_moved:
+            referrers.update(self.backlinks.get(src, ()))
+            referrers.add(src)
+        if dirs_moved:
+            for target, sources in self.backlinks.items():
+                if new_location(target):
+                    referrers.update(sources)
+            referrers.update(rel_path for rel_path in self.files if new_location(rel_path))
+
+        rewrites: Dict[str, Dict[str, any]] = {}
+        packed = []
+        for referrer in sorted(referrers):
+            entry = self.files.get(referrer)
+            if not entry:
+                continue
+            referrer_moves = new_location(referrer) is not None
+            replacements = {}
+            for raw, target in entry['links']:
+                moved_to = new_location(target)
+                if moved_to is None and not referrer_moves:
+                    continue
+                new_raw = rewrite_link(raw, moved_to or target)
+                if new_raw != raw:
+                    replacements[raw] = new_raw
+            if not replacements:
+                continue
+            if entry.get('bundle'):
+                packed.append(referrer)
+                continue
+
+            try:
+                with open(os.path.join(self.workspace_root, referrer), encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                continue
+            links = 0
+            for raw, new_raw in replacements.items():
+                links += content.count(raw)
+                content = content.replace(raw, new_raw)
+            if links:
+                rewrites[referrer] = {'content': content, 'links': links}
+
+        return {'rewrites': rewrites, 'packed': packed}
+
+    def to_json(self) -> str:
+        """Serialized index, as written by save()."""
+        return json.dumps({'version': GRAPH_VERSION, 'files': self.files}, indent=1, sort_keys=True)
+
+    def save(self) -> None:
+        """Write the index atomically (skipped if nothing changed)."""
+        write_if_changed(self.path, self.to_json())
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+
+
+_graphs: Dict[str, LinkGraph] = {}
+
+
+def get_link_graph(workspace_root: Path, refresh: bool = True) -> LinkGraph:
+    """Shared LinkGraph for a workspace, reloaded only if the file changed.
+
+    Args:
+        workspace_root: Project root
+        refresh: Sync with the files on disk first (and save if anything changed)
+    """
+    key = str(Path(workspace_root).resolve())
+    graph = _graphs.get(key)
+
+    if graph is None:
+        graph = LinkGraph(workspace_root)
+        _graphs[key] = graph
+    elif graph.is_stale():
+        graph.load()
+
+    if refresh and (any(graph.refresh().values()) or graph.mtime_ns is None):
+        graph.save()
+    return graph
+
+
+if __name__ == "__main__":
+    import sys
+
+    from config import PROJECT_ROOT
+
+    graph = get_link_graph(PROJECT_ROOT)
+    command = sys.argv[1] if len(sys.argv) > 1 else 'broken'
+    if command == 'backlinks' and len(sys.argv) > 2:
+        for source in graph.linked_from(sys.argv[2]):
+            print(source)
+    elif command == 'links' and len(sys.argv) > 2:
+        for link in graph.links_from(sys.argv[2]):
+            print(f"{link['raw']} -> {link['target']}")
+    else:
+        broken = graph.broken_links()
+        for link in broken:
+            print(f"{link['source']}: {link['raw']}")
+        print(f"\n🔗 {len(graph.files)} files indexed, {len(broken)} broken links")
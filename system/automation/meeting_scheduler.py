@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Meeting Reminder Scheduler
+
+Replaces polling should_send_meeting_reminder() over every meeting file with
+a min-heap of reminder deadlines built once from today's daily file.
+
+Each meeting referenced as ``@meetings/<file>.md`` in the daily file is
+parsed once. The scheduler then sleeps until the next deadline, and only
+re-reads a meeting file when its modification time changes (e.g. the time
+was edited). Reminders are built with
+SlackWorkflowIntegration.prepare_meeting_reminder() and queued in the Slack
+outbox, so reminders that come due together (and anything else queued
+meanwhile) go out as one digest.
+
+Usage:
+    python system/automation/meeting_scheduler.py [--daily work/daily/2025-11-10.md] [--minutes-before 15]
+"""
+
+import heapq
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from slack_outbox import SlackOutbox
+from slack_workflows import SlackWorkflowIntegration, get_todays_meetings, parse_meeting_start
+
+
+class MeetingReminderScheduler:
+    """Schedule pre-meeting reminders from a daily file's meeting references."""
+
+    def __init__(self,
+                 daily_file_path: Path,
+                 minutes_before: int = 15,
+                 on_reminder: Callable[[Dict], None] = None,
+                 recheck_seconds: int = 300,
+                 outbox: SlackOutbox = None):
+        """Initialize the scheduler.
+
+        Args:
+            daily_file_path: Path to today's daily file
+            minutes_before: Minutes before meeting start to send the reminder
+            on_reminder: Called with each Slack notification data dict
+                (defaults to printing it)
+            recheck_seconds: Longest sleep between cheap mtime checks, so
+                edits that move a meeting earlier are noticed
+            outbox: Queue reminders here; each wake-up then flushes it and
+                passes the coalesced digests to on_reminder
+        """
+        self.daily_file_path = Path(daily_file_path)
+        self.minutes_before = minutes_before
+        self.on_reminder = on_reminder or self._print_reminder
+        self.recheck_seconds = recheck_seconds
+        self.outbox = outbox
+        self.workflow = SlackWorkflowIntegration(outbox=outbox)
+
+        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', self.daily_file_path.name)
+        self.day = datetime.strptime(date_match.group(1), "%Y-%m-%d").date() if date_match else date.today()
+
+        self._heap = []  # (reminder_time, path, version)
+        self._meetings: Dict[str, Dict] = {}  # path -> {'mtime', 'start', 'version', 'sent'}
+        self._daily_mtime = None
+
+    def _mtime(self, path: Path) -> Optional[float]:
+        """File modification time, or None if the file is gone."""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def load(self) -> int:
+        """(Re)read the daily file's meeting references and schedule them.
+
+        Returns:
+            Number of meetings currently scheduled
+        """
+        self._daily_mtime = self._mtime(self.daily_file_path)
+
+        for meeting_path in get_todays_meetings(self.daily_file_path):
+            key = str(meeting_path)
+            if key not in self._meetings:
+                self._schedule(meeting_path)
+
+        return sum(1 for m in self._meetings.values() if m['start'] and not m['sent'])
+
+    def _schedule(self, meeting_path: Path) -> None:
+        """Parse one meeting file and push its reminder onto the heap."""
+        key = str(meeting_path)
+        previous = self._meetings.get(key, {})
+        mtime = self._mtime(meeting_path)
+
+        start = None
+        if mtime is not None:
+            try:
+                start = parse_meeting_start(meeting_path.read_text(encoding='utf-8'), default_date=self.day)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not parse {meeting_path.name}: {e}")
+
+        version = previous.get('version', 0) + 1
+        self._meetings[key] = {
+            'mtime': mtime,
+            'start': start,
+            'version': version,
+            'sent': previous.get('sent', False) and previous.get('start') == start,
+        }
+
+        if start and not self._meetings[key]['sent']:
+            reminder_time = start - timedelta(minutes=self.minutes_before)
+            heapq.heappush(self._heap, (reminder_time, key, version))
+
+    def _refresh_changed(self) -> None:
+        """Re-read the daily file and any meeting files whose mtime changed."""
+        if self._mtime(self.daily_file_path) != self._daily_mtime:
+            self.load()
+
+        for key, meeting in list(self._meetings.items()):
+            if self._mtime(Path(key)) != meeting['mtime']:
+                self._schedule(Path(key))
+
+    def _peek(self) -> Optional[tuple]:
+        """Next live heap entry, discarding entries superseded by a re-read."""
+        while self._heap:
+            reminder_time, key, version = self._heap[0]
+            meeting = self._meetings.get(key)
+            if meeting and meeting['version'] == version and not meeting['sent']:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def next_deadline(self) -> Optional[datetime]:
+        """When the next reminder is due, or None if nothing is left."""
+        entry = self._peek()
+        return entry[0] if entry else None
+
+    def pop_due(self, now: datetime = None) -> List[Dict]:
+        """Send every reminder whose deadline has passed.
+
+        Reminders for meetings that have already started are dropped.
+
+        Args:
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            List of Slack notification data dicts that were sent (or queued)
+        """
+        now = now or datetime.now()
+        sent = []
+
+        while True:
+            entry = self._peek()
+            if not entry or entry[0] > now:
+                break
+
+            heapq.heappop(self._heap)
+            _, key, _ = entry
+            meeting = self._meetings[key]
+            meeting['sent'] = True
+
+            if meeting['start'] <= now:
+                continue
+
+            notification = self.workflow.prepare_meeting_reminder(Path(key), self.minutes_before)
+            if notification:
+                if self.outbox is None:
+                    self.on_reminder(notification)
+                sent.append(notification)
+
+        if self.outbox is not None and sent:
+            for digest in self.outbox.flush(settle=False):
+                self.on_reminder(digest)
+
+        return sent
+
+    def run(self,
+            now: Callable[[], datetime] = datetime.now,
+            sleep: Callable[[float], None] = time.sleep) -> List[Dict]:
+        """Send reminders as they come due until none are left today.
+
+        Args:
+            now: Clock function (injectable for testing)
+            sleep: Sleep function (injectable for testing)
+
+        Returns:
+            List of all Slack notification data dicts sent
+        """
+        self.load()
+        sent = []
+
+        while True:
+            self._refresh_changed()
+            sent.extend(self.pop_due(now()))
+
+            deadline = self.next_deadline()
+            if deadline is None:
+                break
+
+            wait = (deadline - now()).total_seconds()
+            sleep(max(0.0, min(wait, self.recheck_seconds)))
+
+        return sent
+
+    def _print_reminder(self, notification: Dict) -> None:
+        """Default reminder handler."""
+        print(f"⏰ Reminder ready for {notification.get('recipient')}:")
+        print(notification.get('message', ''))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Send pre-meeting reminders for today's meetings")
+    parser.add_argument('--daily', help="Path to daily file (defaults to today's)")
+    parser.add_argument('--minutes-before', type=int, default=15, help='Minutes before meeting to remind')
+
+    args = parser.parse_args()
+
+    if args.daily:
+        daily_path = Path(args.daily)
+    else:
+        daily_path = Path(__file__).parent.parent.parent / "work" / "daily" / f"{date.today().strftime('%Y-%m-%d')}.md"
+
+    scheduler = MeetingReminderScheduler(daily_path, minutes_before=args.minutes_before, outbox=SlackOutbox())
+    count = scheduler.load()
+    print(f"📅 {count} meeting reminder(s) scheduled from {daily_path.name}")
+
+    scheduler.run()
+    print("✅ No more reminders today")
@@ -3,9 +3,14 @@ Priority Inbox Module
 Aggregates emails, Slack messages, and notifications into a prioritized one-screen summary.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any
-import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from slack_threads import ThreadIndex
 
 
 class PriorityInbox:
@@ -37,9 +42,15 @@ class PriorityInbox:
         'sign off', 'needs your input', 'waiting on you'
     ]
     
-    def __init__(self):
-        """Initialize the priority inbox."""
+    def __init__(self, user_id: str = None):
+        """Initialize the priority inbox.
+        
+        Args:
+            user_id: User's Slack ID, used to surface threads awaiting a reply
+        """
         self.items = []
+        self.thread_index = ThreadIndex(user_id)
+        self._thread_items = {}
     
     def add_emails(self, emails: List[Dict[str, Any]]) -> None:
         """
@@ -71,6 +82,9 @@ class PriorityInbox:
         """
         Add Slack messages to the priority inbox.
         
+        Replies to a thread already in the inbox are collapsed into that
+        thread's single entry instead of being added as separate items.
+        
         Args:
             messages: List of Slack message dicts with keys: channel, user, text, timestamp, thread_ts
         """
@@ -79,6 +93,12 @@ class PriorityInbox:
             if msg.get('bot_id'):
                 continue
             
+            thread_ts = self.thread_index.add_message(msg)
+            
+            if thread_ts and thread_ts in self._thread_items:
+                self._update_thread_item(self._thread_items[thread_ts], msg)
+                continue
+            
             item = {
                 'source': 'slack',
                 'from': msg.get('user_name', msg.get('user', 'Unknown')),
@@ -92,14 +112,46 @@ class PriorityInbox:
                 'raw_data': msg
             }
             
-            # Calculate priority
-            item['urgency'] = self._calculate_urgency(item)
-            item['impact'] = self._calculate_impact(item)
-            item['priority'] = self._calculate_priority(item['urgency'], item['impact'])
-            item['category'] = self._categorize_item(item)
+            self._score_item(item)
+            
+            if thread_ts:
+                item['thread_ts'] = thread_ts
+                self._thread_items[thread_ts] = item
             
             self.items.append(item)
     
+    def _update_thread_item(self, item: Dict[str, Any], msg: Dict[str, Any]) -> None:
+        """Fold a new thread message into the thread's existing inbox entry."""
+        thread = self.thread_index.get(item['thread_ts'])
+        
+        item['has_thread'] = True
+        item['reply_count'] = thread['reply_count']
+        item['participants'] = list(thread['participants'])
+        item['is_mention'] = item['is_mention'] or '@' in msg.get('text', '') or msg.get('is_mention', False)
+        
+        # Show the latest activity in the preview
+        if msg.get('ts', '') == thread['last_activity']:
+            item['from'] = msg.get('user_name', msg.get('user', 'Unknown'))
+            item['preview'] = msg.get('text', '')[:100]
+            item['timestamp'] = msg.get('ts', '')
+        
+        self._score_item(item)
+    
+    def _score_item(self, item: Dict[str, Any]) -> None:
+        """Calculate urgency, impact, priority and category for an item."""
+        item['urgency'] = self._calculate_urgency(item)
+        item['impact'] = self._calculate_impact(item)
+        item['priority'] = self._calculate_priority(item['urgency'], item['impact'])
+        item['category'] = self._categorize_item(item)
+    
+    def get_awaiting_threads(self) -> List[Dict[str, Any]]:
+        """Threads where someone else replied last and you are involved.
+        
+        Maintained incrementally by the thread index, so this does not
+        rescan any messages.
+        """
+        return self.thread_index.awaiting()
+    
     def _calculate_urgency(self, item: Dict[str, Any]) -> str:
         """
         Calculate urgency level: HIGH, MEDIUM, LOW.
@@ -251,6 +303,7 @@ class PriorityInbox:
             'high_priority': len([i for i in self.items if i['priority'] >= 7]),
             'needs_decision': len([i for i in self.items if 'Decision' in i['category']]),
             'has_mentions': len([i for i in self.items if i.get('is_mention')]),
+            'awaiting_reply': self.thread_index.awaiting_count(),
         }
         
         return {
@@ -259,7 +312,8 @@ class PriorityInbox:
             'p1': p1_items,
             'p2': p2_items,
             'p3': p3_items,
-            'p4': p4_items
+            'p4': p4_items,
+            'awaiting_threads': self.get_awaiting_threads()[:5]
         }
 
 
@@ -319,7 +373,7 @@ def format_one_screen_output(summary: Dict[str, Any]) -> str:
             if item.get('has_attachment'):
                 badges.append('📎')
             if item.get('has_thread'):
-                badges.append('💬thread')
+                badges.append(f"💬thread ({item['reply_count']})" if item.get('reply_count') else '💬thread')
             
             badge_str = f" [{', '.join(badges)}]" if badges else ""
             
@@ -333,6 +387,14 @@ def format_one_screen_output(summary: Dict[str, Any]) -> str:
             
             lines.append("")
     
+    # Threads waiting on you
+    if summary.get('awaiting_threads'):
+        lines.append("## ⏳ Threads Awaiting Your Reply")
+        for thread in summary['awaiting_threads']:
+            preview = thread['first_message'][:60].replace('\n', ' ')
+            lines.append(f"- 💬 **#{thread['channel']}** ({thread['reply_count']} replies, last: {thread['last_user']}): {preview}")
+        lines.append("")
+    
     # Action summary
     lines.append("---")
     lines.append("## ✅ Recommended Actions")
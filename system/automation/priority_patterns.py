@@ -0,0 +1,162 @@
+"""
+Priority Patterns - what you typically work on, learned week by week
+
+Each archived week's priorities (weighted by the days each was worked) are
+folded into per-category and per-keyword weights stored in
+``archive/priority-patterns.json``. Older weeks count for less: a week's
+weight halves every HALF_LIFE_WEEKS.
+
+Decay uses a fixed landmark (the first week folded): a week n weeks after
+the landmark adds its counts scaled by 2 ** (n / HALF_LIFE_WEEKS). Scaling
+every stored weight by the same factor doesn't change their ratios, so
+shares can be read directly without decaying anything, folding a week only
+touches that week's keywords, and weeks can be folded in any order:
+
+    patterns = get_priority_patterns(workspace_root)
+    patterns.fold_week('2025-11-03', [('Q3 SPIF review', 'Operational', 3)])
+    patterns.category_share('Operational')     # 0.0 - 1.0
+    patterns.keyword_share(['spif', 'review'])  # 0.0 - 1.0
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_if_changed
+from tfidf_index import tokenize
+
+PATTERNS_NAME = "priority-patterns.json"
+PATTERNS_VERSION = 1
+HALF_LIFE_WEEKS = 8
+
+
+class PriorityPatterns:
+    """Decayed per-category and per-keyword priority frequencies."""
+
+    def __init__(self, workspace_root: Path):
+        """Load the model for a workspace.
+
+        Args:
+            workspace_root: Project root; the model lives in archive/
+        """
+        self.workspace_root = Path(workspace_root)
+        self.path = self.workspace_root / "archive" / PATTERNS_NAME
+        self.load()
+
+    def _reset(self) -> None:
+        self.landmark = None
+        self.weeks: List[str] = []
+        self.categories: Dict[str, float] = {}
+        self.keywords: Dict[str, float] = {}
+        self.total = 0.0
+        self.keyword_total = 0.0
+
+    def load(self) -> None:
+        """Read the model from disk (empty if missing, unreadable or outdated)."""
+        self._reset()
+        self.mtime_ns = None
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            self.mtime_ns = os.stat(self.path).st_mtime_ns
+        except (ValueError, OSError) as e:
+            print(f"⚠️  Priority patterns unreadable ({e}), starting empty")
+            return
+        if data.get('version') != PATTERNS_VERSION:
+            return
+
+        self.landmark = data['landmark']
+        self.weeks = data['weeks']
+        self.categories = data['categories']
+        self.keywords = data['keywords']
+        self.total = data['total']
+        self.keyword_total = data['keyword_total']
+
+    def is_stale(self) -> bool:
+        """True if the model file changed since it was loaded."""
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime_ns
+        except FileNotFoundError:
+            return self.mtime_ns is not None
+
+    def fold_week(self, week_start: str, priorities: Iterable[Tuple[str, str, int]]) -> bool:
+        """Add one week's priorities to the model (each week is folded once).
+
+        Args:
+            week_start: Monday of the week ('YYYY-MM-DD')
+            priorities: (text, category, days worked) for each priority
+
+        Returns:
+            False if the week was already folded
+        """
+        if week_start in self.weeks:
+            return False
+        if self.landmark is None:
+            self.landmark = week_start
+
+        weeks_after = (datetime.strptime(week_start, '%Y-%m-%d')
+                       - datetime.strptime(self.landmark, '%Y-%m-%d')).days / 7
+        scale = 2 ** (weeks_after / HALF_LIFE_WEEKS)
+
+        for text, category, days in priorities:
+            weight = days * scale
+            self.categories[category] = self.categories.get(category, 0.0) + weight
+            self.total += weight
+            for token in set(tokenize(text)):
+                self.keywords[token] = self.keywords.get(token, 0.0) + weight
+                self.keyword_total += weight
+
+        self.weeks.append(week_start)
+        self.weeks.sort()
+        return True
+
+    def category_share(self, category: str) -> float:
+        """Decayed fraction of priority-days spent in a category."""
+        return self.categories.get(category, 0.0) / self.total if self.total else 0.0
+
+    def keyword_share(self, tokens: Iterable[str]) -> float:
+        """Decayed fraction of priority keyword weight carried by these tokens."""
+        if not self.keyword_total:
+            return 0.0
+        return sum(self.keywords.get(token, 0.0) for token in set(tokens)) / self.keyword_total
+
+    def to_json(self) -> str:
+        """Serialized model, as written by save()."""
+        return json.dumps({
+            'version': PATTERNS_VERSION,
+            'half_life_weeks': HALF_LIFE_WEEKS,
+            'landmark': self.landmark,
+            'weeks': self.weeks,
+            'categories': self.categories,
+            'keywords': self.keywords,
+            'total': self.total,
+            'keyword_total': self.keyword_total,
+        }, sort_keys=True)
+
+    def save(self) -> None:
+        """Write the model atomically (skipped if nothing changed)."""
+        write_if_changed(self.path, self.to_json())
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+
+
+_models: Dict[str, PriorityPatterns] = {}
+
+
+def get_priority_patterns(workspace_root: Path) -> PriorityPatterns:
+    """Shared PriorityPatterns for a workspace, reloaded only if the file changed."""
+    key = str(Path(workspace_root).resolve())
+    model = _models.get(key)
+
+    if model is None:
+        model = PriorityPatterns(workspace_root)
+        _models[key] = model
+    elif model.is_stale():
+        model.load()
+
+    return model
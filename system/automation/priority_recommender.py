@@ -7,18 +7,67 @@ Analyzes:
 - Decision logs (what needs closure)
 - Priority patterns (what you typically work on)
 - Action items (what's assigned to you)
+- Task lineage (how long each task has been carried)
+- Calendar (tasks whose related meeting is coming up soon)
 """
 
 import re
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Tuple
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_index import EventIndex
+from priority_patterns import PriorityPatterns, get_priority_patterns
+from task_lineage import TaskLineage
+from tfidf_index import TfidfIndex, tokenize
+
+# Minimum cosine similarity for an item to count as a related action
+RELATED_MIN_SCORE = 0.2
+
+# Share of past priority keyword weight a task must touch to be a recurring focus
+PATTERN_MIN_SHARE = 0.2
+
+
+def _keyword_regex(keywords) -> str:
+    """Regex matching any keyword, longest first, factored as a prefix trie.
+
+    Sharing prefixes ('a(?:ndre|sap|...)') means most positions in a task
+    are rejected after one character instead of one try per keyword.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+
+    return build(trie)
+
 
 class PriorityRecommender:
-    def __init__(self, base_dir: str = None):
+    def __init__(self, base_dir: str = None, lineage: TaskLineage = None,
+                 patterns: PriorityPatterns = None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent.parent
+        self._lineage = lineage  # Loaded on first use
+        self._patterns = patterns  # Loaded on first use
+        self._related_index = None  # TF-IDF index over this run's items
+        self._related_ids = {}
+        self._decision_ids = set()
+        self._event_index = None  # Interval index over this week's calendar
+        self._matcher = None  # Keyword regex and lookup tables, built on first use
+        self._scored_by_keywords: Dict[frozenset, Tuple[str, int, List[str]]] = {}
         
         # Strategic keywords for categorization
         self.strategic_keywords = [
@@ -34,6 +83,111 @@ class PriorityRecommender:
             'validation', 'technical', 'analysis', 'investigation'
         ]
     
+    def _keyword_classes(self) -> Dict[str, List[str]]:
+        """Every keyword list used for categorizing, boosting and explaining."""
+        return {
+            # Category keywords (score = number of distinct keywords present)
+            'strategic': self.strategic_keywords,
+            'stakeholder': self.stakeholder_keywords,
+            'operational': self.operational_keywords,
+            # Urgency and impact indicators
+            'urgent': ['urgent', 'asap', 'critical', 'blocked', 'waiting'],
+            'this_week': ['this week', 'monday', 'today'],
+            'decision': ['decision', 'approval', 'sign off', 'review'],
+            'team': ['team', 'se', 'leadership', 'regional'],
+            # Reasons shown in the "Why" line, in display order
+            'reason_urgent': ['urgent', 'asap'],
+            'reason_blocking': ['blocked', 'waiting'],
+            'reason_decision': ['approval', 'decision'],
+            'reason_team': ['team', 'leadership'],
+            'reason_stakeholder': ['andre', 'riley', 'olivia', 'deann'],
+            'reason_planning': ['2026', 'planning'],
+            'reason_craft': ['craft', 'improvement'],
+        }
+    
+    def _keyword_matcher(self) -> Tuple[re.Pattern, Dict[str, List[str]], Dict[str, Tuple[str, ...]]]:
+        """Compiled keyword regex plus keyword -> classes and match -> keywords maps.
+        
+        Built once per recommender, so per-task calls (categorize_task,
+        _explain_priority) don't rebuild the trie and the containment map.
+        Scores are cached per keyword set alongside it.
+        """
+        if self._matcher is None:
+            keyword_classes: Dict[str, List[str]] = {}
+            for name, keywords in self._keyword_classes().items():
+                for keyword in keywords:
+                    keyword_classes.setdefault(keyword, []).append(name)
+            
+            # The lookahead lets matches overlap, like `kw in task` does
+            pattern = re.compile('(?=(' + _keyword_regex(keyword_classes) + '))')
+            contained = {kw: tuple(other for other in keyword_classes if other in kw) for kw in keyword_classes}
+            self._matcher = (pattern, keyword_classes, contained)
+        return self._matcher
+    
+    def score_tasks(self, tasks: List[str]) -> List[Dict]:
+        """
+        Categorize, score and explain a batch of tasks in one pass.
+        
+        All keyword lists are compiled into one overlapping-match regex, so
+        each task is scanned once. Every match is mapped to the keywords it
+        contains (e.g. '2026 planning' -> '2026', 'planning', '2026 planning')
+        through a single dictionary. Tasks with the same set of keywords
+        share one score (kept across calls), so a large backlog costs one scan
+        per task plus one scoring per distinct keyword set.
+        
+        Returns:
+            One dict per task with 'task', 'category', 'score' (1-10) and 'reasons'
+        """
+        pattern, keyword_classes, contained = self._keyword_matcher()
+        
+        reason_labels = [
+            ('reason_urgent', "Marked as urgent"),
+            ('reason_blocking', "Blocking others"),
+            ('reason_decision', "Decision required"),
+            ('reason_team', "Team impact"),
+            ('reason_stakeholder', "Key stakeholder"),
+            ('reason_planning', "Strategic planning"),
+            ('reason_craft', "SE Craft advancement"),
+        ]
+        
+        scored_by_keywords = self._scored_by_keywords
+        results = []
+        
+        for task in tasks:
+            keywords = frozenset(kw for match in pattern.findall(task.lower()) for kw in contained[match])
+            
+            scored = scored_by_keywords.get(keywords)
+            if scored is None:
+                counts = Counter(name for kw in keywords for name in keyword_classes[kw])
+                
+                # Date words beat general urgency; team scope beats decision impact
+                urgency = 2 if counts['this_week'] else 3 if counts['urgent'] else 0
+                impact = 1 if counts['team'] else 2 if counts['decision'] else 0
+                
+                strategic, stakeholder, operational = counts['strategic'], counts['stakeholder'], counts['operational']
+                if strategic >= stakeholder and strategic >= operational:
+                    category, base_score = 'Strategic', 8  # Strategic is typically highest priority
+                elif stakeholder >= operational:
+                    category, base_score = 'Stakeholder', 7
+                else:
+                    category, base_score = 'Operational', 6
+                
+                reasons = [label for name, label in reason_labels if counts[name]]
+                scored = scored_by_keywords[keywords] = (
+                    category,
+                    min(base_score + urgency + impact, 10),  # Cap at 10
+                    reasons if reasons else ["Carry-forward from last week"]
+                )
+            
+            results.append({
+                'task': task,
+                'category': scored[0],
+                'score': scored[1],
+                'reasons': list(scored[2])
+            })
+        
+        return results
+    
     def categorize_task(self, task: str) -> Tuple[str, int]:
         """
         Categorize a task and assign priority score.
@@ -43,92 +197,163 @@ class PriorityRecommender:
             category: 'Strategic', 'Stakeholder', 'Operational'
             priority_score: 1-10 (higher = more important)
         """
-        task_lower = task.lower()
-        
-        # Check for urgency indicators
-        urgency_boost = 0
-        if any(word in task_lower for word in ['urgent', 'asap', 'critical', 'blocked', 'waiting']):
-            urgency_boost = 3
-        if any(word in task_lower for word in ['this week', 'monday', 'today']):
-            urgency_boost = 2
-        
-        # Check for impact indicators
-        impact_boost = 0
-        if any(word in task_lower for word in ['decision', 'approval', 'sign off', 'review']):
-            impact_boost = 2
-        if any(word in task_lower for word in ['team', 'se', 'leadership', 'regional']):
-            impact_boost = 1
-        
-        # Categorize
-        strategic_score = sum(1 for kw in self.strategic_keywords if kw in task_lower)
-        stakeholder_score = sum(1 for kw in self.stakeholder_keywords if kw in task_lower)
-        operational_score = sum(1 for kw in self.operational_keywords if kw in task_lower)
-        
-        if strategic_score >= stakeholder_score and strategic_score >= operational_score:
-            category = 'Strategic'
-            base_score = 8  # Strategic is typically highest priority
-        elif stakeholder_score >= operational_score:
-            category = 'Stakeholder'
-            base_score = 7
-        else:
-            category = 'Operational'
-            base_score = 6
+        scored = self.score_tasks([task])[0]
+        return scored['category'], scored['score']
+    
+    def get_lineage(self) -> TaskLineage:
+        """Task lineage graph for this workspace (built on first use)."""
+        if self._lineage is None:
+            self._lineage = TaskLineage(str(self.base_dir))
+        return self._lineage
+    
+    def carry_boost(self, task: str) -> Tuple[int, int]:
+        """
+        Score boost for chronically carried tasks.
+        
+        Returns:
+            (boost, carried_days): +1 after 3 days carried, +2 after 7
+        """
+        carried = self.get_lineage().carried_days(task)
+        if carried >= 7:
+            return 2, carried
+        if carried >= 3:
+            return 1, carried
+        return 0, carried
+    
+    def get_patterns(self) -> PriorityPatterns:
+        """Learned priority patterns for this workspace (loaded on first use)."""
+        if self._patterns is None:
+            self._patterns = get_priority_patterns(self.base_dir)
+        return self._patterns
+    
+    def pattern_affinity(self, task: str, category: str) -> Tuple[float, float]:
+        """
+        How much a task looks like what you've been prioritizing lately.
+        
+        Returns:
+            (keyword_share, category_share), both decayed fractions of past
+            priority-days; one dictionary lookup per task word
+        """
+        patterns = self.get_patterns()
+        return patterns.keyword_share(tokenize(task)), patterns.category_share(category)
+    
+    def index_calendar(self, calendar_events: List[Dict]) -> EventIndex:
+        """Build the interval index over this week's calendar events."""
+        self._event_index = EventIndex(calendar_events or [])
+        return self._event_index
+    
+    def extract_upcoming_meetings(self, week_start: datetime, calendar_events: List[Dict] = None) -> List[Dict]:
+        """
+        Meetings scheduled in the week starting week_start.
+        
+        Args:
+            week_start: Monday of the week
+            calendar_events: (Optional) Events to index; defaults to the
+                events passed to the last index_calendar() call
+        
+        Returns:
+            Normalized events (title, start, end, attendees, all_day), soonest first
+        """
+        if calendar_events is not None:
+            self.index_calendar(calendar_events)
+        if self._event_index is None:
+            return []
+        return self._event_index.between(week_start, week_start + timedelta(days=7))
+    
+    def meeting_boost(self, task: str, now: datetime) -> Tuple[int, Dict]:
+        """
+        Score boost for tasks tied to an upcoming meeting.
         
-        total_score = base_score + urgency_boost + impact_boost
+        A task is tied to a meeting when they share an attendee name or a
+        distinctive title word; the soonest such meeting is found with one
+        bisect per task word.
         
-        return category, min(total_score, 10)  # Cap at 10
+        Returns:
+            (boost, meeting): +2 if the meeting is within a day, +1 within
+            three days; meeting is None when nothing upcoming matches
+        """
+        if self._event_index is None:
+            return 0, None
+        meeting = self._event_index.next_related(tokenize(task), after=now)
+        if meeting is None:
+            return 0, None
+        lead = meeting['start'] - now
+        if lead <= timedelta(days=1):
+            return 2, meeting
+        if lead <= timedelta(days=3):
+            return 1, meeting
+        return 0, meeting
     
-    def extract_upcoming_meetings(self, week_start: datetime) -> List[Dict]:
-        """Extract meetings scheduled for this week (requires calendar data passed in)."""
-        # This would need calendar data passed from Cursor
-        # For now, return empty list - Claude will pass calendar data
-        return []
+    def decision_boost(self, task: str) -> Tuple[int, str]:
+        """
+        Score boost for tasks related to a pending decision.
+        
+        Returns:
+            (boost, decision): +1 and the closest pending decision, or (0, None)
+        """
+        if not self._decision_ids or self._related_index is None:
+            return 0, None
+        related = self._related_index.similar(task, k=3, min_score=RELATED_MIN_SCORE)
+        for doc_id, _ in related:
+            if doc_id in self._decision_ids and self._related_index.documents[doc_id] != task.strip():
+                return 1, self._related_index.documents[doc_id]
+        return 0, None
     
-    def analyze_carry_forwards(self, carry_forwards: List[str]) -> List[Dict]:
-        """Analyze and prioritize carry-forward tasks."""
+    def analyze_carry_forwards(self, carry_forwards: List[str], now: datetime = None) -> List[Dict]:
+        """Analyze and prioritize carry-forward tasks.
+        
+        Args:
+            carry_forwards: Incomplete tasks
+            now: Reference time for meeting proximity (defaults to now)
+        """
+        now = now or datetime.now()
         analyzed = []
         
-        for task in carry_forwards:
-            category, score = self.categorize_task(task)
+        for scored in self.score_tasks(carry_forwards):
+            task, category, score, reasons = scored['task'], scored['category'], scored['score'], scored['reasons']
+            
+            # Tasks that keep getting carried need a decision: do it or drop it
+            boost, carried = self.carry_boost(task)
+            if boost:
+                score = min(score + boost, 10)
+                reasons = [r for r in reasons if r != "Carry-forward from last week"]
+                reasons.insert(0, f"Carried for {carried} days")
+            
+            # Related meeting coming up: get it done before the meeting
+            boost, meeting = self.meeting_boost(task, now)
+            if boost:
+                score = min(score + boost, 10)
+                reasons.insert(0, f"Needed for {meeting['title']} ({meeting['start'].strftime('%a %H:%M')})")
+            
+            boost, decision = self.decision_boost(task)
+            if boost:
+                score = min(score + boost, 10)
+                reasons.append(f"Unblocks pending decision: {decision}")
+            
+            # Themes you keep prioritizing week after week
+            keyword_share, category_share = self.pattern_affinity(task, category)
+            if keyword_share >= PATTERN_MIN_SHARE:
+                score = min(score + 1, 10)
+                reasons.append("Recurring focus area")
             
             analyzed.append({
                 'task': task,
                 'category': category,
                 'score': score,
-                'reasons': self._explain_priority(task, category, score)
+                'carried_days': carried,
+                'meeting': meeting,
+                'pattern': keyword_share + category_share,
+                'reasons': reasons
             })
         
-        # Sort by score (highest first)
-        analyzed.sort(key=lambda x: x['score'], reverse=True)
+        # Sort by score (highest first); ties go to the usual focus areas
+        analyzed.sort(key=lambda x: (x['score'], x['pattern']), reverse=True)
         
         return analyzed
     
     def _explain_priority(self, task: str, category: str, score: int) -> List[str]:
         """Explain why this task has this priority."""
-        reasons = []
-        task_lower = task.lower()
-        
-        # Urgency reasons
-        if 'urgent' in task_lower or 'asap' in task_lower:
-            reasons.append("Marked as urgent")
-        if 'blocked' in task_lower or 'waiting' in task_lower:
-            reasons.append("Blocking others")
-        if 'approval' in task_lower or 'decision' in task_lower:
-            reasons.append("Decision required")
-        
-        # Impact reasons
-        if 'team' in task_lower or 'leadership' in task_lower:
-            reasons.append("Team impact")
-        if any(name in task_lower for name in ['andre', 'riley', 'olivia', 'deann']):
-            reasons.append("Key stakeholder")
-        
-        # Strategic reasons
-        if '2026' in task_lower or 'planning' in task_lower:
-            reasons.append("Strategic planning")
-        if 'craft' in task_lower or 'improvement' in task_lower:
-            reasons.append("SE Craft advancement")
-        
-        return reasons if reasons else ["Carry-forward from last week"]
+        return self.score_tasks([task])[0]['reasons']
     
     def group_by_category(self, analyzed_tasks: List[Dict]) -> Dict[str, List[Dict]]:
         """Group analyzed tasks by category."""
@@ -143,25 +368,61 @@ class PriorityRecommender:
         
         return groups
     
+    def build_related_index(
+        self,
+        carry_forwards: List[str],
+        meeting_actions: List[str] = None,
+        decision_titles: List[str] = None
+    ) -> None:
+        """
+        Index every item that can show up as a related action (once per run).
+        
+        Args:
+            carry_forwards: Incomplete tasks
+            meeting_actions: (Optional) Open action items from meetings
+            decision_titles: (Optional) Decisions awaiting closure
+        """
+        items = list(carry_forwards) + list(meeting_actions or []) + list(decision_titles or [])
+        cleaned = [re.sub(r'^\s*-\s*\[[ x]\]\s*', '', item).strip() for item in items]
+        unique = list(dict.fromkeys(item for item in cleaned if item))
+        
+        self._related_index = TfidfIndex(unique)
+        self._related_ids = {item: doc_id for doc_id, item in enumerate(unique)}
+        self._decision_ids = {
+            self._related_ids[title.strip()] for title in decision_titles or []
+            if title.strip() in self._related_ids
+        }
+    
     def recommend_top3(
         self, 
         carry_forwards: List[str],
         calendar_events: List[Dict] = None,
-        pending_decisions: List[str] = None
+        pending_decisions: List[str] = None,
+        meeting_actions: List[str] = None,
+        now: datetime = None
     ) -> List[Dict]:
         """
         Recommend Top 3 priorities for the week.
         
         Args:
             carry_forwards: Incomplete tasks from last week
-            calendar_events: (Optional) Meetings scheduled this week
-            pending_decisions: (Optional) Decisions that need closure
+            calendar_events: (Optional) Meetings scheduled this week; tasks
+                sharing an attendee or title word with a meeting in the next
+                three days are boosted
+            pending_decisions: (Optional) Decisions that need closure; tasks
+                related to one are boosted
+            meeting_actions: (Optional) Open meeting action items, searched
+                for related actions alongside carry-forwards and decisions
+            now: (Optional) Reference time for meeting proximity
         
         Returns:
             List of 3 recommended priorities with reasoning
         """
+        self.build_related_index(carry_forwards, meeting_actions, pending_decisions)
+        self.index_calendar(calendar_events)
+        
         # Analyze carry-forwards
-        analyzed = self.analyze_carry_forwards(carry_forwards)
+        analyzed = self.analyze_carry_forwards(carry_forwards, now)
         
         # Group by category
         grouped = self.group_by_category(analyzed)
@@ -261,22 +522,19 @@ class PriorityRecommender:
             return f"{reasons[0]}, {reasons[1].lower()}, and {reasons[2].lower()}"
     
     def _extract_actions(self, main_task: str, all_tasks: List[str]) -> List[str]:
-        """Extract related action items for a priority."""
-        actions = []
-        
-        # Try to find related tasks
-        main_keywords = set(re.findall(r'\b\w{4,}\b', main_task.lower()))
-        
-        for task in all_tasks[:10]:  # Check first 10 tasks
-            task_keywords = set(re.findall(r'\b\w{4,}\b', task.lower()))
-            
-            # If shares 2+ keywords, likely related
-            if len(main_keywords & task_keywords) >= 2:
-                clean_task = re.sub(r'^\s*-\s*\[[ x]\]\s*', '', task).strip()
-                if clean_task and clean_task != main_task:
-                    actions.append(clean_task)
-        
-        return actions[:5]  # Max 5 actions
+        """Extract related action items for a priority (top 5 by TF-IDF cosine similarity)."""
+        if self._related_index is None:
+            self.build_related_index(all_tasks)
+        
+        own_id = self._related_ids.get(main_task.strip())
+        related = self._related_index.similar(
+            main_task,
+            k=5,  # Max 5 actions
+            min_score=RELATED_MIN_SCORE,
+            exclude=[own_id] if own_id is not None else []
+        )
+        
+        return [self._related_index.documents[doc_id] for doc_id, _ in related]
     
     def format_recommendations(self, recommendations: List[Dict]) -> str:
         """Format recommendations as markdown."""
@@ -300,7 +558,9 @@ class PriorityRecommender:
 def recommend_priorities(
     carry_forwards: List[str],
     calendar_events: List[Dict] = None,
-    pending_decisions: List[str] = None
+    pending_decisions: List[str] = None,
+    meeting_actions: List[str] = None,
+    now: datetime = None
 ) -> List[Dict]:
     """
     Main function to get priority recommendations.
@@ -315,7 +575,9 @@ def recommend_priorities(
     return recommender.recommend_top3(
         carry_forwards=carry_forwards,
         calendar_events=calendar_events,
-        pending_decisions=pending_decisions
+        pending_decisions=pending_decisions,
+        meeting_actions=meeting_actions,
+        now=now
     )
 
 
@@ -0,0 +1,154 @@
+"""
+Profiling - cProfile + tracemalloc reports for one command run
+
+Runs a function with cProfile and tracemalloc on and with a stack sampler
+(SIGPROF, Unix only). It writes three files named after the command:
+
+    <name>-<timestamp>.txt        report: hot functions, top allocations, peak memory
+    <name>-<timestamp>.prof       raw cProfile stats (pstats / snakeviz)
+    <name>-<timestamp>.collapsed  sampled stacks, one "a;b;c count" line each,
+                                  ready for flamegraph.pl or speedscope
+
+    from profiling import profile_call
+    result, paths = profile_call('archive', archive_week_command, '2025-11-03')
+
+Every entry point accepts --profile (bradan --profile <command> for the rest).
+"""
+
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import LOG_FILE
+
+PROFILE_DIR = LOG_FILE.parent / "profiles"
+SAMPLE_INTERVAL = 0.002  # Seconds of CPU time between stack samples
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+
+
+class StackSampler:
+    """Counts the main thread's call stacks on a CPU-time timer (SIGPROF)."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.available = hasattr(signal, 'SIGPROF') and threading.current_thread() is threading.main_thread()
+        self._previous = None
+
+    def _sample(self, signum, frame) -> None:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(names))] += 1
+
+    def start(self) -> None:
+        if self.available:
+            self._previous = signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        if self.available:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    def collapsed(self) -> str:
+        """Folded stacks, hottest first."""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _stats_text(profiler: cProfile.Profile, sort: str) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(sort)
+    stats.print_stats(TOP_FUNCTIONS)
+    # Drop pstats' preamble; keep the table
+    text = stream.getvalue()
+    return text[text.find('   ncalls'):] if '   ncalls' in text else text
+
+
+def profile_call(name: str, func: Callable, *args, output_dir: Optional[Path] = None,
+                 **kwargs) -> Tuple[Any, Dict[str, Path]]:
+    """Run func(*args, **kwargs) under cProfile, tracemalloc and the stack sampler.
+
+    Args:
+        name: Command name, used in the report file names
+        func: Function to profile
+        output_dir: Where reports go (default: automation/profiles/)
+
+    Returns:
+        (func's return value, {'report': ..., 'stats': ..., 'collapsed': ...})
+    """
+    output_dir = Path(output_dir or PROFILE_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = output_dir / f"{name}-{datetime.now():%Y%m%d-%H%M%S}"
+
+    profiler = cProfile.Profile()
+    sampler = StackSampler()
+    tracing_memory = tracemalloc.is_tracing()
+    if not tracing_memory:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    sampler.start()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        sampler.stop()
+        elapsed = time.perf_counter() - start
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if not tracing_memory:
+            tracemalloc.stop()
+
+    paths = {
+        'report': stem.with_suffix('.txt'),
+        'stats': stem.with_suffix('.prof'),
+        'collapsed': stem.with_suffix('.collapsed'),
+    }
+
+    profiler.dump_stats(str(paths['stats']))
+    paths['collapsed'].write_text(sampler.collapsed())
+
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    allocations = snapshot.statistics('lineno')[:TOP_ALLOCATIONS]
+
+    report = f"# Profile: {name} ({datetime.now():%Y-%m-%d %H:%M:%S})\n\n"
+    report += f"Wall time:   {elapsed * 1000:.1f} ms\n"
+    report += f"Peak memory: {peak / 1024 / 1024:.2f} MB (traced Python allocations)\n"
+    if sampler.available:
+        report += f"Samples:     {sum(sampler.stacks.values())} every {SAMPLE_INTERVAL * 1000:.0f} ms CPU -> {paths['collapsed'].name}\n"
+    else:
+        report += "Samples:     stack sampling unavailable (needs SIGPROF on the main thread)\n"
+
+    report += f"\n## Top {TOP_FUNCTIONS} functions by cumulative time\n\n"
+    report += _stats_text(profiler, 'cumulative')
+    report += f"\n## Top {TOP_FUNCTIONS} functions by own time\n\n"
+    report += _stats_text(profiler, 'tottime')
+
+    report += f"\n## Top {TOP_ALLOCATIONS} allocation sites still live at exit\n\n"
+    for stat in allocations:
+        frame = stat.traceback[0]
+        report += f"{stat.size / 1024:10.1f} KB {stat.count:8d} blocks  {Path(frame.filename).name}:{frame.lineno}\n"
+
+    paths['report'].write_text(report)
+    print(f"📈 Profile ({elapsed * 1000:.0f} ms, peak {peak / 1024 / 1024:.1f} MB): {paths['report']}", file=sys.stderr)
+    return result, paths
@@ -0,0 +1,327 @@
+"""
+Rollup Generator - Monthly and quarterly reviews from cached weekly aggregates
+
+Each week is extracted with WeekExtractor once and its results are stored as
+a compact record in the week aggregate store (archive/week-aggregates.json,
+under the 'extracted' key). Month and quarter reviews are then composed
+from those records without re-reading the dailies:
+
+- completed / carried-forward task counts
+- meeting load (total and per week)
+- decision logs and meeting decisions
+- priority frequency across weeks
+
+Weeks still in progress are extracted fresh but not cached.
+"""
+
+import re
+import sys
+from calendar import monthrange
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_if_changed
+from week_aggregates import get_week_aggregates
+from week_extractor import WeekExtractor
+
+
+def week_aggregate_from_data(week_data: Dict) -> Dict[str, any]:
+    """Reduce WeekExtractor.generate_week_data() output to a compact record."""
+    priority_counts: Dict[str, int] = {}
+    for priority in week_data['priorities_worked']:
+        priority_counts[priority] = priority_counts.get(priority, 0) + 1
+
+    return {
+        'completed_tasks': week_data['completed_tasks'],
+        'incomplete_tasks': week_data['incomplete_tasks'],
+        'meeting_files': week_data['meeting_count'],
+        'meeting_decisions': sum(len(o['decisions']) for o in week_data['meeting_outcomes']),
+        'meeting_actions': sum(len(o['actions']) for o in week_data['meeting_outcomes']),
+        'decision_logs': week_data['decision_logs'],
+        'priority_counts': priority_counts,
+        'daily_files': len(week_data['files']['dailies']),
+        'extracted_at': datetime.now().strftime('%Y-%m-%d'),
+    }
+
+
+def month_of_week(week_start: datetime) -> str:
+    """Month ('YYYY-MM') a week belongs to: the month of its Thursday."""
+    return (week_start + timedelta(days=3)).strftime('%Y-%m')
+
+
+class RollupGenerator:
+    """Compose month and quarter views from per-week aggregates."""
+
+    def __init__(self, base_dir: str = None):
+        if base_dir:
+            self.base_dir = Path(base_dir)
+        else:
+            # Default to project root (two levels up from system/automation/)
+            self.base_dir = Path(__file__).parent.parent.parent
+
+        self.extractor = WeekExtractor(str(self.base_dir))
+        self.store = get_week_aggregates(self.base_dir)
+        self.template_path = self.base_dir / "system" / "templates" / "monthly.md"
+        self.reviews_dir = self.base_dir / "work" / "reviews"
+        self.weeks_dir = self.base_dir / "work" / "weeks"
+        self._dirty = False
+
+    def week_record(self, week_start: datetime, refresh: bool = False) -> Dict[str, any]:
+        """Aggregate for one week, extracting (and caching) it on first use."""
+        key = week_start.strftime('%Y-%m-%d')
+        cached = self.store.get(key)
+        if cached and 'extracted' in cached and not refresh:
+            return cached['extracted']
+
+        record = week_aggregate_from_data(self.extractor.generate_week_data(week_start))
+
+        # Only finished weeks are cached; a running week keeps changing
+        if week_start + timedelta(days=7) <= datetime.now():
+            self.store.put(key, {'extracted': record})
+            self._dirty = True
+        return record
+
+    def weeks_in_month(self, year: int, month: int) -> List[datetime]:
+        """Mondays of the weeks that belong to a month (by their Thursday)."""
+        first = datetime(year, month, 1)
+        monday = first - timedelta(days=first.weekday())
+        target = f"{year:04d}-{month:02d}"
+
+        weeks = []
+        while monday <= datetime(year, month, monthrange(year, month)[1]):
+            if month_of_week(monday) == target:
+                weeks.append(monday)
+            monday += timedelta(days=7)
+        return weeks
+
+    def rollup(self, weeks: List[datetime], refresh: bool = False) -> Dict[str, any]:
+        """Combine the aggregates of the given weeks into one view."""
+        self._dirty = False
+        records = [(week, self.week_record(week, refresh)) for week in weeks]
+        if self._dirty:
+            self.store.save()
+
+        priority_counts: Dict[str, int] = {}
+        priority_weeks: Dict[str, int] = {}
+        decision_logs = {}
+        completed = []
+
+        for _, record in records:
+            for priority, count in record['priority_counts'].items():
+                priority_counts[priority] = priority_counts.get(priority, 0) + count
+                priority_weeks[priority] = priority_weeks.get(priority, 0) + 1
+            for decision in record['decision_logs']:
+                decision_logs[decision['file']] = decision
+            completed.extend(record['completed_tasks'])
+
+        completed_count = sum(len(r['completed_tasks']) for _, r in records)
+        # Carry-forward is what was still open in the last week with dailies
+        worked = [r for _, r in records if r['daily_files']]
+        carried = worked[-1]['incomplete_tasks'] if worked else []
+        meetings = sum(r['meeting_files'] for _, r in records)
+
+        return {
+            'weeks': [
+                {
+                    'week_start': week.strftime('%Y-%m-%d'),
+                    'completed': len(record['completed_tasks']),
+                    'carried': len(record['incomplete_tasks']),
+                    'meetings': record['meeting_files'],
+                }
+                for week, record in records
+            ],
+            'completed_count': completed_count,
+            'completed_tasks': completed,
+            'carry_forward': carried,
+            'meeting_count': meetings,
+            'meetings_per_week': round(meetings / len(records), 1) if records else 0,
+            'meeting_decisions': sum(r['meeting_decisions'] for _, r in records),
+            'meeting_actions': sum(r['meeting_actions'] for _, r in records),
+            'decision_logs': list(decision_logs.values()),
+            'priorities': sorted(
+                ({'priority': p, 'days': priority_counts[p], 'weeks': priority_weeks[p]} for p in priority_counts),
+                key=lambda item: (-item['weeks'], -item['days'])
+            ),
+        }
+
+    def month_rollup(self, year: int, month: int, refresh: bool = False) -> Dict[str, any]:
+        """Rollup for a calendar month."""
+        data = self.rollup(self.weeks_in_month(year, month), refresh)
+        data['period'] = f"{year:04d}-{month:02d}"
+        return data
+
+    def quarter_rollup(self, year: int, quarter: int, refresh: bool = False) -> Dict[str, any]:
+        """Rollup for a quarter, with one nested rollup per month."""
+        months = [self.month_rollup(year, month, refresh) for month in range(quarter * 3 - 2, quarter * 3 + 1)]
+        weeks = [datetime.strptime(w['week_start'], '%Y-%m-%d') for m in months for w in m['weeks']]
+
+        data = self.rollup(weeks)
+        data['period'] = f"{year:04d}-Q{quarter}"
+        data['months'] = months
+        return data
+
+    def _week_review_link(self, week_start: str) -> str:
+        """Link to a week's file in work/weeks (either naming generator's)."""
+        monday = datetime.strptime(week_start, '%Y-%m-%d')
+        week_num = monday.isocalendar()[1]
+        for name in (f"{week_start}-week-{week_num:02d}.md", f"{week_start}-week-{week_num}.md"):
+            if (self.weeks_dir / name).exists():
+                return f"[[work/weeks/{name}]]"
+        return f"[[work/weeks/{week_start}-week-{week_num:02d}.md]]"
+
+    def _numbers_section(self, data: Dict) -> str:
+        """Auto-populated numbers shared by month and quarter reviews."""
+        total_tasks = data['completed_count'] + len(data['carry_forward'])
+        completion = round(100 * data['completed_count'] / total_tasks) if total_tasks else 0
+
+        section = "### Completion Metrics\n"
+        section += f"- **Weeks:** {len(data['weeks'])} weeks\n"
+        section += f"- **Total meetings:** {data['meeting_count']} meetings ({data['meetings_per_week']}/week)\n"
+        section += f"- **Tasks completed:** {data['completed_count']} ({completion}% of tasks seen)\n"
+        section += f"- **Carried forward:** {len(data['carry_forward'])} open at period end\n"
+        section += f"- **Meeting decisions / actions:** {data['meeting_decisions']} / {data['meeting_actions']}\n"
+        section += f"- **Decision logs:** {len(data['decision_logs'])}\n\n"
+
+        section += "### Week by Week\n"
+        section += "| Week | Completed | Carried | Meetings |\n|---|---|---|---|\n"
+        for week in data['weeks']:
+            section += f"| {self._week_review_link(week['week_start'])} | {week['completed']} | {week['carried']} | {week['meetings']} |\n"
+        section += "\n"
+
+        if data['priorities']:
+            section += "### Priority Frequency\n"
+            for item in data['priorities'][:10]:
+                section += f"- {item['priority']} — {item['weeks']} week(s), {item['days']} day(s)\n"
+            section += "\n"
+
+        if data['decision_logs']:
+            section += "### Decisions Logged\n"
+            for decision in data['decision_logs']:
+                section += f"- [[{decision['file']}]] {decision['title']} ({decision['status']})\n"
+            section += "\n"
+
+        return section
+
+    def render_month(self, data: Dict, year: int, month: int) -> str:
+        """Fill the monthly review template with a month rollup."""
+        template = self.template_path.read_text() if self.template_path.exists() else "# Monthly Review - [MONTH] [YEAR]\n\n## 📊 Month in Numbers\n\n---\n"
+
+        last_day = datetime(year, month, monthrange(year, month)[1])
+        next_month = last_day + timedelta(days=1)
+
+        content = template.replace("[MONTH]", last_day.strftime('%B'))
+        content = content.replace("[LAST_DAY_OF_MONTH]", last_day.strftime('%Y-%m-%d'))
+        content = content.replace("[NEXT_MONTH]", next_month.strftime('%B'))
+        content = content.replace("Q[Q]", f"Q{(month - 1) // 3 + 1}")
+        content = content.replace("[YEAR]", str(year))
+
+        # Swap the placeholder metrics for the computed ones
+        numbers = self._numbers_section(data)
+        content, replaced = re.subn(r'### Completion Metrics\n.*?\n\n', lambda _: numbers, content, count=1, flags=re.DOTALL)
+        if not replaced:
+            content = content.replace("## 📊 Month in Numbers\n", "## 📊 Month in Numbers\n\n" + numbers, 1)
+
+        if data['carry_forward']:
+            carry = "**From this month:**\n" + "".join(f"- [ ] {task}\n" for task in data['carry_forward'])
+            content = re.sub(r'\*\*From this month:\*\*\n(?:- .*\n)*', lambda _: carry, content, count=1)
+
+        return content
+
+    def render_quarter(self, data: Dict, year: int, quarter: int) -> str:
+        """Quarter review: quarter totals plus one numbers block per month."""
+        content = f"# Quarterly Review - Q{quarter} {year}\n\n"
+        content += f"**Generated:** {datetime.now().strftime('%Y-%m-%d')}  \n"
+        content += "*Auto-generated from weekly aggregates*\n\n---\n\n"
+        content += "## 📊 Quarter in Numbers\n\n" + self._numbers_section(data) + "---\n\n"
+
+        for month in data['months']:
+            label = datetime.strptime(month['period'], '%Y-%m').strftime('%B')
+            content += f"## {label}\n\n"
+            content += f"- **Completed:** {month['completed_count']}  \n"
+            content += f"- **Meetings:** {month['meeting_count']}  \n"
+            top = ", ".join(item['priority'] for item in month['priorities'][:3]) or "—"
+            content += f"- **Top priorities:** {top}\n"
+            content += f"- **Review:** [[work/reviews/monthly/{month['period']}-monthly-review.md]]\n\n"
+
+        if data['carry_forward']:
+            content += "## Carry Forward\n\n"
+            content += "".join(f"- [ ] {task}\n" for task in data['carry_forward'])
+
+        return content
+
+
+def generate_month_rollup(month_str: str, base_dir: str = None, refresh: bool = False) -> dict:
+    """
+    Generate a monthly review from cached weekly aggregates.
+
+    Args:
+        month_str: Month in YYYY-MM format
+        base_dir: Base directory (optional)
+        refresh: Re-extract weeks even if they are cached
+
+    Returns:
+        dict with file_path and data
+    """
+    year, month = (int(part) for part in month_str.split('-'))
+    generator = RollupGenerator(base_dir)
+    data = generator.month_rollup(year, month, refresh)
+
+    out_dir = generator.reviews_dir / "monthly"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    filepath = out_dir / f"{month_str}-monthly-review.md"
+    write_if_changed(filepath, generator.render_month(data, year, month))
+
+    return {'file_path': str(filepath), 'period': data['period'], 'data': data}
+
+
+def generate_quarter_rollup(quarter_str: str, base_dir: str = None, refresh: bool = False) -> dict:
+    """
+    Generate a quarterly review from cached weekly aggregates.
+
+    Args:
+        quarter_str: Quarter in YYYY-QN format (e.g. 2025-Q4)
+        base_dir: Base directory (optional)
+        refresh: Re-extract weeks even if they are cached
+
+    Returns:
+        dict with file_path and data
+    """
+    year_str, quarter_part = quarter_str.upper().split('-Q')
+    year, quarter = int(year_str), int(quarter_part)
+    generator = RollupGenerator(base_dir)
+    data = generator.quarter_rollup(year, quarter, refresh)
+
+    out_dir = generator.reviews_dir / "quarterly"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    filepath = out_dir / f"{year}-Q{quarter}-quarterly-review.md"
+    write_if_changed(filepath, generator.render_quarter(data, year, quarter))
+
+    return {'file_path': str(filepath), 'period': data['period'], 'data': data}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate monthly or quarterly rollups')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--month', help='Month to roll up (YYYY-MM, default: last month)')
+    group.add_argument('--quarter', help='Quarter to roll up (YYYY-QN, e.g. 2025-Q4)')
+    parser.add_argument('--refresh', action='store_true', help='Re-extract weeks instead of using cached aggregates')
+
+    args = parser.parse_args()
+
+    if args.quarter:
+        result = generate_quarter_rollup(args.quarter, refresh=args.refresh)
+    else:
+        month = args.month or (datetime.now().replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+        result = generate_month_rollup(month, refresh=args.refresh)
+
+    data = result['data']
+    print(f"\n✅ Generated: {result['file_path']}")
+    print(f"📅 Period: {result['period']} ({len(data['weeks'])} weeks)")
+    print(f"  - {data['completed_count']} completed tasks")
+    print(f"  - {data['meeting_count']} meetings")
+    print(f"  - {len(data['decision_logs'])} decision logs")
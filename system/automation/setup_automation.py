@@ -7,21 +7,24 @@ from pathlib import Path
 import subprocess
 
 def setup_cron_job():
-    """Set up cron job for daily file generation."""
+    """Set up the cron job that drives the job scheduler."""
     
     project_root = Path(__file__).parent.parent
-    script_path = project_root / "automation" / "daily_generator.py"
+    script_path = project_root / "automation" / "bradan.py"
     python_path = sys.executable
     
-    # Create cron job command
-    cron_command = f"0 7 * * * cd {project_root} && {python_path} {script_path} >> {project_root}/automation/cron.log 2>&1"
+    # One entry for every job: the scheduler decides what is due (see job_scheduler.py)
+    cron_command = f"*/5 * * * * cd {project_root.parent} && {python_path} {script_path} jobs tick >> {project_root}/automation/cron.log 2>&1"
     
-    print("To set up daily automation, add the following line to your crontab:")
+    print("To set up automation, add the following line to your crontab:")
     print("Run: crontab -e")
     print("Add this line:")
     print(f"  {cron_command}")
     print()
-    print("This will run the daily file generator every day at 7:00 AM")
+    print("Every 5 minutes this runs whatever scheduled jobs are due")
+    print("(week file and meeting summary on Mondays; archive on Fridays;")
+    print("Gemini notes and inbox on weekdays once their inbox/ files exist).")
+    print("See them with: bradan jobs list")
     print("Logs will be written to automation/cron.log")
     
     # Ask if user wants to add it automatically
@@ -36,7 +39,7 @@ def setup_cron_job():
                 current_crontab = ""
             
             # Add our job if it's not already there
-            if "daily_generator.py" not in current_crontab:
+            if "jobs tick" not in current_crontab:
                 new_crontab = current_crontab + "\n" + cron_command + "\n"
                 
                 # Write new crontab
@@ -1,5 +1,7 @@
 #!/bin/bash
 # Setup launchd (macOS native scheduler) for weekly meeting summary
+# The job scheduler (bradan jobs, see job_scheduler.py) now runs the summary
+# on Mondays alongside the other jobs; use this only for a standalone setup.
 
 echo "🚀 Setting up Weekly Summary with launchd (macOS)"
 echo "================================================="
@@ -8,9 +8,81 @@ to enhance weekly summaries and daily planning.
 Designed to be called from Cursor/Claude environment where MCP is available.
 """
 
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Iterable, Iterator, Tuple, Union
+import json
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from slack_threads import ThreadIndex
+from slack_timestamps import format_slack_ts, group_by_period
+
+
+# Combined pattern sets - one alternation per result kind so each message is
+# scanned once per kind instead of once per phrase.
+COMMITMENT_PATTERN = re.compile(
+    r"I'?ll\s+(.+?)(?:\.|$|\n)"
+    r"|I will\s+(.+?)(?:\.|$|\n)"
+    r"|I can\s+(.+?)(?:\.|$|\n)"
+    r"|Let me\s+(.+?)(?:\.|$|\n)"
+    r"|I'm going to\s+(.+?)(?:\.|$|\n)"
+    r"|I'?m planning to\s+(.+?)(?:\.|$|\n)",
+    re.IGNORECASE
+)
+
+REQUEST_PATTERN = re.compile(
+    r"(?:could|can)\s+you\s+(.+?)(?:\?|$|\n)"
+    r"|(?:would|will)\s+you\s+(.+?)(?:\?|$|\n)"
+    r"|please\s+(.+?)(?:\.|$|\n)",
+    re.IGNORECASE
+)
+
+DECISION_PATTERN = re.compile(
+    r"(?:we'?ve|we have)?\s*decided\s+(?:to\s+)?(.+?)(?:\.|$|\n)"
+    r"|decision:\s*(.+?)(?:\.|$|\n)"
+    r"|we'?ll go with\s+(.+?)(?:\.|$|\n)"
+    r"|the plan is\s+(?:to\s+)?(.+?)(?:\.|$|\n)"
+    r"|we agreed\s+(?:to\s+)?(.+?)(?:\.|$|\n)",
+    re.IGNORECASE
+)
+
+
+def iter_export_messages(source: Union[str, Path]) -> Iterator[Dict]:
+    """Stream Slack messages from an export on disk.
+    
+    Supports two layouts:
+    - A JSONL file with one message dict per line
+    - A workspace export directory with one folder per channel holding
+      daily ``YYYY-MM-DD.json`` files (each a JSON array of messages)
+    
+    Only one line or one day file is held in memory at a time.
+    
+    Args:
+        source: Path to a .jsonl file or an export directory
+        
+    Yields:
+        Slack message dicts (with 'channel' filled in from the folder name
+        when the export omits it)
+    """
+    source = Path(source)
+    
+    if source.is_file():
+        with open(source, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        return
+    
+    for channel_dir in sorted(p for p in source.iterdir() if p.is_dir()):
+        for day_file in sorted(channel_dir.glob("????-??-??.json")):
+            with open(day_file, 'r', encoding='utf-8') as f:
+                day_messages = json.load(f)
+            for message in day_messages:
+                message.setdefault('channel', channel_dir.name)
+                yield message
 
 
 class SlackContextExtractor:
@@ -42,41 +114,8 @@ class SlackContextExtractor:
         """
         commitments = []
         
-        # Commitment patterns
-        patterns = [
-            r"I'?ll\s+(.+?)(?:\.|$|\n)",
-            r"I will\s+(.+?)(?:\.|$|\n)",
-            r"I can\s+(.+?)(?:\.|$|\n)",
-            r"Let me\s+(.+?)(?:\.|$|\n)",
-            r"I'm going to\s+(.+?)(?:\.|$|\n)",
-            r"I'?m planning to\s+(.+?)(?:\.|$|\n)",
-        ]
-        
         for message in messages:
-            text = message.get('text', '')
-            if not text:
-                continue
-            
-            # Check each pattern
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    commitment_text = match.group(1).strip()
-                    
-                    # Clean up the commitment text
-                    commitment_text = self._clean_commitment_text(commitment_text)
-                    
-                    # Skip if it's too short or looks like a question
-                    if len(commitment_text) < 10 or commitment_text.endswith('?'):
-                        continue
-                    
-                    commitments.append({
-                        'text': commitment_text,
-                        'channel': message.get('channel', 'Unknown'),
-                        'timestamp': message.get('ts', ''),
-                        'permalink': message.get('permalink', ''),
-                        'date': self._format_timestamp(message.get('ts', ''))
-                    })
+            commitments.extend(self._commitments_in(message))
         
         return commitments
     
@@ -95,42 +134,7 @@ class SlackContextExtractor:
         mentions = []
         
         for message in messages:
-            text = message.get('text', '')
-            
-            # Check for user mention
-            if user_id and f"<@{user_id}>" in text:
-                mentions.append({
-                    'text': text,
-                    'type': 'mention',
-                    'from': message.get('user', 'Unknown'),
-                    'channel': message.get('channel', 'Unknown'),
-                    'timestamp': message.get('ts', ''),
-                    'permalink': message.get('permalink', ''),
-                    'date': self._format_timestamp(message.get('ts', ''))
-                })
-            
-            # Check for request patterns (Could you..., Can you..., Please...)
-            request_patterns = [
-                r"(?:could|can)\s+you\s+(.+?)(?:\?|$|\n)",
-                r"(?:would|will)\s+you\s+(.+?)(?:\?|$|\n)",
-                r"please\s+(.+?)(?:\.|$|\n)",
-            ]
-            
-            for pattern in request_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    request_text = match.group(1).strip()
-                    if len(request_text) > 10:
-                        mentions.append({
-                            'text': request_text,
-                            'type': 'request',
-                            'from': message.get('user', 'Unknown'),
-                            'channel': message.get('channel', 'Unknown'),
-                            'timestamp': message.get('ts', ''),
-                            'permalink': message.get('permalink', ''),
-                            'date': self._format_timestamp(message.get('ts', ''))
-                        })
-                    break
+            mentions.extend(self._mentions_in(message, user_id))
         
         return mentions
     
@@ -151,33 +155,8 @@ class SlackContextExtractor:
         """
         decisions = []
         
-        decision_patterns = [
-            r"(?:we'?ve|we have)?\s*decided\s+(?:to\s+)?(.+?)(?:\.|$|\n)",
-            r"decision:\s*(.+?)(?:\.|$|\n)",
-            r"we'?ll go with\s+(.+?)(?:\.|$|\n)",
-            r"the plan is\s+(?:to\s+)?(.+?)(?:\.|$|\n)",
-            r"we agreed\s+(?:to\s+)?(.+?)(?:\.|$|\n)",
-        ]
-        
         for message in messages:
-            text = message.get('text', '')
-            
-            for pattern in decision_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    decision_text = match.group(1).strip()
-                    
-                    # Clean up
-                    decision_text = self._clean_commitment_text(decision_text)
-                    
-                    if len(decision_text) > 10:
-                        decisions.append({
-                            'text': decision_text,
-                            'channel': message.get('channel', 'Unknown'),
-                            'timestamp': message.get('ts', ''),
-                            'permalink': message.get('permalink', ''),
-                            'date': self._format_timestamp(message.get('ts', ''))
-                        })
+            decisions.extend(self._decisions_in(message))
         
         return decisions
     
@@ -200,6 +179,22 @@ class SlackContextExtractor:
         
         return grouped
     
+    def group_by_period(self,
+                        items: List[Dict],
+                        period: str = 'day',
+                        by_channel: bool = False) -> Dict[object, List[Dict]]:
+        """Group items by day or week (and optionally channel).
+        
+        Args:
+            items: List of items with 'timestamp' key
+            period: 'day' or 'week'
+            by_channel: If True, keys are (period_key, channel) tuples
+            
+        Returns:
+            Dictionary mapping 'YYYY-MM-DD' keys (or tuples) to items
+        """
+        return group_by_period(items, period, by_channel)
+    
     def get_active_threads(self, messages: List[Dict]) -> List[Dict[str, str]]:
         """Identify active threads from messages.
         
@@ -209,28 +204,141 @@ class SlackContextExtractor:
         Returns:
             List of active thread summaries
         """
-        threads = {}
+        index = ThreadIndex()
+        index.add_messages(messages)
+        return index.active_threads()
+    
+    def stream_context(self,
+                       messages: Iterable[Dict],
+                       user_name: str = "Eamon",
+                       user_id: str = None) -> Iterator[Tuple[str, Dict]]:
+        """Extract all four result kinds in a single pass over messages.
+        
+        Unlike the list-based extract_* methods, this accepts any iterable
+        (e.g. iter_export_messages()) and never materializes the message
+        list, so memory stays flat on very large exports. Only per-thread
+        counts, participants and the last ts (see ThreadIndex) are retained
+        until the end of the stream; reply text is not kept.
+        
+        Args:
+            messages: Iterable of Slack message dicts
+            user_name: User's name for context
+            user_id: User's Slack ID (e.g., 'U12345')
+            
+        Yields:
+            (kind, item) tuples where kind is 'commitment', 'mention',
+            'decision' or 'thread'. Threads are yielded after the last message.
+        """
+        index = ThreadIndex(user_id, keep_replies=False)
         
         for message in messages:
-            thread_ts = message.get('thread_ts')
-            if thread_ts:
-                if thread_ts not in threads:
-                    threads[thread_ts] = {
-                        'count': 0,
-                        'channel': message.get('channel', 'Unknown'),
-                        'first_message': message.get('text', '')[:100],
-                        'timestamp': thread_ts,
-                        'permalink': message.get('permalink', '')
-                    }
-                threads[thread_ts]['count'] += 1
-        
-        # Return threads with multiple messages
-        active_threads = [
-            thread for thread in threads.values() 
-            if thread['count'] > 1
-        ]
-        
-        return active_threads
+            for commitment in self._commitments_in(message):
+                yield 'commitment', commitment
+            for mention in self._mentions_in(message, user_id):
+                yield 'mention', mention
+            for decision in self._decisions_in(message):
+                yield 'decision', decision
+            index.add_message(message)
+        
+        for thread in index.active_threads():
+            yield 'thread', thread
+    
+    def _commitments_in(self, message: Dict) -> List[Dict[str, str]]:
+        """Extract commitments from a single message."""
+        text = message.get('text', '')
+        if not text:
+            return []
+        
+        commitments = []
+        for match in COMMITMENT_PATTERN.finditer(text):
+            commitment_text = self._clean_commitment_text(match.group(match.lastindex).strip())
+            
+            # Skip if it's too short or looks like a question
+            if len(commitment_text) < 10 or commitment_text.endswith('?'):
+                continue
+            
+            commitments.append(self._message_item(message, commitment_text))
+        
+        return commitments
+    
+    def _mentions_in(self, message: Dict, user_id: str = None) -> List[Dict[str, str]]:
+        """Extract mentions and requests from a single message."""
+        text = message.get('text', '')
+        mentions = []
+        
+        # Check for user mention
+        if user_id and f"<@{user_id}>" in text:
+            mention = self._message_item(message, text)
+            mention['type'] = 'mention'
+            mention['from'] = message.get('user', 'Unknown')
+            mentions.append(mention)
+        
+        # Check for request patterns (Could you..., Can you..., Please...)
+        match = REQUEST_PATTERN.search(text)
+        if match:
+            request_text = match.group(match.lastindex).strip()
+            if len(request_text) > 10:
+                request = self._message_item(message, request_text)
+                request['type'] = 'request'
+                request['from'] = message.get('user', 'Unknown')
+                mentions.append(request)
+        
+        return mentions
+    
+    def _decisions_in(self, message: Dict) -> List[Dict[str, str]]:
+        """Extract decisions from a single message."""
+        text = message.get('text', '')
+        if not text:
+            return []
+        
+        decisions = []
+        for match in DECISION_PATTERN.finditer(text):
+            decision_text = self._clean_commitment_text(match.group(match.lastindex).strip())
+            
+            if len(decision_text) > 10:
+                decisions.append(self._message_item(message, decision_text))
+        
+        return decisions
+    
+    def _message_item(self, message: Dict, text: str) -> Dict[str, str]:
+        """Build a result dict carrying the message's channel/link metadata."""
+        ts = message.get('ts', '')
+        return {
+            'text': text,
+            'channel': message.get('channel', 'Unknown'),
+            'timestamp': ts,
+            'permalink': message.get('permalink', ''),
+            'date': self._format_timestamp(ts),
+            'thread_ts': message.get('thread_ts', '')
+        }
+    
+    def collapse_threads(self, items: List[Dict]) -> List[Dict]:
+        """Collapse items from the same thread into one entry.
+        
+        Keeps the most recent item per thread and records how many were
+        folded into it as 'thread_items'. Items outside threads pass through.
+        
+        Args:
+            items: List of items with optional 'thread_ts' key
+            
+        Returns:
+            List with at most one item per thread, in original order
+        """
+        latest = {}
+        counts = {}
+        
+        for position, item in enumerate(items):
+            key = item.get('thread_ts') or f"message-{position}"
+            latest[key] = (position, item)
+            counts[key] = counts.get(key, 0) + 1
+        
+        collapsed = []
+        for key, (position, item) in sorted(latest.items(), key=lambda kv: kv[1][0]):
+            if counts[key] > 1:
+                item = dict(item, thread_items=counts[key])
+            collapsed.append(item)
+        
+        return collapsed
     
     def _clean_commitment_text(self, text: str) -> str:
         """Clean up commitment text.
@@ -263,12 +371,7 @@ class SlackContextExtractor:
         Returns:
             Formatted date string
         """
-        try:
-            timestamp = float(ts.split('.')[0])
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime('%B %d, %Y')
-        except:
-            return 'Unknown date'
+        return format_slack_ts(ts)
     
     def format_slack_context_for_summary(self,
                                          commitments: List[Dict],
@@ -306,9 +409,12 @@ class SlackContextExtractor:
         
         if mentions:
             md += f"### Requests & Mentions\n\n"
-            for mention in mentions[:5]:  # Limit to top 5
+            for mention in self.collapse_threads(mentions)[:5]:  # Limit to top 5
                 md += f"- **{mention.get('from', 'Someone')}** in {mention.get('channel', 'Unknown')}: "
-                md += f"{mention['text'][:100]}\n"
+                md += f"{mention['text'][:100]}"
+                if mention.get('thread_items'):
+                    md += f" _(+{mention['thread_items'] - 1} more in thread)_"
+                md += "\n"
         
         if decisions:
             md += f"\n### Key Decisions from Slack\n\n"
@@ -320,7 +426,10 @@ class SlackContextExtractor:
             md += f"\n### Active Threads ({len(threads)})\n\n"
             for thread in threads[:3]:  # Limit to top 3
                 md += f"- **{thread.get('channel', 'Unknown')}**: {thread['first_message']}\n"
-                md += f"  _{thread['count']} replies_\n\n"
+                md += f"  _{thread['count']} replies"
+                if thread.get('participants'):
+                    md += f" • {len(thread['participants'])} participants"
+                md += "_\n\n"
         
         return md
 
@@ -341,11 +450,38 @@ def extract_slack_context(messages: List[Dict],
         Dictionary with all extracted context
     """
     extractor = SlackContextExtractor()
+    return _collect_context(extractor, extractor.stream_context(messages, user_name, user_id))
+
+
+def extract_slack_context_from_export(source: Union[str, Path],
+                                      user_name: str = "Eamon",
+                                      user_id: str = None) -> Dict[str, any]:
+    """Extract all Slack context from an export on disk in one streaming pass.
+    
+    Args:
+        source: Path to a .jsonl file or a workspace export directory
+        user_name: User's name for context
+        user_id: User's Slack ID
+        
+    Returns:
+        Dictionary with all extracted context (same shape as extract_slack_context)
+    """
+    extractor = SlackContextExtractor()
+    stream = extractor.stream_context(iter_export_messages(source), user_name, user_id)
+    return _collect_context(extractor, stream)
+
+
+def _collect_context(extractor: SlackContextExtractor,
+                     stream: Iterable[Tuple[str, Dict]]) -> Dict[str, any]:
+    """Gather a stream_context() result stream into the summary dict."""
+    results = {'commitment': [], 'mention': [], 'decision': [], 'thread': []}
+    for kind, item in stream:
+        results[kind].append(item)
     
-    commitments = extractor.extract_commitments_from_messages(messages, user_name)
-    mentions = extractor.extract_mentions_and_requests(messages, user_id)
-    decisions = extractor.extract_decisions(messages)
-    threads = extractor.get_active_threads(messages)
+    commitments = results['commitment']
+    mentions = results['mention']
+    decisions = results['decision']
+    threads = results['thread']
     
     return {
         'commitments': commitments,
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Slack Export Ingestion
+
+Reads a standard Slack workspace export zip (one folder per channel holding
+daily ``YYYY-MM-DD.json`` files) directly, without extracting it to disk.
+Exports zipped with a top-level folder (``export/general/2025-11-05.json``)
+read the same as flat ones.
+
+A per-channel high-water mark of the newest ``ts`` seen is kept in a small
+JSON cursor file, so repeat runs only parse days at or after the last cursor
+and only yield messages newer than it.
+
+Usage:
+    from slack_export import ingest_slack_export
+    from priority_inbox import PriorityInbox
+
+    inbox = PriorityInbox()
+    result = ingest_slack_export('~/Downloads/acme-slack-export.zip', inbox=inbox)
+"""
+
+import json
+import re
+import sys
+import zipfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from slack_context_extractor import SlackContextExtractor
+
+DAY_FILE = re.compile(r'^\d{4}-\d{2}-\d{2}\.json$')
+
+
+class SlackExportReader:
+    """Stream messages out of a Slack export zip with incremental cursors."""
+
+    def __init__(self, zip_path: str, cursor_path: str = None):
+        """Initialize the reader.
+
+        Args:
+            zip_path: Path to the Slack workspace export zip
+            cursor_path: Path to the JSON cursor file (defaults to
+                '<zip name>.cursors.json' next to the zip)
+        """
+        self.zip_path = Path(zip_path).expanduser()
+        if cursor_path:
+            self.cursor_path = Path(cursor_path).expanduser()
+        else:
+            self.cursor_path = self.zip_path.with_name(self.zip_path.name + ".cursors.json")
+        self.cursors = self._load_cursors()
+
+    def _load_cursors(self) -> Dict[str, str]:
+        """Load per-channel high-water marks from disk."""
+        if not self.cursor_path.exists():
+            return {}
+
+        try:
+            return json.loads(self.cursor_path.read_text())
+        except (ValueError, OSError) as e:
+            print(f"⚠️  Could not read cursor file {self.cursor_path}: {e}")
+            return {}
+
+    def save_cursors(self) -> None:
+        """Persist per-channel high-water marks."""
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cursor_path.write_text(json.dumps(self.cursors, indent=2, sort_keys=True))
+
+    def _day_files(self, archive: zipfile.ZipFile) -> Dict[str, List[str]]:
+        """Map channel folder name to its sorted daily JSON member names.
+
+        Channels are keyed on the last two path components, so any folder the
+        export was zipped inside is ignored.
+        """
+        by_channel = {}
+
+        for name in archive.namelist():
+            parts = name.split('/')
+            if len(parts) < 2 or parts[0] == '__MACOSX' or not DAY_FILE.match(parts[-1]):
+                continue
+            by_channel.setdefault(parts[-2], []).append(name)
+
+        for names in by_channel.values():
+            names.sort()
+
+        return by_channel
+
+    def _load_users(self, archive: zipfile.ZipFile) -> Dict[str, str]:
+        """Map Slack user IDs to display names from users.json."""
+        candidates = [
+            name for name in archive.namelist()
+            if name.rsplit('/', 1)[-1] == 'users.json' and not name.startswith('__MACOSX/')
+        ]
+        if not candidates:
+            return {}
+        users = json.loads(archive.read(min(candidates, key=len)))
+
+        names = {}
+        for user in users:
+            profile = user.get('profile', {})
+            names[user.get('id')] = (profile.get('display_name')
+                                     or profile.get('real_name')
+                                     or user.get('name', 'Unknown'))
+        return names
+
+    def _first_day_to_read(self, channel: str) -> Optional[str]:
+        """Earliest day file worth opening for a channel, or None for all.
+
+        Day files are named in the workspace's local time while cursors are
+        epoch seconds, so back off one day to avoid skipping a late-evening
+        message that landed in the previous file.
+        """
+        cursor = self.cursors.get(channel)
+        if not cursor:
+            return None
+
+        cursor_day = datetime.fromtimestamp(float(cursor), tz=timezone.utc).date()
+        return (cursor_day - timedelta(days=1)).strftime('%Y-%m-%d')
+
+    def channels(self) -> List[str]:
+        """List channel folder names in the export."""
+        with zipfile.ZipFile(self.zip_path) as archive:
+            return sorted(self._day_files(archive))
+
+    def iter_messages(self, channels: List[str] = None) -> Iterator[Dict]:
+        """Yield messages newer than each channel's cursor.
+
+        Cursors are advanced in memory as messages are yielded; call
+        save_cursors() once the caller has finished processing them.
+
+        Args:
+            channels: Optional subset of channel names to read
+
+        Yields:
+            Slack message dicts with 'channel', 'channel_name' and
+            'user_name' filled in
+        """
+        for batch in self.iter_batches(channels):
+            yield from batch
+
+    def iter_batches(self, channels: List[str] = None) -> Iterator[List[Dict]]:
+        """Like iter_messages(), but yield each day file's new messages as one list.
+
+        A day file is parsed whole anyway, so batching costs no extra memory
+        and lets consumers such as PriorityInbox take a file at a time.
+        """
+        with zipfile.ZipFile(self.zip_path) as archive:
+            users = self._load_users(archive)
+
+            for channel, day_names in sorted(self._day_files(archive).items()):
+                if channels and channel not in channels:
+                    continue
+
+                first_day = self._first_day_to_read(channel)
+                cursor = float(self.cursors.get(channel, 0))
+                high_water = self.cursors.get(channel)
+
+                for day_name in day_names:
+                    day = day_name.rsplit('/', 1)[1][:-len('.json')]
+                    if first_day and day < first_day:
+                        continue
+
+                    batch = []
+                    for message in json.loads(archive.read(day_name)):
+                        ts = message.get('ts', '')
+                        if not ts or float(ts) <= cursor:
+                            continue
+
+                        message.setdefault('channel', channel)
+                        message.setdefault('channel_name', channel)
+                        if 'user_name' not in message and message.get('user') in users:
+                            message['user_name'] = users[message['user']]
+
+                        if high_water is None or float(ts) > float(high_water):
+                            high_water = ts
+
+                        batch.append(message)
+
+                    if batch:
+                        yield batch
+
+                if high_water:
+                    self.cursors[channel] = high_water
+
+
+def ingest_slack_export(zip_path: str,
+                        inbox=None,
+                        user_name: str = "Eamon",
+                        user_id: str = None,
+                        cursor_path: str = None) -> Dict[str, any]:
+    """Ingest new messages from a Slack export zip.
+
+    Streams only messages newer than the stored cursors through
+    SlackContextExtractor (and PriorityInbox, when given), then saves the
+    advanced cursors.
+
+    Args:
+        zip_path: Path to the Slack workspace export zip
+        inbox: Optional PriorityInbox to feed the new messages into
+        user_name: User's name for context
+        user_id: User's Slack ID
+        cursor_path: Optional cursor file location
+
+    Returns:
+        Dictionary with message count, per-kind context and updated cursors
+    """
+    reader = SlackExportReader(zip_path, cursor_path)
+    extractor = SlackContextExtractor()
+
+    message_count = 0
+
+    def counted(batches):
+        nonlocal message_count
+        for batch in batches:
+            message_count += len(batch)
+            if inbox is not None:
+                inbox.add_slack_messages(batch)
+            yield from batch
+
+    results = {'commitment': [], 'mention': [], 'decision': [], 'thread': []}
+    for kind, item in extractor.stream_context(counted(reader.iter_batches()), user_name, user_id):
+        results[kind].append(item)
+
+    reader.save_cursors()
+
+    return {
+        'messages_ingested': message_count,
+        'commitments': results['commitment'],
+        'mentions': results['mention'],
+        'decisions': results['decision'],
+        'active_threads': results['thread'],
+        'cursors': dict(reader.cursors)
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Ingest new messages from a Slack export zip')
+    parser.add_argument('zip_path', help='Path to Slack workspace export zip')
+    parser.add_argument('--cursor-file', help='Path to cursor JSON file')
+    parser.add_argument('--user-id', help='Your Slack user ID (for mentions)')
+
+    args = parser.parse_args()
+
+    result = ingest_slack_export(args.zip_path, user_id=args.user_id, cursor_path=args.cursor_file)
+
+    print(f"✅ Ingested {result['messages_ingested']} new messages")
+    print(f"   Commitments: {len(result['commitments'])}")
+    print(f"   Mentions/requests: {len(result['mentions'])}")
+    print(f"   Decisions: {len(result['decisions'])}")
+    print(f"   Active threads: {len(result['active_threads'])}")
@@ -20,13 +20,16 @@ import re
 class SlackNotifier:
     """Handle all Slack notifications for the task management system."""
     
-    def __init__(self, user_id: str = None):
+    def __init__(self, user_id: str = None, outbox=None):
         """Initialize the Slack notifier.
         
         Args:
             user_id: Slack user ID (e.g., 'U12345ABC'). If None, sends to 'me'.
+            outbox: Optional SlackOutbox; when given, send_message() queues
+                messages there so bursts go out as one digest
         """
         self.user_id = user_id or "me"
+        self.outbox = outbox
     
     def format_monday_morning_summary(self, 
                                      weekly_summary_path: Path,
@@ -581,14 +584,19 @@ It's Friday afternoon - time to reflect on the week and prep for next week.
             message: Formatted message to send
             
         Returns:
-            Dict with message details for MCP call
+            Dict with message details for MCP call. With an outbox the
+            message is queued instead and the dict carries 'queued_id'.
         """
-        return {
+        notification = {
             'recipient': self.user_id,
             'message': message,
             'mcp_function': 'your-slack-mcp_send_message',  # Replace with your Slack MCP name
             'note': 'Claude should call the Slack MCP function with this message'
         }
+        if self.outbox is not None:
+            notification['queued_id'] = self.outbox.enqueue(notification)
+            notification['note'] = 'Queued in the Slack outbox; send the digests returned by flush_outbox()'
+        return notification
 
 
 def create_monday_morning_notification(weekly_summary_path: str,
@@ -639,17 +647,19 @@ def create_daily_notification(target_date: date,
 
 
 def create_action_reminder(actions: List[Dict[str, str]],
-                          reminder_type: str = "weekly") -> Dict[str, any]:
+                          reminder_type: str = "weekly",
+                          outbox=None) -> Dict[str, any]:
     """Create action item reminder notification.
     
     Args:
         actions: List of action items
         reminder_type: 'weekly' or 'daily'
+        outbox: Optional SlackOutbox to queue the message in
         
     Returns:
         Message data for Slack MCP call
     """
-    notifier = SlackNotifier()
+    notifier = SlackNotifier(outbox=outbox)
     message = notifier.format_action_item_reminder(actions, reminder_type)
     return notifier.send_message(message)
 
@@ -672,7 +682,8 @@ def create_meeting_reminder(meeting_title: str,
                            agenda_items: List[str],
                            prep_items: List[str],
                            meeting_link: str = None,
-                           location: str = None) -> Dict[str, any]:
+                           location: str = None,
+                           outbox=None) -> Dict[str, any]:
     """Create pre-meeting reminder notification.
     
     Args:
@@ -684,11 +695,12 @@ def create_meeting_reminder(meeting_title: str,
         prep_items: List of prep tasks
         meeting_link: Optional meeting link
         location: Optional location
+        outbox: Optional SlackOutbox to queue the message in
         
     Returns:
         Message data for Slack MCP call
     """
-    notifier = SlackNotifier()
+    notifier = SlackNotifier(outbox=outbox)
     message = notifier.format_meeting_reminder(
         meeting_title,
         meeting_time,
@@ -707,7 +719,8 @@ def create_daily_plan_notification(target_date: date,
                                    schedule: List[Dict[str, str]],
                                    meeting_count: int,
                                    strategic_focus: str = None,
-                                   daily_file_path: str = None) -> Dict[str, any]:
+                                   daily_file_path: str = None,
+                                   outbox=None) -> Dict[str, any]:
     """Create comprehensive daily plan notification.
     
     Args:
@@ -717,11 +730,12 @@ def create_daily_plan_notification(target_date: date,
         meeting_count: Number of meetings
         strategic_focus: Optional strategic focus
         daily_file_path: Path to daily file
+        outbox: Optional SlackOutbox to queue the message in
         
     Returns:
         Message data for Slack MCP call
     """
-    notifier = SlackNotifier()
+    notifier = SlackNotifier(outbox=outbox)
     message = notifier.format_daily_plan_notification(
         target_date,
         top_3_tasks,
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Slack Outbox
+
+Durable on-disk queue for the message dicts produced by SlackNotifier.send_message()
+(and the create_*_notification / create_*_reminder helpers).
+
+Messages are appended to a JSONL file as they are queued, so nothing is lost
+if the process exits before delivery. Delivery is at-least-once: a crash
+between a send and the queue rewrite sends that digest again. On flush,
+messages for the same recipient that were queued within the coalescing
+window are merged into a single digest post - a burst of action, meeting and
+daily-plan reminders becomes one DM. Delivery is paced by a token bucket and goes through a
+pluggable transport:
+
+- MCPTransport (default): returns the payloads for Claude to forward via the
+  Slack MCP, like SlackNotifier.send_message() does today
+- HTTPTransport: POSTs JSON to a webhook URL (e.g. LocalSlackServer, a
+  local stand-in for trying delivery without Slack)
+
+Usage:
+    from slack_outbox import SlackOutbox
+    from slack_notifier import create_action_reminder, create_meeting_reminder
+
+    outbox = SlackOutbox()
+    create_action_reminder(actions, outbox=outbox)
+    create_meeting_reminder(..., outbox=outbox)
+    delivered = outbox.flush()
+
+The reminder producers (create_action_reminder, create_meeting_reminder,
+create_daily_plan_notification, SlackWorkflowIntegration and the meeting
+reminder scheduler) take an outbox and queue into it.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_OUTBOX_PATH = Path(__file__).parent.parent.parent / "inbox" / "slack-outbox.jsonl"
+
+
+class TokenBucket:
+    """Simple token bucket: `rate` sends per second with bursts up to `capacity`."""
+
+    def __init__(self,
+                 rate: float = 1.0,
+                 capacity: int = 3,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        self._refill()
+        if self.tokens < 1:
+            self.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens = max(0.0, self.tokens - 1)
+
+
+class MCPTransport:
+    """Collect payloads for Claude to send through the Slack MCP."""
+
+    def __init__(self):
+        self.sent: List[Dict] = []
+
+    def deliver(self, payload: Dict) -> Optional[float]:
+        """Record the payload for forwarding.
+
+        Returns:
+            None (never rate limited)
+        """
+        self.sent.append(payload)
+        return None
+
+
+class HTTPTransport:
+    """POST payloads as JSON to a webhook URL."""
+
+    def __init__(self, url: str, timeout: int = 10):
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, payload: Dict) -> Optional[float]:
+        """POST one payload.
+
+        Returns:
+            None on success, or seconds to wait if the server answered 429
+
+        Raises:
+            urllib.error.URLError: on any other delivery failure
+        """
+        body = json.dumps({'channel': payload['recipient'], 'text': payload['message']}).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                return None
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                return float(e.headers.get('Retry-After', 1))
+            raise
+
+
+class LocalSlackServer:
+    """Local HTTP stand-in for a Slack webhook.
+
+    Records every JSON body it receives and can answer the first
+    `rate_limit_first` requests with 429 to exercise retry handling.
+
+    Usage:
+        with LocalSlackServer() as server:
+            outbox = SlackOutbox(transport=HTTPTransport(server.url))
+            outbox.flush(settle=False)
+            print(server.received)
+    """
+
+    def __init__(self, rate_limit_first: int = 0):
+        self.received: List[Dict] = []
+        self.rate_limit_first = rate_limit_first
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                if server.rate_limit_first > 0:
+                    server.rate_limit_first -= 1
+                    self.send_response(429)
+                    self.send_header('Retry-After', '0')
+                    self.end_headers()
+                    return
+                server.received.append(body)
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(b'ok')
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class SlackOutbox:
+    """Persistent, coalescing, rate-limited Slack message queue."""
+
+    def __init__(self,
+                 path: Path = None,
+                 transport=None,
+                 window_seconds: int = 120,
+                 rate: float = 1.0,
+                 burst: int = 3,
+                 clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Initialize the outbox.
+
+        Args:
+            path: JSONL file backing the queue (defaults to inbox/slack-outbox.jsonl)
+            transport: Object with deliver(payload) (defaults to MCPTransport)
+            window_seconds: Messages to one recipient queued within this many
+                seconds of each other are merged into one digest
+            rate: Sustained sends per second
+            burst: Maximum sends in a burst
+            clock: Wall-clock function (injectable for testing)
+            sleep: Sleep function (injectable for testing)
+        """
+        self.path = Path(path) if path else DEFAULT_OUTBOX_PATH
+        self.transport = transport or MCPTransport()
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+
+    def enqueue(self, notification: Dict) -> str:
+        """Append a notification to the on-disk queue.
+
+        Args:
+            notification: Dict from SlackNotifier.send_message() (needs
+                'recipient' and 'message')
+
+        Returns:
+            ID of the queued entry
+        """
+        entry = {
+            'id': uuid.uuid4().hex,
+            'recipient': notification.get('recipient', 'me'),
+            'message': notification['message'],
+            'queued_at': self.clock(),
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked():
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        return entry['id']
+
+    @contextmanager
+    def _locked(self, suffix: str = '.lock'):
+        """Hold an exclusive flock on one of the queue's lock files.
+
+        The locks live in sibling files because _save() replaces the queue
+        file itself. '.lock' guards the queue file; '.flush.lock' is held for
+        a whole flush, so concurrent flushes never send the same batch twice
+        while enqueue() only waits for the short queue rewrite.
+        """
+        lock_path = self.path.with_suffix(suffix)
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def pending(self) -> List[Dict]:
+        """Entries still waiting to be delivered, oldest first."""
+        if not self.path.exists():
+            return []
+
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # A torn final line from a crash mid-append
+                    continue
+
+        return sorted(entries, key=lambda e: e['queued_at'])
+
+    def _save(self, entries: List[Dict]) -> None:
+        """Atomically rewrite the queue with the given entries."""
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _remove(self, ids: set) -> None:
+        """Drop delivered entries from the queue.
+
+        Re-reads the file under the lock, so entries enqueued while a batch
+        was being sent are kept.
+        """
+        with self._locked():
+            remaining = [e for e in self.pending() if e['id'] not in ids]
+            self._save(remaining)
+
+    def _batches(self, entries: List[Dict]) -> List[List[Dict]]:
+        """Group entries per recipient into runs no more than window_seconds apart."""
+        by_recipient = {}
+        for entry in entries:
+            by_recipient.setdefault(entry['recipient'], []).append(entry)
+
+        batches = []
+        for recipient_entries in by_recipient.values():
+            batch = [recipient_entries[0]]
+            for entry in recipient_entries[1:]:
+                if entry['queued_at'] - batch[-1]['queued_at'] <= self.window_seconds:
+                    batch.append(entry)
+                else:
+                    batches.append(batch)
+                    batch = [entry]
+            batches.append(batch)
+
+        batches.sort(key=lambda b: b[0]['queued_at'])
+        return batches
+
+    def _digest(self, batch: List[Dict]) -> Dict:
+        """Merge a batch into one payload in SlackNotifier.send_message() shape."""
+        if len(batch) == 1:
+            message = batch[0]['message']
+        else:
+            parts = [f"📬 *{len(batch)} updates*"]
+            parts.extend(entry['message'] for entry in batch)
+            message = "\n\n———\n\n".join(parts)
+
+        return {
+            'recipient': batch[0]['recipient'],
+            'message': message,
+            'mcp_function': 'your-slack-mcp_send_message',  # Replace with your Slack MCP name
+            'note': 'Claude should call the Slack MCP function with this message'
+        }
+
+    def flush(self, settle: bool = True) -> List[Dict]:
+        """Deliver queued messages as coalesced digests.
+
+        Args:
+            settle: If True, leave batches whose newest entry is still inside
+                the coalescing window queued, so late arrivals can join them
+
+        Returns:
+            List of delivered payloads
+        """
+        if not self.path.exists():
+            return []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked('.flush.lock'):
+            return self._flush_locked(settle)
+
+    def _flush_locked(self, settle: bool) -> List[Dict]:
+        """flush() body; the caller holds the flush lock."""
+        entries = self.pending()
+        if not entries:
+            return []
+
+        now = self.clock()
+        delivered = []
+
+        for batch in self._batches(entries):
+            if settle and now - batch[-1]['queued_at'] < self.window_seconds:
+                continue
+
+            payload = self._digest(batch)
+            self.bucket.acquire()
+            retry_after = self.transport.deliver(payload)
+
+            if retry_after is not None:
+                # Rate limited by Slack - wait it out and try once more
+                self.sleep(retry_after)
+                retry_after = self.transport.deliver(payload)
+
+            if retry_after is None:
+                delivered.append(payload)
+                # Persist progress after every send; a crash before this
+                # line resends the batch (at-least-once delivery)
+                self._remove({entry['id'] for entry in batch})
+
+        return delivered
+
+
+def queue_notification(notification: Dict, path: Path = None) -> str:
+    """Queue a notification dict in the default outbox.
+
+    Usage from Claude (for producers that don't take an outbox):
+        queue_notification(create_friday_review_reminder())
+        payloads = flush_outbox()
+        # Then call Slack MCP once per payload
+    """
+    return SlackOutbox(path).enqueue(notification)
+
+
+def flush_outbox(path: Path = None, settle: bool = False) -> List[Dict]:
+    """Flush the default outbox and return the digests to send."""
+    return SlackOutbox(path).flush(settle=settle)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Deliver queued Slack messages')
+    parser.add_argument('--webhook', help='POST digests to this URL instead of returning them for MCP')
+    parser.add_argument('--outbox', help='Path to outbox JSONL file')
+
+    args = parser.parse_args()
+
+    transport = HTTPTransport(args.webhook) if args.webhook else MCPTransport()
+    outbox = SlackOutbox(Path(args.outbox) if args.outbox else None, transport=transport)
+    delivered = outbox.flush(settle=False)
+
+    print(f"✅ Delivered {len(delivered)} digest(s); {len(outbox.pending())} still queued")
+    if isinstance(transport, MCPTransport):
+        print(json.dumps(delivered, indent=2))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Slack Thread Index
+
+Reconstructs thread structure from a stream of Slack messages: each
+``thread_ts`` maps to an ordered reply list, its participants and the
+last-activity time. The index is built incrementally, one message at a time,
+and keeps the set of threads waiting on the user up to date as it goes, so
+the "awaiting me" view never rescans the corpus.
+
+Streaming callers that only need counts can pass ``keep_replies=False``; the
+index then holds reply counts, participants and the last ts per thread, but
+no reply text.
+"""
+
+from bisect import insort
+from typing import Dict, Iterable, List, Optional
+
+
+class ThreadIndex:
+    """Incremental index from thread_ts to thread structure."""
+
+    def __init__(self, user_id: str = None, keep_replies: bool = True):
+        """Initialize the index.
+
+        Args:
+            user_id: User's Slack ID (e.g., 'U12345'); enables awaiting()
+            keep_replies: Keep the ordered reply list (with text) per thread.
+                When False only reply counts and a preview are kept.
+        """
+        self.user_id = user_id
+        self.keep_replies = keep_replies
+        self.threads: Dict[str, Dict] = {}
+        self._awaiting = set()
+
+    def add_message(self, message: Dict) -> Optional[str]:
+        """Add one message to the index.
+
+        Args:
+            message: Slack message dict
+
+        Returns:
+            The message's thread_ts, or None if it is not part of a thread
+        """
+        thread_ts = message.get('thread_ts')
+        if not thread_ts:
+            return None
+
+        ts = message.get('ts', '')
+        user = message.get('user', 'Unknown')
+        text = message.get('text', '')
+
+        thread = self.threads.get(thread_ts)
+        if thread is None:
+            thread = {
+                'thread_ts': thread_ts,
+                'channel': message.get('channel', 'Unknown'),
+                'root_text': '',
+                'permalink': message.get('permalink', ''),
+                'replies': [],
+                'reply_count': 0,
+                'first_reply': None,
+                'participants': {},
+                'last_activity': '',
+                'last_user': None,
+            }
+            self.threads[thread_ts] = thread
+
+        if ts == thread_ts:
+            thread['root_text'] = text
+            if message.get('permalink'):
+                thread['permalink'] = message['permalink']
+        else:
+            thread['reply_count'] += 1
+            if self.keep_replies:
+                # Replies can arrive out of order across day files
+                insort(thread['replies'], (float(ts or 0), ts, user, text))
+            elif not thread['root_text']:
+                # Earliest reply preview stands in for a root we haven't seen
+                first = thread['first_reply']
+                if first is None or float(ts or 0) < first[0]:
+                    thread['first_reply'] = (float(ts or 0), text[:100])
+
+        thread['participants'][user] = thread['participants'].get(user, 0) + 1
+
+        if float(ts or 0) >= float(thread['last_activity'] or 0):
+            thread['last_activity'] = ts
+            thread['last_user'] = user
+            self._update_awaiting(thread, text)
+
+        return thread_ts
+
+    def add_messages(self, messages: Iterable[Dict]) -> None:
+        """Add many messages to the index."""
+        for message in messages:
+            self.add_message(message)
+
+    def _update_awaiting(self, thread: Dict, latest_text: str) -> None:
+        """Recompute whether a thread is waiting on the user after new activity."""
+        if not self.user_id:
+            return
+
+        thread_ts = thread['thread_ts']
+        if thread['last_user'] == self.user_id:
+            self._awaiting.discard(thread_ts)
+        elif self.user_id in thread['participants'] or f"<@{self.user_id}>" in latest_text:
+            self._awaiting.add(thread_ts)
+
+    def get(self, thread_ts: str) -> Optional[Dict]:
+        """Get the thread structure for a thread_ts."""
+        return self.threads.get(thread_ts)
+
+    def message_count(self, thread_ts: str) -> int:
+        """Number of messages seen in a thread (root plus replies)."""
+        thread = self.threads.get(thread_ts)
+        if not thread:
+            return 0
+        return sum(thread['participants'].values())
+
+    def summarize(self, thread_ts: str) -> Dict[str, any]:
+        """Flatten a thread into a summary dict for display."""
+        thread = self.threads[thread_ts]
+        first_message = thread['root_text']
+        if not first_message and thread['replies']:
+            first_message = thread['replies'][0][3]
+        elif not first_message and thread['first_reply']:
+            first_message = thread['first_reply'][1]
+
+        return {
+            'count': self.message_count(thread_ts),
+            'reply_count': thread['reply_count'],
+            'channel': thread['channel'],
+            'first_message': first_message[:100],
+            'timestamp': thread_ts,
+            'permalink': thread['permalink'],
+            'participants': list(thread['participants']),
+            'last_activity': thread['last_activity'],
+            'last_user': thread['last_user'],
+        }
+
+    def active_threads(self, min_messages: int = 2) -> List[Dict[str, any]]:
+        """Summaries of threads with at least min_messages, most recent first."""
+        active = [
+            self.summarize(thread_ts) for thread_ts in self.threads
+            if self.message_count(thread_ts) >= min_messages
+        ]
+        active.sort(key=lambda t: float(t['last_activity'] or 0), reverse=True)
+        return active
+
+    def awaiting_count(self) -> int:
+        """Number of threads currently waiting on the user."""
+        return len(self._awaiting)
+
+    def awaiting(self) -> List[Dict[str, any]]:
+        """Summaries of threads where someone else spoke last and the user is involved."""
+        awaiting = [self.summarize(thread_ts) for thread_ts in self._awaiting]
+        awaiting.sort(key=lambda t: float(t['last_activity'] or 0), reverse=True)
+        return awaiting
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Slack Timestamp Bucketing
+
+Batch conversion of Slack ``ts`` strings into day keys, week keys and display
+strings. Conversions are memoized on 15-minute buckets - every real timezone
+offset is a multiple of 15 minutes, so all timestamps in a bucket share a
+local date - which turns a quarter's worth of messages into a few thousand
+``datetime`` calls instead of one per message.
+
+Grouping by day, week and channel is then a single dictionary pass.
+"""
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+BUCKET_SECONDS = 900  # 15 minutes
+
+
+@lru_cache(maxsize=65536)
+def _bucket_date(bucket: int) -> date:
+    """Local date for a 15-minute epoch bucket."""
+    return datetime.fromtimestamp(bucket * BUCKET_SECONDS).date()
+
+
+@lru_cache(maxsize=4096)
+def _display(day: date) -> str:
+    """Display string for a date (matches the summary format)."""
+    return day.strftime('%B %d, %Y')
+
+
+@lru_cache(maxsize=4096)
+def _week_start(day: date) -> date:
+    """Monday of the week containing a date."""
+    return day - timedelta(days=day.weekday())
+
+
+def slack_ts_to_date(ts: str) -> Optional[date]:
+    """Convert a Slack timestamp (e.g. '1634567890.123456') to a local date.
+
+    Returns:
+        The local date, or None if the timestamp can't be parsed or is out
+        of the platform's datetime range
+    """
+    try:
+        seconds = int(str(ts).split('.')[0])
+        return _bucket_date(seconds // BUCKET_SECONDS)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+def format_slack_ts(ts: str) -> str:
+    """Format a Slack timestamp as 'Month DD, YYYY' ('Unknown date' if invalid)."""
+    day = slack_ts_to_date(ts)
+    return _display(day) if day else 'Unknown date'
+
+
+def day_key(ts: str) -> str:
+    """'YYYY-MM-DD' day key for a Slack timestamp ('unknown' if invalid)."""
+    day = slack_ts_to_date(ts)
+    return day.isoformat() if day else 'unknown'
+
+
+def week_key(ts: str) -> str:
+    """'YYYY-MM-DD' key of the Monday starting the timestamp's week."""
+    day = slack_ts_to_date(ts)
+    return _week_start(day).isoformat() if day else 'unknown'
+
+
+def convert_timestamps(timestamps: Iterable[str]) -> List[Tuple[str, str, str]]:
+    """Batch-convert Slack timestamps.
+
+    Args:
+        timestamps: Iterable of Slack ts strings
+
+    Returns:
+        List of (day_key, week_key, display) tuples, one per timestamp
+    """
+    converted = []
+    for ts in timestamps:
+        day = slack_ts_to_date(ts)
+        if day is None:
+            converted.append(('unknown', 'unknown', 'Unknown date'))
+        else:
+            converted.append((day.isoformat(), _week_start(day).isoformat(), _display(day)))
+    return converted
+
+
+def group_by_period(items: Iterable[Dict],
+                    period: str = 'day',
+                    by_channel: bool = False,
+                    ts_field: str = 'timestamp') -> Dict[object, List[Dict]]:
+    """Group items by day or week, optionally split by channel.
+
+    Args:
+        items: Dicts carrying a Slack timestamp (extractor results or raw messages)
+        period: 'day' or 'week'
+        by_channel: If True, keys are (period_key, channel) tuples
+        ts_field: Item key holding the timestamp ('timestamp' for extractor
+            results, 'ts' for raw messages)
+
+    Returns:
+        Dictionary mapping period keys (or (period, channel) tuples) to items,
+        in first-seen order
+    """
+    key_for = week_key if period == 'week' else day_key
+    grouped = {}
+
+    for item in items:
+        key = key_for(item.get(ts_field, ''))
+        if by_channel:
+            key = (key, item.get('channel', 'Unknown'))
+        grouped.setdefault(key, []).append(item)
+
+    return grouped
@@ -26,16 +26,19 @@ from slack_notifier import (
 class SlackWorkflowIntegration:
     """High-level workflow integration with Slack notifications."""
     
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, outbox=None):
         """Initialize workflow integration.
         
         Args:
             project_root: Root directory of the project
+            outbox: Optional SlackOutbox; reminders are queued there and
+                coalesced instead of being returned for immediate sending
         """
         if project_root is None:
             project_root = Path(__file__).parent.parent
         
         self.project_root = project_root
+        self.outbox = outbox
         self.weekly_summaries_dir = project_root / "weekly-summaries"
         self.weekly_plans_dir = project_root / "weekly-plans"
         self.daily_dir = project_root / "daily"
@@ -143,7 +146,7 @@ class SlackWorkflowIntegration:
         if not actions:
             return None
         
-        return create_action_reminder(actions, reminder_type="weekly")
+        return create_action_reminder(actions, reminder_type="weekly", outbox=self.outbox)
     
     def send_friday_reminder(self) -> Dict:
         """Send Friday afternoon weekly review reminder.
@@ -237,7 +240,8 @@ class SlackWorkflowIntegration:
                 agenda_items,
                 prep_items,
                 meet_link,
-                location if not meet_link else None
+                location if not meet_link else None,
+                outbox=self.outbox
             )
             
         except Exception as e:
@@ -261,24 +265,10 @@ class SlackWorkflowIntegration:
             with open(meeting_file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            import re
-            
-            # Extract date and time
-            date_match = re.search(r'\*\*Date:\*\* (\d{4}-\d{2}-\d{2})', content)
-            time_match = re.search(r'\*\*Time:\*\* (\d{1,2}:\d{2}\s*(?:AM|PM))', content)
-            
-            if not date_match or not time_match:
+            meeting_datetime = parse_meeting_start(content)
+            if meeting_datetime is None:
                 return False
             
-            date_str = date_match.group(1)
-            time_str = time_match.group(1)
-            
-            # Parse meeting datetime
-            meeting_datetime = datetime.strptime(
-                f"{date_str} {time_str}",
-                "%Y-%m-%d %I:%M %p"
-            )
-            
             # Calculate reminder time
             reminder_time = meeting_datetime - timedelta(minutes=minutes_before)
             now = datetime.now()
@@ -292,6 +282,42 @@ class SlackWorkflowIntegration:
             return False
 
 
+def parse_meeting_start(content: str, default_date: date = None) -> Optional[datetime]:
+    """Parse a meeting's start datetime from meeting file content.
+    
+    Reads the **Date:** (YYYY-MM-DD) and **Time:** fields. The time may be
+    12-hour ("2:00 PM - 3:00 PM") or 24-hour ("14:00 - 15:00"); only the
+    start is used.
+    
+    Args:
+        content: Meeting file content
+        default_date: Date to use when the file has no ISO **Date:** field
+        
+    Returns:
+        Meeting start datetime, or None if it can't be determined
+    """
+    import re
+    
+    date_match = re.search(r'\*\*Date:\*\* (\d{4}-\d{2}-\d{2})', content)
+    if date_match:
+        meeting_date = datetime.strptime(date_match.group(1), "%Y-%m-%d").date()
+    elif default_date:
+        meeting_date = default_date
+    else:
+        return None
+    
+    time_match = re.search(r'\*\*Time:\*\* (\d{1,2}:\d{2}\s*(?:AM|PM))', content, re.IGNORECASE)
+    if time_match:
+        start_time = datetime.strptime(time_match.group(1).replace(' ', '').upper(), "%I:%M%p").time()
+    else:
+        time_match = re.search(r'\*\*Time:\*\* (\d{1,2}:\d{2})', content)
+        if not time_match:
+            return None
+        start_time = datetime.strptime(time_match.group(1), "%H:%M").time()
+    
+    return datetime.combine(meeting_date, start_time)
+
+
 def get_todays_meetings(daily_file_path: Path) -> List[Path]:
     """Get list of meeting file paths from today's daily file.
     
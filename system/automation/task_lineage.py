@@ -0,0 +1,378 @@
+"""
+Task Lineage - follow the same task across dailies and weeks
+
+Checkbox tasks get copied from day to day, usually with small edits
+("Email Bob re: SPIF" -> "Email Bob re SPIF draft"). Each task line is
+reduced to a normalized fingerprint (lowercase, markup and stopwords
+removed); lines with the same fingerprint, or a close fuzzy match among
+tasks sharing words with it, are linked into one lineage:
+
+    first seen 2025-11-03 [ ] -> 2025-11-04 [ ] -> 2025-11-06 [x]
+
+From the lineage graph we answer:
+- age(task): days since the task first appeared
+- carried_days(task): distinct days it was carried open
+- stale(): open tasks carried for a long time
+- cycle_time(task) / cycle_times(): first seen -> checked off
+
+The graph is cached in ``archive/task-lineage.json``; only dailies newer
+than the last processed one are read on later runs. Editing the latest
+daily (today's, usually) re-reads just that day; editing an older one
+rebuilds the graph.
+"""
+
+import json
+import os
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import archive_bundles
+from archive_manifest import get_archive_manifest
+from date_index import get_date_index
+
+LINEAGE_NAME = "task-lineage.json"
+LINEAGE_VERSION = 1
+
+TASK_LINE = re.compile(r'^- \[([ xX])\] (.+)$', re.MULTILINE)
+MARKUP = re.compile(r'\[\[([^\]]*)\]\]|\*\*|__|`|\[([^\]]*)\]\([^)]*\)')
+WORD = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = {
+    'a', 'an', 'and', 'the', 'to', 'of', 'for', 'on', 'in', 'with', 're',
+    'at', 'by', 'from', 'about', 'up', 'my', 'our', 'is', 'be', 'or',
+}
+
+MATCH_THRESHOLD = 0.85
+
+
+def fingerprint(task: str) -> str:
+    """Normalized form of a task line used to recognize it on other days."""
+    text = MARKUP.sub(lambda m: m.group(1) or m.group(2) or ' ', task.lower())
+    return ' '.join(word for word in WORD.findall(text) if word not in STOPWORDS)
+
+
+def _numbers(key: str) -> set:
+    """Words in a fingerprint that contain digits (dates, quarters, versions)."""
+    return {word for word in key.split() if any(ch.isdigit() for ch in word)}
+
+
+def _days_between(start: str, end: str) -> int:
+    """Calendar days from one 'YYYY-MM-DD' date to another."""
+    return (datetime.strptime(end, '%Y-%m-%d') - datetime.strptime(start, '%Y-%m-%d')).days
+
+
+class TaskLineage:
+    """Lineage graph of checkbox tasks across all dailies (loose and archived)."""
+
+    def __init__(self, base_dir: str = None):
+        """Load the cached graph and fold in any new dailies.
+
+        Args:
+            base_dir: Project root (defaults to three levels up from this file)
+        """
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent.parent
+        self.daily_dir = self.base_dir / "work" / "daily"
+        self.path = self.base_dir / "archive" / LINEAGE_NAME
+
+        self.tasks: Dict[str, Dict] = {}
+        self.files: Dict[str, int] = {}
+        self.last_date = ''
+        self._by_fingerprint: Dict[str, str] = {}
+        self._by_word: Dict[str, set] = {}
+
+        self._load()
+        self.refresh()
+
+    # -- persistence --------------------------------------------------------
+
+    def _load(self) -> None:
+        """Read the cached graph (ignored if missing or from another version)."""
+        if not self.path.exists():
+            return
+        try:
+            cached = json.loads(self.path.read_text())
+        except (ValueError, OSError):
+            return
+        if cached.get('version') != LINEAGE_VERSION:
+            return
+
+        self.tasks = cached['tasks']
+        self.files = cached['files']
+        self.last_date = cached['last_date']
+        for task_id, task in self.tasks.items():
+            self._index(task_id, task)
+
+    def save(self) -> None:
+        """Write the graph atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({
+            'version': LINEAGE_VERSION,
+            'last_date': self.last_date,
+            'files': self.files,
+            'tasks': self.tasks,
+        }))
+        os.replace(tmp_path, self.path)
+
+    def _reset(self) -> None:
+        self.tasks, self.files, self.last_date = {}, {}, ''
+        self._by_fingerprint, self._by_word = {}, {}
+
+    def _unfold(self, date_str: str) -> None:
+        """Take back the sightings of the latest processed date.
+
+        Sightings are appended in date order, so that date's sighting is the
+        last one of any task it touched.
+        """
+        for task_id in list(self.tasks):
+            task = self.tasks[task_id]
+            sightings = task['sightings']
+            if not sightings or sightings[-1][0] != date_str:
+                continue
+            sightings.pop()
+
+            if not sightings:
+                del self.tasks[task_id]
+                for key in task['fingerprints']:
+                    if self._by_fingerprint.get(key) == task_id:
+                        del self._by_fingerprint[key]
+                    for word in key.split():
+                        self._by_word.get(word, set()).discard(task_id)
+                continue
+
+            task['first_seen'] = sightings[0][0]
+            task['last_seen'] = sightings[-1][0]
+            task['open_days'] = sum(1 for _, state in sightings if state == 'open')
+            task['completed_on'] = None
+            for day, state in sightings:
+                if state == 'done':
+                    task['completed_on'] = task['completed_on'] or day
+                else:
+                    task['completed_on'] = None
+
+    # -- building -----------------------------------------------------------
+
+    def _daily_files(self) -> Dict[str, List[Path]]:
+        """All dailies by date: archived ones from the manifest, then loose ones."""
+        by_date: Dict[str, List[Path]] = {}
+        for date_str, paths in get_archive_manifest(self.base_dir).entries.items():
+            by_date[date_str] = [self.base_dir / p for p in paths]
+        for date_str, paths in get_date_index(self.daily_dir).dated_files().items():
+            names = {p.name for p in by_date.get(date_str, [])}
+            by_date.setdefault(date_str, []).extend(p for p in paths if p.name not in names)
+        return by_date
+
+    def refresh(self) -> int:
+        """Fold new dailies into the graph.
+
+        An edited daily from the latest processed date is re-read on its own;
+        an edit to an older one rebuilds the graph.
+
+        Returns:
+            Number of daily files read
+        """
+        by_date = self._daily_files()
+
+        # Archival moves files without touching them, so files are keyed by
+        # name. Packed (bundled) files can't be edited and have no mtime.
+        edited = set()
+        for date_str, paths in by_date.items():
+            for path in paths:
+                if path.name in self.files and path.exists() and os.stat(path).st_mtime_ns != self.files[path.name]:
+                    edited.add(date_str)
+        if edited == {self.last_date}:
+            self._unfold(self.last_date)
+            for path in by_date[self.last_date]:
+                self.files.pop(path.name, None)
+        elif edited:
+            self._reset()
+
+        read = 0
+        for date_str in sorted(by_date):
+            for path in sorted(by_date[date_str]):
+                if path.name in self.files:
+                    continue
+                if date_str < self.last_date:
+                    # A back-dated daily appeared; sightings must stay in order
+                    self._reset()
+                    return self.refresh()
+                try:
+                    content = archive_bundles.read_text(path)
+                except (FileNotFoundError, OSError):
+                    continue
+                self.add_daily(date_str, content)
+                self.files[path.name] = os.stat(path).st_mtime_ns if path.exists() else 0
+                self.last_date = max(self.last_date, date_str)
+                read += 1
+
+        if read or edited:
+            self.save()
+        return read
+
+    def add_daily(self, date_str: str, content: str) -> None:
+        """Record every checkbox task in one daily's content."""
+        for mark, text in TASK_LINE.findall(content):
+            text = text.strip()
+            if not text or text.startswith('['):
+                continue
+            key = fingerprint(text)
+            if not key:
+                continue
+            self._sight(self._resolve(key, create=True), date_str, text, mark != ' ')
+
+    def _index(self, task_id: str, task: Dict) -> None:
+        for key in task['fingerprints']:
+            self._by_fingerprint[key] = task_id
+            for word in key.split():
+                self._by_word.setdefault(word, set()).add(task_id)
+
+    def _resolve(self, key: str, create: bool = False) -> Optional[str]:
+        """Task id for a fingerprint: exact hit, fuzzy match, or a new task."""
+        task_id = self._by_fingerprint.get(key)
+        if task_id:
+            return task_id
+
+        # Only compare against tasks sharing the most words with this one
+        overlap = Counter()
+        for word in set(key.split()):
+            overlap.update(self._by_word.get(word, ()))
+
+        # Numbers must agree exactly: "Q3 deck" and "Q4 deck" are different tasks
+        numbers = _numbers(key)
+
+        best_id, best_ratio = None, MATCH_THRESHOLD
+        for candidate_id, _ in overlap.most_common(10):
+            for candidate_print in self.tasks[candidate_id]['fingerprints']:
+                if _numbers(candidate_print) != numbers:
+                    continue
+                matcher = SequenceMatcher(None, key, candidate_print)
+                if matcher.quick_ratio() < best_ratio:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= best_ratio:
+                    best_id, best_ratio = candidate_id, ratio
+
+        if not create:
+            return best_id
+
+        if best_id is None:
+            best_id = key
+            self.tasks[best_id] = {
+                'text': '', 'fingerprints': [], 'sightings': [],
+                'first_seen': None, 'last_seen': None, 'open_days': 0,
+                'completed_on': None,
+            }
+
+        task = self.tasks[best_id]
+        if key not in task['fingerprints']:
+            task['fingerprints'].append(key)
+            self._index(best_id, {'fingerprints': [key]})
+        return best_id
+
+    def _sight(self, task_id: str, date_str: str, text: str, done: bool) -> None:
+        """Add one day's sighting of a task to its lineage."""
+        task = self.tasks[task_id]
+        sightings = task['sightings']
+        state = 'done' if done else 'open'
+
+        if sightings and sightings[-1][0] == date_str:
+            # Same task twice in one daily: checked wins
+            if done and sightings[-1][1] == 'open':
+                sightings[-1][1] = 'done'
+                task['open_days'] -= 1
+            else:
+                return
+        else:
+            sightings.append([date_str, state])
+            if not done:
+                task['open_days'] += 1
+
+        task['text'] = text
+        task['first_seen'] = task['first_seen'] or date_str
+        task['last_seen'] = date_str
+        if done:
+            task['completed_on'] = task['completed_on'] or date_str
+        else:
+            task['completed_on'] = None  # Reopened (or still open)
+
+    # -- queries ------------------------------------------------------------
+
+    def find(self, task: str) -> Optional[Dict]:
+        """Lineage record for a task text, or None if never seen."""
+        key = fingerprint(task)
+        task_id = self._resolve(key) if key else None
+        return self.tasks.get(task_id) if task_id else None
+
+    def age(self, task: str, today: str = None) -> Optional[int]:
+        """Days since the task first appeared (None if never seen)."""
+        record = self.find(task)
+        if not record:
+            return None
+        return _days_between(record['first_seen'], today or datetime.now().strftime('%Y-%m-%d'))
+
+    def carried_days(self, task: str) -> int:
+        """Distinct days the task appeared unchecked."""
+        record = self.find(task)
+        return record['open_days'] if record else 0
+
+    def cycle_time(self, task: str) -> Optional[int]:
+        """Days from first sighting to being checked off (None if still open)."""
+        record = self.find(task)
+        if not record or not record['completed_on']:
+            return None
+        return _days_between(record['first_seen'], record['completed_on'])
+
+    def cycle_times(self) -> List[int]:
+        """Cycle time of every completed task, in days."""
+        return [
+            _days_between(t['first_seen'], t['completed_on'])
+            for t in self.tasks.values() if t['completed_on']
+        ]
+
+    def open_tasks(self) -> List[Dict]:
+        """Tasks whose latest sighting is unchecked."""
+        return [t for t in self.tasks.values() if not t['completed_on']]
+
+    def stale(self, min_carried_days: int = 5, today: str = None) -> List[Dict]:
+        """Open tasks carried for at least min_carried_days, oldest first.
+
+        Returns:
+            Dicts with text, first_seen, last_seen, carried_days and age_days
+        """
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        stale = [
+            {
+                'text': t['text'],
+                'first_seen': t['first_seen'],
+                'last_seen': t['last_seen'],
+                'carried_days': t['open_days'],
+                'age_days': _days_between(t['first_seen'], today),
+            }
+            for t in self.open_tasks() if t['open_days'] >= min_carried_days
+        ]
+        stale.sort(key=lambda t: t['first_seen'])
+        return stale
+
+
+if __name__ == "__main__":
+    import sys
+
+    lineage = TaskLineage(sys.argv[1] if len(sys.argv) > 1 else None)
+    cycle_times = sorted(lineage.cycle_times())
+
+    print(f"📋 {len(lineage.tasks)} tasks across {len(lineage.files)} dailies")
+    if cycle_times:
+        print(f"⏱️  Median cycle time: {cycle_times[len(cycle_times) // 2]} days ({len(cycle_times)} completed)")
+
+    stale = lineage.stale()
+    if stale:
+        print(f"\n🕸️  Stale carry-forwards ({len(stale)}):")
+        for task in stale[:10]:
+            print(f"  - {task['text'][:60]} — carried {task['carried_days']} days since {task['first_seen']}")
@@ -5,6 +5,11 @@ from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,7 @@ class TemplateProcessor:
 **Mood:** [How you're feeling]
 **Weather:** [If it affects your work]"""
 
+    @traced()
     def process_template(self, context: Dict[str, Any]) -> str:
         """Process template with provided context data."""
         content = self.template_content
@@ -0,0 +1,87 @@
+"""
+TF-IDF Index - sparse cosine-similarity lookup over short task texts
+
+Built once per run over carry-forwards, meeting actions and decision
+titles. Each document is a sparse, L2-normalized TF-IDF vector stored as
+an inverted index (term -> [(doc, weight), ...]), so a query only touches
+the postings of its own terms instead of comparing against every document:
+
+    index = TfidfIndex(["Review SPIF draft", "Send SPIF draft to Riley", ...])
+    index.similar("SPIF communication draft", k=5)   # [(doc_id, score), ...]
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+TOKEN = re.compile(r'[a-z0-9]{3,}')
+
+STOPWORDS = {
+    'and', 'the', 'for', 'with', 'from', 'about', 'this', 'that', 'into',
+    'our', 'are', 'was', 'will', 'can', 'has', 'have', 'not', 'but',
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (3+ characters, stopwords removed)."""
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class TfidfIndex:
+    """Sparse TF-IDF vectors with an inverted index for top-k cosine queries."""
+
+    def __init__(self, documents: Iterable[str]):
+        """Vectorize all documents.
+
+        Args:
+            documents: Texts to index; their positions are the doc ids
+        """
+        self.documents: List[str] = list(documents)
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.idf: Dict[str, float] = {}
+
+        token_lists = [tokenize(doc) for doc in self.documents]
+
+        doc_freq = Counter()
+        for tokens in token_lists:
+            doc_freq.update(set(tokens))
+
+        # Smoothed idf, as in scikit-learn: terms in every doc still count a little
+        total = len(self.documents)
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+        for doc_id, tokens in enumerate(token_lists):
+            for term, weight in self._weights(tokens).items():
+                self.postings.setdefault(term, []).append((doc_id, weight))
+
+    def _weights(self, tokens: List[str]) -> Dict[str, float]:
+        """L2-normalized tf-idf weights for a token list (unknown terms dropped)."""
+        weights = {term: count * self.idf[term] for term, count in Counter(tokens).items() if term in self.idf}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {term: w / norm for term, w in weights.items()} if norm else {}
+
+    def similar(self, text: str, k: int = 5, min_score: float = 0.0,
+                exclude: Iterable[int] = ()) -> List[Tuple[int, float]]:
+        """Top-k documents by cosine similarity to text.
+
+        Args:
+            text: Query text
+            k: Maximum results
+            min_score: Drop results scoring below this
+            exclude: Doc ids to skip (e.g. the query's own document)
+
+        Returns:
+            List of (doc_id, score), best first
+        """
+        scores: Dict[int, float] = {}
+        for term, query_weight in self._weights(tokenize(text)).items():
+            for doc_id, doc_weight in self.postings[term]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_weight * doc_weight
+
+        for doc_id in exclude:
+            scores.pop(doc_id, None)
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(doc_id, score) for doc_id, score in best if score >= min_score]
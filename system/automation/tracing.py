@@ -0,0 +1,175 @@
+"""
+Tracing - nested timing spans written as JSONL
+
+Wrap the steps worth timing in a span, either as a context manager or a
+decorator. Spans nest: each records its parent's id, so a run can be shown
+as a tree of where the time went.
+
+    from tracing import span, traced
+
+    @traced()                       # span named after the function
+    def find_week_files(...): ...
+
+    with span('archive.move', src=str(src)):
+        ...
+
+Tracing is off by default and a disabled span costs one flag check. Turn it
+on with enable() (``bradan --trace`` does this) or BRADAN_TRACE=<file>.
+Each finished span is appended to the trace file as one JSON line:
+
+    {"trace_id": "...", "span_id": 3, "parent_id": 1, "name": "extract_completed_tasks",
+     "start": 1731312000.12, "duration_ms": 4.2, "attrs": {...}}
+"""
+
+import contextvars
+import functools
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_enabled = False
+_trace_id = None
+_trace_file = None
+_next_id = 0
+_spans: List[Dict] = []
+_current: contextvars.ContextVar = contextvars.ContextVar('bradan_span', default=None)
+
+
+def enable(path: Optional[Path] = None) -> str:
+    """Start recording spans (to path as JSONL, if given).
+
+    Returns:
+        The trace id shared by every span of this run
+    """
+    global _enabled, _trace_id, _trace_file, _next_id, _spans
+    _enabled = True
+    _trace_id = uuid.uuid4().hex[:16]
+    _next_id = 0
+    _spans = []
+    if path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _trace_file = open(path, 'a', encoding='utf-8')
+    return _trace_id
+
+
+def disable() -> List[Dict]:
+    """Stop recording and close the trace file.
+
+    Returns:
+        The spans recorded since enable()
+    """
+    global _enabled, _trace_file
+    _enabled = False
+    if _trace_file:
+        _trace_file.close()
+        _trace_file = None
+    return _spans
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Time the enclosed block as a child of the current span."""
+    if not _enabled:
+        yield
+        return
+
+    global _next_id
+    _next_id += 1
+    span_id = _next_id
+    token = _current.set(span_id)
+    start_wall, start = time.time(), time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        attrs['error'] = type(e).__name__
+        raise
+    finally:
+        _current.reset(token)
+        record = {
+            'trace_id': _trace_id,
+            'span_id': span_id,
+            'parent_id': _current.get(),
+            'name': name,
+            'start': round(start_wall, 6),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+            'attrs': attrs,
+        }
+        _spans.append(record)
+        if _trace_file:
+            _trace_file.write(json.dumps(record, default=str) + '\n')
+            _trace_file.flush()
+
+
+def traced(name: str = None):
+    """Decorator: run the function inside a span (named after it by default)."""
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def load(path: Path) -> List[Dict]:
+    """Spans from a JSONL trace file."""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summary_tree(spans: List[Dict], min_ms: float = 0.0) -> str:
+    """Render spans as an indented tree.
+
+    Sibling spans with the same name are merged into one line with a call
+    count, so a loop over 200 files shows up as one 'x200' entry. Span ids
+    restart with every run, so spans are matched to their parents within
+    their own trace; the roots of several runs appended to one file merge
+    like any other siblings.
+
+    Args:
+        spans: Span records (from disable() or load())
+        min_ms: Hide merged entries faster than this
+
+    Returns:
+        Tree text, one line per merged span: total ms, share of the root, name
+    """
+    children: Dict[Tuple[str, Optional[int]], List[Dict]] = {}
+    for record in spans:
+        children.setdefault((record['trace_id'], record['parent_id']), []).append(record)
+
+    roots = [r for (_, parent_id), records in children.items() if parent_id is None for r in records]
+    total = sum(r['duration_ms'] for r in roots) or 1.0
+    lines = []
+
+    def render(records: List[Dict], depth: int) -> None:
+        merged: Dict[str, List[Dict]] = {}
+        for record in sorted(records, key=lambda r: r['start']):
+            merged.setdefault(record['name'], []).append(record)
+
+        for name, group in sorted(merged.items(), key=lambda item: -sum(r['duration_ms'] for r in item[1])):
+            duration = sum(r['duration_ms'] for r in group)
+            if duration < min_ms:
+                continue
+            count = f" x{len(group)}" if len(group) > 1 else ''
+            lines.append(f"{duration:9.1f} ms {duration / total:6.1%}  {'  ' * depth}{name}{count}")
+            render([child for r in group for child in children.get((r['trace_id'], r['span_id']), [])], depth + 1)
+
+    render(roots, 0)
+    return '\n'.join(lines)
+
+
+if os.environ.get('BRADAN_TRACE'):
+    enable(Path(os.environ['BRADAN_TRACE']))
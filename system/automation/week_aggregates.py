@@ -0,0 +1,192 @@
+"""
+Week Aggregates - compact per-week summaries stored once, read many times
+
+Each time a week is archived its highlights are folded into a small record
+(priorities, meeting count, open and completed follow-ups) and stored in
+``archive/week-aggregates.json`` keyed by the week's Monday:
+
+    {"2025-11-03": {"week_id": "2025-11-week-45", "priorities": [...],
+                    "priority_days": {...}, "meeting_count": 12,
+                    "follow_ups": [...], "follow_ups_done": [...],
+                    "days": 5}, ...}
+
+Consumers such as the rolling active context read the last N records
+instead of re-parsing older dailies, so adding a week costs the same no
+matter how much history exists.
+"""
+
+import json
+import os
+import sys
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import write_if_changed
+
+AGGREGATES_NAME = "week-aggregates.json"
+
+
+def build_week_aggregate(week_highlights: List[Dict], week_id: str = None) -> Dict[str, any]:
+    """Fold a week's daily highlights into one aggregate record.
+
+    Args:
+        week_highlights: Dicts from WeeklyArchival.extract_daily_highlights()
+        week_id: Archive folder id for the week (e.g. '2025-11-week-45')
+
+    Returns:
+        Aggregate dict
+    """
+    priority_days: Dict[str, int] = {}
+    follow_ups: List[str] = []
+    follow_ups_done: List[str] = []
+    meeting_count = 0
+    days = 0
+
+    for day in week_highlights:
+        if not day:
+            continue
+        days += 1
+        for priority in day.get('top_3', []):
+            priority_days[priority] = priority_days.get(priority, 0) + 1
+        meeting_count += len(day.get('meetings', []))
+        for follow_up in day.get('follow_ups', []):
+            if follow_up not in follow_ups:
+                follow_ups.append(follow_up)
+        # Ticked off later in the week: no longer open at week's end
+        for follow_up in day.get('follow_ups_done', []):
+            if follow_up in follow_ups:
+                follow_ups.remove(follow_up)
+            if follow_up not in follow_ups_done:
+                follow_ups_done.append(follow_up)
+
+    # Most-repeated priorities first; ties keep first-seen order
+    priorities = sorted(priority_days, key=lambda p: -priority_days[p])
+
+    return {
+        'week_id': week_id,
+        'priorities': priorities,
+        'priority_days': priority_days,
+        'meeting_count': meeting_count,
+        'follow_ups': follow_ups,
+        'follow_ups_done': follow_ups_done,
+        'days': days,
+    }
+
+
+class WeekAggregateStore:
+    """Week start ('YYYY-MM-DD', a Monday) -> aggregate record."""
+
+    def __init__(self, workspace_root: Path):
+        """Load the store for a workspace.
+
+        Args:
+            workspace_root: Project root; the store lives in archive/
+        """
+        self.workspace_root = Path(workspace_root)
+        self.path = self.workspace_root / "archive" / AGGREGATES_NAME
+        self.weeks: Dict[str, Dict[str, any]] = {}
+        self.order: List[str] = []
+        self.mtime_ns = None
+        self.load()
+
+    def load(self) -> None:
+        """Read the store from disk (empty if missing or unreadable)."""
+        self.weeks = {}
+        self.mtime_ns = None
+        if self.path.exists():
+            try:
+                self.weeks = json.loads(self.path.read_text())
+                self.mtime_ns = os.stat(self.path).st_mtime_ns
+            except (ValueError, OSError) as e:
+                print(f"⚠️  Week aggregates unreadable ({e}), starting empty")
+                self.weeks = {}
+        self.order = sorted(self.weeks)
+
+    def is_stale(self) -> bool:
+        """True if the store file changed since it was loaded."""
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime_ns
+        except FileNotFoundError:
+            return self.mtime_ns is not None
+
+    def put(self, week_start: str, aggregate: Dict[str, any]) -> Dict[str, any]:
+        """Add or update a week's record (fields are merged, not replaced)."""
+        if week_start not in self.weeks:
+            insort(self.order, week_start)
+            self.weeks[week_start] = {}
+        self.weeks[week_start].update(aggregate)
+        return self.weeks[week_start]
+
+    def get(self, week_start: str) -> Optional[Dict[str, any]]:
+        """Record for one week, or None."""
+        return self.weeks.get(week_start)
+
+    def recent(self, count: int, until: str = None, having: str = None) -> List[Dict[str, any]]:
+        """The `count` most recent weeks up to and including `until`, newest first.
+
+        Args:
+            count: Weeks to return
+            until: Latest week start to include (default: all)
+            having: Only weeks whose record has this field (e.g. 'priorities'
+                for archived weeks; rollups also cache records for weeks
+                that were never archived)
+
+        Each returned record carries its 'week_start'.
+        """
+        if count <= 0:
+            return []
+        end = len(self.order) if until is None else bisect_right(self.order, until)
+        if having is None:
+            keys = list(reversed(self.order[max(0, end - count):end]))
+        else:
+            keys = []
+            for k in reversed(self.order[:end]):
+                if having in self.weeks[k]:
+                    keys.append(k)
+                    if len(keys) == count:
+                        break
+        return [dict(self.weeks[k], week_start=k) for k in keys]
+
+    def between(self, start: str, end: str) -> List[Dict[str, any]]:
+        """Weeks whose Monday falls in [start, end], oldest first."""
+        keys = self.order[bisect_left(self.order, start):bisect_right(self.order, end)]
+        return [dict(self.weeks[k], week_start=k) for k in keys]
+
+    def to_json(self) -> str:
+        """Serialized store, as written by save()."""
+        return json.dumps(self.weeks, indent=2, sort_keys=True)
+
+    def save(self) -> None:
+        """Write the store atomically (skipped if nothing changed)."""
+        write_if_changed(self.path, self.to_json())
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+
+
+_stores: Dict[str, WeekAggregateStore] = {}
+
+
+def get_week_aggregates(workspace_root: Path) -> WeekAggregateStore:
+    """Shared WeekAggregateStore for a workspace, reloaded only if the file changed."""
+    key = str(Path(workspace_root).resolve())
+    store = _stores.get(key)
+
+    if store is None:
+        store = WeekAggregateStore(workspace_root)
+        _stores[key] = store
+    elif store.is_stale():
+        store.load()
+
+    return store
+
+
+def week_label(week_start: str) -> str:
+    """'Nov 03-07' style label for the Mon-Fri span of a week."""
+    monday = datetime.strptime(week_start, '%Y-%m-%d')
+    friday = monday + timedelta(days=4)
+    if friday.month != monday.month:
+        return f"{monday:%b %d}-{friday:%b %d}"
+    return f"{monday:%b %d}-{friday:%d}"
@@ -11,10 +11,18 @@ Extracts from:
 
 import os
 import re
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+import archive_bundles
+from archive_manifest import get_archive_manifest
+from date_index import get_date_index
+from tracing import traced
+
 class WeekExtractor:
     def __init__(self, base_dir: str = None):
         if base_dir:
@@ -29,6 +37,7 @@ class WeekExtractor:
         self.decisions_dir = self.base_dir / "reference" / "decisions"
         self.archive_dir = self.base_dir / "archive" / "daily"
     
+    @traced()
     def find_week_files(self, week_start: datetime) -> Dict[str, List[Path]]:
         """Find all files for a given week."""
         week_dates = [week_start + timedelta(days=i) for i in range(7)]
@@ -39,43 +48,42 @@ class WeekExtractor:
             'decisions': []
         }
         
+        # One scandir pass per directory; lookups below are dict hits
+        daily_index = get_date_index(self.daily_dir)
+        meetings_index = get_date_index(self.meetings_dir)
+        decisions_index = get_date_index(self.decisions_dir)
+        archive_manifest = get_archive_manifest(self.base_dir)
+        
         # Find daily files (check both daily/ and archive/)
         for date in week_dates:
             date_str = date.strftime('%Y-%m-%d')
             
             # Check daily folder first
-            daily_file = self.daily_dir / f"{date_str}.md"
-            if daily_file.exists():
-                files['dailies'].append(daily_file)
+            dailies = daily_index.for_day(date_str)
+            if dailies:
+                files['dailies'].extend(dailies)
             else:
-                # Check archive
-                week_num = date.isocalendar()[1]
-                archive_week = self.archive_dir / f"{date.year}-{date.month:02d}-week-{week_num}"
-                archived_file = archive_week / f"{date_str}.md"
-                if archived_file.exists():
-                    files['dailies'].append(archived_file)
+                # Check archive (manifest maintained by WeeklyArchival.archive_week)
+                files['dailies'].extend(archive_manifest.resolve(date_str))
         
         # Find meeting files for this week
-        for date in week_dates:
-            date_str = date.strftime('%Y-%m-%d')
-            for meeting_file in self.meetings_dir.glob(f"{date_str}-*.md"):
-                files['meetings'].append(meeting_file)
+        files['meetings'] = meetings_index.for_week(week_start)
         
-        # Find decision logs for this week
-        for date in week_dates:
-            date_str = date.strftime('%Y-%m')
-            for decision_file in self.decisions_dir.glob(f"{date_str}-*.md"):
-                files['decisions'].append(decision_file)
+        # Find decision logs for this week (named by month; a week spans at
+        # most two months, each looked up once)
+        for month in sorted({date.strftime('%Y-%m') for date in week_dates}):
+            files['decisions'].extend(decisions_index.for_month(month))
         
         return files
     
+    @traced()
     def extract_completed_tasks(self, daily_files: List[Path]) -> List[str]:
         """Extract completed tasks (checked checkboxes) from daily files."""
         completed = []
         
         for daily_file in daily_files:
             try:
-                content = daily_file.read_text()
+                content = archive_bundles.read_text(daily_file)
                 
                 # Find all completed tasks: - [x] or - [X]
                 pattern = r'^- \[x\] (.+)$'
@@ -101,13 +109,14 @@ class WeekExtractor:
         
         return unique_completed
     
+    @traced()
     def extract_incomplete_tasks(self, daily_files: List[Path]) -> List[str]:
         """Extract incomplete tasks (unchecked checkboxes) from daily files."""
         incomplete = []
         
         for daily_file in daily_files:
             try:
-                content = daily_file.read_text()
+                content = archive_bundles.read_text(daily_file)
                 
                 # Find all incomplete tasks: - [ ]
                 pattern = r'^- \[ \] (.+)$'
@@ -132,13 +141,14 @@ class WeekExtractor:
         
         return unique_incomplete
     
+    @traced()
     def extract_meeting_outcomes(self, meeting_files: List[Path]) -> List[Dict]:
         """Extract key decisions and action items from meeting files."""
         outcomes = []
         
         for meeting_file in meeting_files:
             try:
-                content = meeting_file.read_text()
+                content = archive_bundles.read_text(meeting_file)
                 
                 # Extract meeting title
                 title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
@@ -182,13 +192,14 @@ class WeekExtractor:
         
         return outcomes
     
+    @traced()
     def extract_decision_logs(self, decision_files: List[Path]) -> List[Dict]:
         """Extract decision logs created this week."""
         decisions = []
         
         for decision_file in decision_files:
             try:
-                content = decision_file.read_text()
+                content = archive_bundles.read_text(decision_file)
                 
                 # Extract title
                 title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
@@ -209,13 +220,14 @@ class WeekExtractor:
         
         return decisions
     
+    @traced()
     def extract_top3_priorities(self, daily_files: List[Path]) -> List[str]:
         """Extract Top 3 priorities from daily files to see patterns."""
         all_priorities = []
         
         for daily_file in daily_files:
             try:
-                content = daily_file.read_text()
+                content = archive_bundles.read_text(daily_file)
                 
                 # Find Top 3 section
                 top3_section = re.search(r'## 🔥 Top 3 Tasks Today(.+?)(?=##|\Z)', content, re.DOTALL)
@@ -236,6 +248,7 @@ class WeekExtractor:
         """Count meetings for the week."""
         return len(meeting_files)
     
+    @traced()
     def generate_week_data(self, week_start: datetime) -> Dict:
         """Generate all extracted data for a week."""
         print(f"Extracting data for week of {week_start.strftime('%Y-%m-%d')}...")
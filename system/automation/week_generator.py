@@ -5,22 +5,30 @@ Combines weekly plan + weekly summary + weekly review into ONE file
 that's 90% auto-populated from your actual work.
 """
 
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from week_extractor import extract_week_data
 from priority_recommender import PriorityRecommender
+from atomic_write import GeneratedFiles
+from workspace_lock import workspace_lock
 
 
-def generate_week_file(week_start_str: str, base_dir: str = None) -> dict:
+def generate_week_file(week_start_str: str, base_dir: str = None, calendar_events: list = None,
+                       force: bool = False) -> dict:
     """
     Generate a consolidated week file.
     
     Args:
         week_start_str: Monday date in YYYY-MM-DD format
         base_dir: Base directory (optional)
+        calendar_events: This week's calendar events from MCP (optional);
+            used to boost priorities tied to upcoming meetings
+        force: Overwrite the week file even if it was edited by hand
     
     Returns:
-        dict with file_path and data
+        dict with file_path, write_status ('written', 'unchanged' or
+        'edited' when hand edits were kept) and data
     """
     week_start = datetime.strptime(week_start_str, '%Y-%m-%d')
     week_end = week_start + timedelta(days=4)
@@ -39,40 +47,44 @@ def generate_week_file(week_start_str: str, base_dir: str = None) -> dict:
     filename = f"{week_start_str}-week-{week_num}.md"
     filepath = weeks_dir / filename
     
-    # Check if this is a new week (Monday setup) or end-of-week (Friday reflection)
-    today = datetime.now()
-    is_setup = today.weekday() == 0  # Monday
-    is_reflection = today.weekday() == 4  # Friday
-    
-    # Extract data from last week if this is Monday setup
-    if is_setup:
-        last_week_start = week_start - timedelta(days=7)
-        last_week_data = extract_week_data(last_week_start.strftime('%Y-%m-%d'))
-    else:
-        last_week_data = None
-    
-    # Extract data from this week if this is Friday or later
-    if is_reflection or today >= week_end:
-        this_week_data = extract_week_data(week_start_str)
-    else:
-        this_week_data = None
-    
-    # Generate the content
-    content = generate_week_content(
-        week_start=week_start,
-        week_end=week_end,
-        week_num=week_num,
-        last_week_data=last_week_data,
-        this_week_data=this_week_data,
-        is_setup=is_setup,
-        is_reflection=is_reflection
-    )
-    
-    # Write file
-    filepath.write_text(content)
+    # Archival moves the dailies this reads; wait for a running one to finish
+    with workspace_lock(base_path):
+        # Check if this is a new week (Monday setup) or end-of-week (Friday reflection)
+        today = datetime.now()
+        is_setup = today.weekday() == 0  # Monday
+        is_reflection = today.weekday() == 4  # Friday
+    
+        # Extract data from last week if this is Monday setup
+        if is_setup:
+            last_week_start = week_start - timedelta(days=7)
+            last_week_data = extract_week_data(last_week_start.strftime('%Y-%m-%d'))
+        else:
+            last_week_data = None
+    
+        # Extract data from this week if this is Friday or later
+        if is_reflection or today >= week_end:
+            this_week_data = extract_week_data(week_start_str)
+        else:
+            this_week_data = None
+    
+        # Generate the content
+        content = generate_week_content(
+            week_start=week_start,
+            week_end=week_end,
+            week_num=week_num,
+            last_week_data=last_week_data,
+            this_week_data=this_week_data,
+            is_setup=is_setup,
+            is_reflection=is_reflection,
+            calendar_events=calendar_events
+        )
+    
+        # Write file, unless it's unchanged or was edited since it was generated
+        write_status = GeneratedFiles(weeks_dir / ".generated.json").write(filepath, content, force=force)
     
     return {
         'file_path': str(filepath),
+        'write_status': write_status,
         'week_start': week_start_str,
         'week_end': week_end.strftime('%Y-%m-%d'),
         'last_week_data': last_week_data,
@@ -80,7 +92,8 @@ def generate_week_file(week_start_str: str, base_dir: str = None) -> dict:
     }
 
 
-def generate_week_content(week_start, week_end, week_num, last_week_data, this_week_data, is_setup, is_reflection):
+def generate_week_content(week_start, week_end, week_num, last_week_data, this_week_data, is_setup, is_reflection,
+                          calendar_events=None):
     """Generate the consolidated week file content."""
     
     week_start_str = week_start.strftime('%Y-%m-%d')
@@ -91,7 +104,7 @@ def generate_week_content(week_start, week_end, week_num, last_week_data, this_w
 
 **Week Number:** {week_num}  
 **Dates:** {week_start_str} to {week_end_str}  
-**Archive:** [[archive/daily/{week_start.year}-{week_start.month:02d}-week-{week_num}/]]
+**Archive:** [[archive/daily/{week_start.year}-{week_start.month:02d}-week-{week_num:02d}/]]
 
 ---
 
@@ -99,7 +112,7 @@ def generate_week_content(week_start, week_end, week_num, last_week_data, this_w
     
     # MONDAY SETUP SECTION (if generating on Monday)
     if is_setup and last_week_data:
-        content += generate_monday_setup(last_week_data)
+        content += generate_monday_setup(last_week_data, week_start, calendar_events)
     
     # WHAT ACTUALLY HAPPENED (if generating on Friday or later)
     if this_week_data:
@@ -111,7 +124,7 @@ def generate_week_content(week_start, week_end, week_num, last_week_data, this_w
     return content
 
 
-def generate_monday_setup(last_week_data):
+def generate_monday_setup(last_week_data, week_start=None, calendar_events=None):
     """Generate the Monday morning setup section."""
     
     section = """## 📋 Monday Setup (2 Minutes)
@@ -151,7 +164,17 @@ def generate_monday_setup(last_week_data):
     if all_carry_forwards:
         try:
             recommender = PriorityRecommender()
-            recommendations = recommender.recommend_top3(all_carry_forwards)
+            open_decisions = [
+                d['title'] for d in last_week_data['decision_logs']
+                if not re.search(r'decided|closed|done|approved', d['status'], re.IGNORECASE)
+            ]
+            recommendations = recommender.recommend_top3(
+                all_carry_forwards,
+                calendar_events=calendar_events,
+                pending_decisions=open_decisions,
+                meeting_actions=incomplete_actions,
+                now=max(datetime.now(), week_start) if week_start else None
+            )
             
             section += """### Your Top 3 Priorities This Week
 
@@ -335,8 +358,12 @@ def generate_reflection_section(is_filled):
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
-        week_start = sys.argv[1]
+    profile = '--profile' in sys.argv
+    force = '--force' in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg not in ('--profile', '--force')]
+    
+    if argv:
+        week_start = argv[0]
     else:
         # Default to current Monday
         today = datetime.now()
@@ -344,9 +371,16 @@ if __name__ == "__main__":
         monday = today - timedelta(days=days_since_monday)
         week_start = monday.strftime('%Y-%m-%d')
     
-    result = generate_week_file(week_start)
+    if profile:
+        from profiling import profile_call
+        result, _ = profile_call('week', generate_week_file, week_start, force=force)
+    else:
+        result = generate_week_file(week_start, force=force)
     
-    print(f"\n✅ Generated: {result['file_path']}")
+    if result['write_status'] == 'edited':
+        print(f"\n⚠️  Kept your edits: {result['file_path']} changed since it was generated (use --force to overwrite)")
+    else:
+        print(f"\n✅ Generated: {result['file_path']}")
     print(f"📅 Week: {result['week_start']} to {result['week_end']}")
     
     if result['last_week_data']:
@@ -14,19 +14,34 @@ Example:
 """
 
 import os
-import shutil
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
 import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import archive_bundles
+from archive_journal import ArchiveJournal
+from archive_manifest import get_archive_manifest
+from atomic_write import GeneratedFiles, content_hash, file_hash, write_if_changed
+from date_index import get_date_index
+from link_graph import get_link_graph
+from priority_patterns import get_priority_patterns
+from priority_recommender import PriorityRecommender
+from tracing import traced
+from week_aggregates import build_week_aggregate, get_week_aggregates, week_label
+from workspace_lock import workspace_lock
 
 
 class WeeklyArchival:
     """Manages weekly archival of daily files and context extraction"""
     
-    def __init__(self, workspace_root: str = None):
+    def __init__(self, workspace_root: str = None, context_weeks: int = 2):
         self.workspace_root = Path(workspace_root or os.getcwd())
+        self.context_weeks = context_weeks  # Weeks shown in active-context.md
         self.daily_dir = self.workspace_root / "work" / "daily"
         self.archive_dir = self.workspace_root / "archive" / "daily"
         self.reviews_dir = self.workspace_root / "work" / "weeks"  # Now uses consolidated weeks
@@ -53,29 +68,12 @@ class WeeklyArchival:
     
     def find_daily_files_for_week(self, week_start: datetime) -> List[Path]:
         """Find all daily files for a given week (Mon-Fri)"""
-        daily_files = []
-        
-        for i in range(7):  # Check all 7 days
-            day = week_start + timedelta(days=i)
-            date_str = day.strftime("%Y-%m-%d")
-            
-            # Check for both possible formats
-            file_patterns = [
-                self.daily_dir / f"{date_str}.md",
-                self.daily_dir / f"{date_str}-*.md"  # Handle files like 2025-11-05-tuesday.md
-            ]
-            
-            for pattern in file_patterns:
-                if '*' in str(pattern):
-                    # Use glob for wildcard patterns
-                    for file in self.daily_dir.glob(pattern.name):
-                        if file.is_file():
-                            daily_files.append(file)
-                elif pattern.exists():
-                    daily_files.append(pattern)
-        
-        return sorted(set(daily_files))  # Remove duplicates and sort
+        # One scandir pass shared across lookups; matches both YYYY-MM-DD.md
+        # and YYYY-MM-DD-*.md (e.g. 2025-11-05-tuesday.md)
+        index = get_date_index(self.daily_dir)
+        return sorted(set(index.for_week(week_start)))
     
+    @traced()
     def extract_daily_highlights(self, daily_file: Path) -> Dict[str, any]:
         """Extract key information from a daily file"""
         if not daily_file.exists():
@@ -96,7 +94,8 @@ class WeeklyArchival:
             'top_3': [],
             'meetings': [],
             'key_updates': [],
-            'follow_ups': []
+            'follow_ups': [],
+            'follow_ups_done': []
         }
         
         # Extract Top 3 priorities
@@ -125,6 +124,7 @@ class WeeklyArchival:
         if followup_section:
             bullets = re.findall(r'^-\s+\[\s*\]\s+(.+)$', followup_section.group(1), re.MULTILINE)
             highlights['follow_ups'] = bullets[:5]  # Top 5 follow-ups
+            highlights['follow_ups_done'] = re.findall(r'^-\s+\[[xX]\]\s+(.+)$', followup_section.group(1), re.MULTILINE)
         
         return highlights
     
@@ -159,18 +159,50 @@ class WeeklyArchival:
                 for update in day['key_updates'][:2]:  # Top 2 updates
                     section += f"- {update}\n"
             
-            section += f"\n**Daily File:** [[archive/daily/{self.get_week_identifier(datetime.strptime(day['date'], '%Y-%m-%d'))}/{day['file']}]]\n"
+            section += f"\n**Daily File:** [[{self.archived_daily_path(day['date'], day['file'])}]]\n"
             section += "\n---\n\n"
         
         return section
     
-    def archive_week(self, week_start: datetime, dry_run: bool = False) -> Dict:
+    def archived_daily_path(self, date_str: str, filename: str) -> str:
+        """Workspace-relative archive path for a daily file.
+        
+        Resolved through the archive manifest; falls back to the folder
+        archive_week() would use (keyed by the week's Monday) for files that
+        haven't been archived yet.
+        """
+        archived = get_archive_manifest(self.workspace_root).resolve_one(date_str, filename)
+        if archived:
+            return str(archived.relative_to(self.workspace_root))
+        
+        day = datetime.strptime(date_str, '%Y-%m-%d')
+        monday = day - timedelta(days=day.weekday())
+        return f"archive/daily/{self.get_week_identifier(monday)}/{filename}"
+    
+    def recover_archive(self, mode: str = 'replay') -> Dict[str, any]:
+        """
+        Finish or undo an archival run that was interrupted mid-commit.
+        
+        Args:
+            mode: 'replay' to complete the planned moves and writes, or
+                'rollback' to restore the workspace to its pre-archive state
+        
+        Returns:
+            Dict describing what recovery did ('recovered': False if nothing was pending)
+        """
+        return ArchiveJournal(self.workspace_root).recover(mode)
+    
+    @traced()
+    def archive_week(self, week_start: datetime, dry_run: bool = False,
+                     journal: Optional[ArchiveJournal] = None) -> Dict:
         """
         Archive a week's daily files and extract highlights
         
         Args:
             week_start: Start date of the week (Monday)
             dry_run: If True, don't actually move files, just report what would happen
+            journal: Journal to plan the moves in; the caller commits it. If
+                omitted, the moves are committed before returning.
         
         Returns:
             Dict with archive summary
@@ -195,23 +227,33 @@ class WeeklyArchival:
             if highlights:
                 week_highlights.append(highlights)
         
-        # Create archive directory
-        if not dry_run:
-            week_archive_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Move files to archive
+        # Plan moves to archive (applied together when the journal commits)
         archived_files = []
+        manifest = get_archive_manifest(self.workspace_root)
+        own_journal = journal is None and not dry_run
+        if own_journal:
+            journal = ArchiveJournal(self.workspace_root)
+        
         for daily_file in daily_files:
             dest = week_archive_dir / daily_file.name
             
             if dry_run:
                 archived_files.append(str(daily_file.relative_to(self.workspace_root)))
             else:
-                shutil.move(str(daily_file), str(dest))
+                journal.add_move(daily_file, dest)
+                manifest.record(daily_file.name[:10], dest)
                 archived_files.append(str(dest.relative_to(self.workspace_root)))
         
+        if not dry_run:
+            journal.add_write(manifest.path, manifest.to_json())
+        links_updated = None
+        if own_journal:
+            links_updated = self.update_links(journal)
+            journal.commit()
+        
         return {
             'success': True,
+            'links_updated': links_updated,
             'week_id': week_id,
             'week_start': week_start.strftime("%Y-%m-%d"),
             'week_end': (week_start + timedelta(days=6)).strftime("%Y-%m-%d"),
@@ -262,96 +304,254 @@ class WeeklyArchival:
         
         return content
     
-    def update_active_context(self, week_highlights: List[Dict], week_start: datetime):
-        """Update the rolling 2-week active context window"""
-        context_file = self.context_dir / "active-context.md"
-        
-        # Generate current week summary
-        current_week_content = f"## Current Week ({week_start.strftime('%b %d-%d')})\n\n"
+    @traced()
+    def update_active_context(self, week_highlights: List[Dict], week_start: datetime,
+                              journal: Optional[ArchiveJournal] = None,
+                              window_weeks: Optional[int] = None):
+        """
+        Update the rolling N-week active context window.
         
-        # Extract top priorities from highlights
-        all_priorities = []
-        all_meetings = []
+        Only this week's highlights are parsed; they are stored as a week
+        aggregate and earlier weeks come from stored aggregates, so the cost
+        doesn't grow with history.
         
-        for day in week_highlights:
-            if day and day.get('top_3'):
-                all_priorities.extend(day['top_3'])
-            if day and day.get('meetings'):
-                all_meetings.extend([m['title'] for m in day['meetings']])
+        Args:
+            week_highlights: Highlights for the week being archived
+            week_start: Monday of that week
+            journal: Journal to plan the writes in (written directly if omitted)
+            window_weeks: Weeks to show (defaults to self.context_weeks)
         
-        # Deduplicate priorities
-        unique_priorities = list(dict.fromkeys(all_priorities))[:5]
+        Returns:
+            Workspace-relative path of the context file
+        """
+        context_file = self.context_dir / "active-context.md"
+        window_weeks = window_weeks or self.context_weeks
+        week_key = week_start.strftime('%Y-%m-%d')
         
-        current_week_content += "**Top Priorities:**\n"
-        for priority in unique_priorities:
-            current_week_content += f"- {priority}\n"
+        store = get_week_aggregates(self.workspace_root)
+        store.put(week_key, build_week_aggregate(week_highlights, self.get_week_identifier(week_start)))
+        window = store.recent(window_weeks, until=week_key, having='priorities')
         
-        current_week_content += f"\n**Meeting Activity:** {len(all_meetings)} meetings this week\n"
+        content = f"# Active Context - Last Updated: {datetime.now().strftime('%Y-%m-%d')}\n\n"
+        content += f"_Rolling {window_weeks}-week window_\n\n"
         
-        # Create or update context file
-        if context_file.exists():
-            # Read existing, shift current week to previous week
-            existing = context_file.read_text()
+        for position, week in enumerate(window):
+            if position == 0:
+                content += f"## Current Week ({week_label(week['week_start'])})\n\n"
+                priorities = week['priorities'][:5]
+            else:
+                if position == 1:
+                    content += "## Previous Weeks\n\n"
+                content += f"### Week of {week_label(week['week_start'])}\n\n"
+                priorities = week['priorities'][:3]
             
-            # Extract current week section and move to previous week
-            # This is a simplified version - would need more sophisticated parsing
-            content = f"# Active Context - Last Updated: {datetime.now().strftime('%Y-%m-%d')}\n\n"
-            content += current_week_content
-            content += "\n## Previous Week\n"
-            content += "[See previous week's review for details]\n"
+            content += "**Top Priorities:**\n"
+            for priority in priorities:
+                content += f"- {priority}\n"
+            
+            content += f"\n**Meeting Activity:** {week['meeting_count']} meetings"
+            content += " this week\n" if position == 0 else "\n"
+            
+            if position > 0:
+                monday = datetime.strptime(week['week_start'], '%Y-%m-%d')
+                review = self.reviews_dir / f"{week['week_start']}-week-{self.get_week_number(monday):02d}.md"
+                content += f"**Review:** [[{review.relative_to(self.workspace_root)}]]\n"
+            content += "\n"
+        
+        # Follow-ups still open in the window, oldest sighting first; one
+        # ticked off in a later week is closed
+        open_follow_ups = {}
+        for week in reversed(window):
+            for follow_up in week.get('follow_ups_done', []):
+                open_follow_ups.pop(follow_up, None)
+            for follow_up in week['follow_ups']:
+                open_follow_ups.setdefault(follow_up, week['week_start'])
+        if open_follow_ups:
+            content += "## Open Follow-Ups\n\n"
+            for follow_up, since in open_follow_ups.items():
+                content += f"- [ ] {follow_up} _(since {week_label(since)[:6]})_\n"
+            content += "\n"
+        
+        # Priorities that recur across weeks are the strategic threads
+        week_counts = {}
+        for week in window:
+            for priority in week['priorities']:
+                week_counts[priority] = week_counts.get(priority, 0) + 1
+        threads = [p for p, count in sorted(week_counts.items(), key=lambda item: -item[1]) if count > 1]
+        if threads:
+            content += "## Strategic Threads\n\n"
+            for priority in threads:
+                content += f"- {priority} ({week_counts[priority]} of {len(window)} weeks)\n"
+        
+        if journal:
+            journal.add_write(store.path, store.to_json())
+            journal.add_write(context_file, content)
         else:
-            content = f"# Active Context - Last Updated: {datetime.now().strftime('%Y-%m-%d')}\n\n"
-            content += current_week_content
-        
-        context_file.write_text(content)
+            store.save()
+            write_if_changed(context_file, content)
         
         return str(context_file.relative_to(self.workspace_root))
     
-    def archive_old_meetings(self, days_old: int = 30) -> Dict[str, any]:
+    @traced()
+    def learn_priority_patterns(self, week_highlights: List[Dict], week_start: datetime,
+                                journal: Optional[ArchiveJournal] = None) -> bool:
+        """
+        Fold this week's priorities into the learned priority-pattern model.
+        
+        Args:
+            week_highlights: Highlights for the week being archived
+            week_start: Monday of that week
+            journal: Journal to plan the write in (written directly if omitted)
+        
+        Returns:
+            False if the week had already been learned
+        """
+        priority_days = build_week_aggregate(week_highlights)['priority_days']
+        scored = PriorityRecommender(str(self.workspace_root)).score_tasks(list(priority_days))
+        
+        patterns = get_priority_patterns(self.workspace_root)
+        learned = patterns.fold_week(
+            week_start.strftime('%Y-%m-%d'),
+            [(s['task'], s['category'], priority_days[s['task']]) for s in scored]
+        )
+        
+        if learned:
+            if journal:
+                journal.add_write(patterns.path, patterns.to_json())
+            else:
+                patterns.save()
+        return learned
+    
+    @traced()
+    def archive_old_meetings(self, days_old: int = 30,
+                             journal: Optional[ArchiveJournal] = None) -> Dict[str, any]:
         """
         Archive meetings older than specified days.
         
         Args:
             days_old: Archive meetings older than this many days (default: 30)
+            journal: Journal to plan the moves in; the caller commits it. If
+                omitted, the moves are committed before returning.
             
         Returns:
             Dictionary with stats and archived file paths
         """
         cutoff_date = datetime.now() - timedelta(days=days_old)
         archived_files = []
+        own_journal = journal is None
+        if own_journal:
+            journal = ArchiveJournal(self.workspace_root)
         
         # Find all dated meeting files in main meetings dir
-        for meeting_file in self.meetings_dir.glob("????-??-??-*.md"):
-            # Skip templates
-            if "template" in meeting_file.name.lower():
-                continue
-                
-            # Extract date from filename
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})', meeting_file.name)
-            if not date_match:
+        index = get_date_index(self.meetings_dir)
+        for date_str, meeting_files in sorted(index.dated_files().items()):
+            meeting_date = datetime.strptime(date_str, "%Y-%m-%d")
+            if meeting_date >= cutoff_date:
                 continue
-                
-            meeting_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
             
-            if meeting_date < cutoff_date:
+            for meeting_file in list(meeting_files):
+                # Skip templates and bare daily-style names
+                if "template" in meeting_file.name.lower() or meeting_file.name == f"{date_str}.md":
+                    continue
+                
                 # Archive by month
                 archive_month_dir = self.meetings_archive_dir / meeting_date.strftime("%Y-%m")
-                archive_month_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Move file
+                # Plan move
                 dest = archive_month_dir / meeting_file.name
-                shutil.move(str(meeting_file), str(dest))
+                journal.add_move(meeting_file, dest)
                 archived_files.append(str(dest))
         
+        links_updated = None
+        if own_journal:
+            links_updated = self.update_links(journal)
+            journal.commit()
+        
         return {
             "archived_count": len(archived_files),
+            "links_updated": links_updated,
             "archived_files": archived_files,
             "cutoff_date": cutoff_date.strftime("%Y-%m-%d")
         }
+    
+    @traced()
+    def update_links(self, journal: ArchiveJournal) -> Dict[str, any]:
+        """
+        Plan rewrites of the links that the journal's moves would break.
+        
+        The backlink index says which files link to a moved file, so only
+        those are read, and each gets one write however many of its links
+        change. The writes run ahead of the moves, at the files' current
+        paths, so a daily that is itself being archived is fixed before it
+        moves. Files this run already writes (review, active context) are
+        left to that write.
+        
+        Args:
+            journal: Journal with the planned moves; the caller commits it
+        
+        Returns:
+            Dict with the number of files and links rewritten, and referrers
+            inside archive bundles that couldn't be
+        """
+        moves = [(op['src'], op['dst']) for op in journal.operations if op['op'] == 'move']
+        if not moves:
+            return {'files': 0, 'links': 0, 'packed': []}
+        
+        graph = get_link_graph(self.workspace_root)
+        plan = graph.plan_moves(moves)
+        planned_writes = {graph.rel(op['path']) for op in journal.operations if op['op'] == 'write'}
+        
+        files = links = 0
+        for referrer, rewrite in plan['rewrites'].items():
+            if referrer in planned_writes:
+                continue
+            journal.add_write(self.workspace_root / referrer, rewrite['content'], before_moves=True)
+            files += 1
+            links += rewrite['links']
+        
+        return {'files': files, 'links': links, 'packed': plan['packed']}
+    
+    def compact_archives(self, keep_months: int = 3, dry_run: bool = False) -> Dict[str, any]:
+        """
+        Pack archived months into one compressed bundle per month.
+        
+        Months newer than keep_months stay as loose files so recent weeks
+        remain easy to browse and edit. Packed files stay readable by name
+        through archive_bundles.read_text().
+        
+        Args:
+            keep_months: Number of most recent months to leave loose
+            dry_run: If True, only report which months would be packed
+            
+        Returns:
+            Dictionary with packed bundles and file counts
+        """
+        today = datetime.now()
+        cutoff_index = today.year * 12 + today.month - 1 - keep_months
+        cutoff = f"{cutoff_index // 12:04d}-{cutoff_index % 12 + 1:02d}"
+        
+        bundles = []
+        for archive_root in (self.archive_dir, self.meetings_archive_dir):
+            for month in archive_bundles.loose_months(archive_root):
+                if month > cutoff:
+                    continue
+                
+                if dry_run:
+                    bundles.append({'bundle': str(archive_root / f"{month}.zip"), 'files_packed': 0})
+                else:
+                    bundles.append(archive_bundles.pack_month(archive_root, month))
+        
+        return {
+            'bundles': bundles,
+            'files_packed': sum(b['files_packed'] for b in bundles),
+            'cutoff_month': cutoff,
+            'dry_run': dry_run
+        }
 
 
 def archive_week_command(week_start_str: str, dry_run: bool = False, 
-                        weekly_summary_path: Optional[str] = None) -> Dict:
+                        weekly_summary_path: Optional[str] = None,
+                        context_weeks: int = 2) -> Dict:
     """
     Command-line interface for weekly archival
     
@@ -359,10 +559,13 @@ def archive_week_command(week_start_str: str, dry_run: bool = False,
         week_start_str: Date string in YYYY-MM-DD format (Monday of week to archive)
         dry_run: If True, show what would happen without actually moving files
         weekly_summary_path: Optional path to weekly summary file
+        context_weeks: Weeks kept in the rolling active context
     
     Returns:
         Dict with archival results
     """
+    journal = None
+    archival = None
     try:
         week_start = datetime.strptime(week_start_str, "%Y-%m-%d")
         
@@ -371,36 +574,72 @@ def archive_week_command(week_start_str: str, dry_run: bool = False,
             # Adjust to the Monday of that week
             week_start = week_start - timedelta(days=week_start.weekday())
         
-        archival = WeeklyArchival()
-        
-        # Archive the week
-        result = archival.archive_week(week_start, dry_run=dry_run)
-        
-        if result['success']:
-            # Generate enhanced weekly review
-            review_content = archival.generate_enhanced_weekly_review(
-                week_start, 
-                result['highlights'],
-                weekly_summary_path
-            )
+        archival = WeeklyArchival(context_weeks=context_weeks)
+        
+        # One archival or week generation at a time per workspace (re-entrant,
+        # so scheduled runs that already hold it don't wait on themselves)
+        with workspace_lock(archival.workspace_root):
+            # Finish any archival run that crashed mid-commit before starting a new one
+            recovery = archival.recover_archive() if not dry_run else {'recovered': False}
+        
+            # Plan every move and write of this run in one journal so it applies all-or-nothing
+            journal = ArchiveJournal(archival.workspace_root)
+        
+            # Archive the week
+            result = archival.archive_week(week_start, dry_run=dry_run, journal=journal)
+            if recovery['recovered']:
+                result['recovery'] = recovery
+        
+            if result['success']:
+                # Generate enhanced weekly review
+                review_content = archival.generate_enhanced_weekly_review(
+                    week_start, 
+                    result['highlights'],
+                    weekly_summary_path
+                )
             
-            # Save enhanced review
-            if not dry_run:
-                review_file = archival.reviews_dir / f"{week_start.strftime('%Y-%m-%d')}-week-{archival.get_week_number(week_start):02d}.md"
-                review_file.write_text(review_content)
-                result['review_file'] = str(review_file.relative_to(archival.workspace_root))
+                # Save enhanced review
+                if not dry_run:
+                    review_file = archival.reviews_dir / f"{week_start.strftime('%Y-%m-%d')}-week-{archival.get_week_number(week_start):02d}.md"
+                    result['review_file'] = str(review_file.relative_to(archival.workspace_root))
+                
+                    # Keep a week file that was edited by hand since it was generated
+                    generated = GeneratedFiles(archival.reviews_dir / ".generated.json")
+                    unchanged = file_hash(review_file) == content_hash(review_content)
+                    if generated.is_edited(review_file) and not unchanged:
+                        result['review_status'] = 'edited'
+                    else:
+                        journal.add_write(review_file, review_content)
+                        if generated.record(review_file, review_content):
+                            journal.add_write(generated.state_path, generated.to_json())
+                        result['review_status'] = 'unchanged' if unchanged else 'written'
+                
+                    # Update active context
+                    context_file = archival.update_active_context(result['highlights'], week_start, journal=journal)
+                    result['context_updated'] = context_file
+                    result['patterns_learned'] = archival.learn_priority_patterns(result['highlights'], week_start, journal=journal)
                 
-                # Update active context
-                context_file = archival.update_active_context(result['highlights'], week_start)
-                result['context_updated'] = context_file
+                    # Archive old meetings (>30 days)
+                    meeting_stats = archival.archive_old_meetings(days_old=30, journal=journal)
+                    result['meetings_archived'] = meeting_stats
                 
-                # Archive old meetings (>30 days)
-                meeting_stats = archival.archive_old_meetings(days_old=30)
-                result['meetings_archived'] = meeting_stats
+                    # Point links at the new locations: one write per referring file
+                    result['links_updated'] = archival.update_links(journal)
+                
+                    # Apply everything: journal first, then os.replace per operation
+                    result['operations_committed'] = journal.commit()
         
-        return result
+            return result
         
     except Exception as e:
+        # Drop staged files of a plan that never committed, and the
+        # manifest/aggregate entries it recorded in memory
+        if journal:
+            journal.discard()
+        if archival:
+            get_archive_manifest(archival.workspace_root).load()
+            get_week_aggregates(archival.workspace_root).load()
+            get_priority_patterns(archival.workspace_root).load()
         return {
             'success': False,
             'error': str(e)
@@ -411,13 +650,36 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='Archive weekly daily files')
-    parser.add_argument('--week-start', required=True, help='Week start date (YYYY-MM-DD, Monday)')
+    parser.add_argument('--week-start', help='Week start date (YYYY-MM-DD, Monday)')
     parser.add_argument('--dry-run', action='store_true', help='Show what would happen without moving files')
     parser.add_argument('--weekly-summary', help='Path to weekly summary file')
+    parser.add_argument('--compact', type=int, metavar='KEEP_MONTHS',
+                        help='Also pack archive months older than KEEP_MONTHS into bundles')
+    parser.add_argument('--context-weeks', type=int, default=2,
+                        help='Weeks kept in the rolling active context (default: 2)')
+    parser.add_argument('--recover', choices=['replay', 'rollback'],
+                        help='Only recover an interrupted archival run, then exit')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write a cProfile/tracemalloc report to automation/profiles/')
     
     args = parser.parse_args()
     
-    result = archive_week_command(args.week_start, args.dry_run, args.weekly_summary)
+    if args.recover:
+        print(json.dumps(WeeklyArchival().recover_archive(args.recover), indent=2))
+        raise SystemExit(0)
+    
+    if not args.week_start:
+        parser.error('--week-start is required unless --recover is given')
+    
+    if args.profile:
+        from profiling import profile_call
+        result, _ = profile_call('archive', archive_week_command, args.week_start, args.dry_run,
+                                 args.weekly_summary, args.context_weeks)
+    else:
+        result = archive_week_command(args.week_start, args.dry_run, args.weekly_summary, args.context_weeks)
+    
+    if args.compact is not None:
+        result['compaction'] = WeeklyArchival().compact_archives(args.compact, dry_run=args.dry_run)
     
     print(json.dumps(result, indent=2))
 
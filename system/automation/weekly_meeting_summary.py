@@ -17,17 +17,10 @@ import re
 # Add the automation directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import PROJECT_ROOT, LOG_FILE, LOG_LEVEL
+from config import PROJECT_ROOT, setup_logging
+from tracing import span
 
-# Set up logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Logging is configured by setup_logging() when an entry point runs
 logger = logging.getLogger(__name__)
 
 
@@ -86,14 +79,15 @@ class WeeklyMeetingSummaryGenerator:
         
         try:
             # Use MCP to search Google Drive
-            result = subprocess.run(
-                ['npx', '-y', '@modelcontextprotocol/inspector', 'call-tool', 
-                 'gworkspace-mcp', 'search_drive', 
-                 json.dumps({'query': query, 'orderBy': 'modifiedTime desc'})],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with span('mcp.search_drive'):
+                result = subprocess.run(
+                    ['npx', '-y', '@modelcontextprotocol/inspector', 'call-tool', 
+                     'gworkspace-mcp', 'search_drive', 
+                     json.dumps({'query': query, 'orderBy': 'modifiedTime desc'})],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
             
             if result.returncode != 0:
                 logger.error(f"Error searching Drive: {result.stderr}")
@@ -120,14 +114,15 @@ class WeeklyMeetingSummaryGenerator:
             Dictionary with meeting note content
         """
         try:
-            result = subprocess.run(
-                ['npx', '-y', '@modelcontextprotocol/inspector', 'call-tool',
-                 'gworkspace-mcp', 'read_file',
-                 json.dumps({'file_id': file_id, 'format': 'markdown'})],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with span('mcp.read_file', file_id=file_id):
+                result = subprocess.run(
+                    ['npx', '-y', '@modelcontextprotocol/inspector', 'call-tool',
+                     'gworkspace-mcp', 'read_file',
+                     json.dumps({'file_id': file_id, 'format': 'markdown'})],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
             
             if result.returncode != 0:
                 logger.error(f"Error reading file {file_id}: {result.stderr}")
@@ -401,21 +396,28 @@ class WeeklyMeetingSummaryGenerator:
 
 def main():
     """Main entry point."""
+    setup_logging()
     logger.info("Starting weekly meeting summary generation")
     
     # Parse command line arguments
+    profile = '--profile' in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg != '--profile']
     weeks_back = 1
-    if len(sys.argv) > 1:
+    if argv:
         try:
-            weeks_back = int(sys.argv[1])
+            weeks_back = int(argv[0])
             logger.info(f"Generating summary for the last {weeks_back} week(s)")
         except ValueError:
-            logger.error(f"Invalid weeks_back value: {sys.argv[1]}. Must be an integer.")
+            logger.error(f"Invalid weeks_back value: {argv[0]}. Must be an integer.")
             sys.exit(1)
     
     # Generate the summary
     generator = WeeklyMeetingSummaryGenerator()
-    summary_path = generator.generate_summary(weeks_back)
+    if profile:
+        from profiling import profile_call
+        summary_path, _ = profile_call('summary', generator.generate_summary, weeks_back)
+    else:
+        summary_path = generator.generate_summary(weeks_back)
     
     if summary_path:
         logger.info(f"✅ Weekly summary successfully generated: {summary_path}")
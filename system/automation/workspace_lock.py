@@ -0,0 +1,89 @@
+"""
+Workspace Lock - one writer at a time across the workspace
+
+Archival moves dailies and meeting notes while week generation reads them,
+and both can be started by the scheduler, by hand or through the warm
+server. Each takes the workspace lock (an flock on
+``automation/workspace.lock``) for the whole run, so a second run waits for
+the first instead of racing it.
+
+The lock is re-entrant within a process: the scheduler holds it for a tick
+and the archive and week jobs it runs in-process take it again without
+blocking on themselves.
+
+    with workspace_lock(workspace_root):
+        ...
+"""
+
+import fcntl
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+LOCK_NAME = "workspace.lock"
+
+# Lock file (resolved) -> [fd, holds] for locks this process holds
+_held: Dict[str, List[int]] = {}
+_held_guard = threading.Lock()
+
+
+class WorkspaceLock:
+    """Exclusive advisory lock (flock) held for the duration of a run."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._holds = 0
+
+    def _key(self) -> str:
+        return str(self.path.resolve())
+
+    def acquire(self, blocking: bool = True) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        key = self._key()
+        with _held_guard:
+            if key in _held:
+                _held[key][1] += 1
+                self._holds += 1
+                return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+
+        with _held_guard:
+            _held[key] = [fd, 1]
+        self._holds += 1
+        return True
+
+    def release(self) -> None:
+        if not self._holds:
+            return
+        self._holds -= 1
+        with _held_guard:
+            held = _held.get(self._key())
+            if not held:
+                return
+            held[1] -= 1
+            if held[1]:
+                return
+            del _held[self._key()]
+        fcntl.flock(held[0], fcntl.LOCK_UN)
+        os.close(held[0])
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def workspace_lock(workspace_root: Path) -> WorkspaceLock:
+    """The lock for a workspace (``<root>/automation/workspace.lock``)."""
+    return WorkspaceLock(Path(workspace_root) / "automation" / LOCK_NAME)
@@ -0,0 +1,7 @@
+"""Put system/automation on sys.path, the way the automation scripts import each other."""
+
+import sys
+from pathlib import Path
+
+AUTOMATION_DIR = Path(__file__).resolve().parent.parent / "system" / "automation"
+sys.path.insert(0, str(AUTOMATION_DIR))
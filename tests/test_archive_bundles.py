@@ -0,0 +1,37 @@
+"""Tests for month bundles of archived markdown."""
+
+import archive_bundles
+
+
+def test_pack_month_packs_markdown_and_keeps_other_files(tmp_path):
+    week = tmp_path / '2025-11-week-45'
+    week.mkdir()
+    (week / '2025-11-05.md').write_text('daily')
+    (week / 'diagram.png').write_bytes(b'\x89PNG')
+    done = tmp_path / '2025-11-week-46'
+    done.mkdir()
+    (done / '2025-11-12.md').write_text('later')
+
+    result = archive_bundles.pack_month(tmp_path, '2025-11')
+
+    assert result['files_packed'] == 2
+    assert (week / 'diagram.png').exists()
+    assert not (week / '2025-11-05.md').exists()
+    assert not done.exists()
+    assert archive_bundles.read_text(week / '2025-11-05.md') == 'daily'
+    assert archive_bundles.exists(done / '2025-11-12.md')
+
+
+def test_pack_month_merges_with_existing_bundle(tmp_path):
+    week = tmp_path / '2025-11-week-45'
+    week.mkdir()
+    (week / '2025-11-05.md').write_text('first')
+    archive_bundles.pack_month(tmp_path, '2025-11')
+
+    week.mkdir()
+    (week / '2025-11-06.md').write_text('second')
+    archive_bundles.pack_month(tmp_path, '2025-11')
+
+    assert archive_bundles.read_text(week / '2025-11-05.md') == 'first'
+    assert archive_bundles.read_text(week / '2025-11-06.md') == 'second'
+    assert archive_bundles.loose_months(tmp_path) == []
@@ -0,0 +1,98 @@
+"""Tests for the crash-safe archive journal."""
+
+import pytest
+
+from archive_journal import ArchiveJournal
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / 'work' / 'daily').mkdir(parents=True)
+    (tmp_path / 'work' / 'daily' / '2025-11-10.md').write_text('monday')
+    (tmp_path / 'work' / 'context.md').write_text('old context')
+    return tmp_path
+
+
+def _plan(root):
+    journal = ArchiveJournal(root)
+    journal.add_move(root / 'work' / 'daily' / '2025-11-10.md', root / 'archive' / 'daily' / '2025-11-10.md')
+    journal.add_write(root / 'work' / 'context.md', 'new context')
+    journal.add_write(root / 'work' / 'weeks' / 'review.md', 'review')
+    return journal
+
+
+def _crash_after(monkeypatch, count):
+    real_apply = ArchiveJournal._apply
+    applied = []
+
+    def apply(self, operation):
+        if len(applied) == count:
+            raise Crash()
+        real_apply(self, operation)
+        applied.append(operation)
+
+    monkeypatch.setattr(ArchiveJournal, '_apply', apply)
+
+
+def test_commit_applies_everything_and_cleans_up(workspace):
+    assert _plan(workspace).commit() == 3
+
+    assert (workspace / 'archive' / 'daily' / '2025-11-10.md').read_text() == 'monday'
+    assert (workspace / 'work' / 'context.md').read_text() == 'new context'
+    assert (workspace / 'work' / 'weeks' / 'review.md').read_text() == 'review'
+    assert sorted(p.name for p in (workspace / 'archive').iterdir()) == ['daily']
+
+
+def test_replay_finishes_an_interrupted_commit(workspace, monkeypatch):
+    with monkeypatch.context() as m:
+        _crash_after(m, 2)
+        with pytest.raises(Crash):
+            _plan(workspace).commit()
+
+    journal = ArchiveJournal(workspace)
+    assert journal.pending()
+    assert journal.recover('replay')['action'] == 'replayed'
+
+    assert (workspace / 'work' / 'context.md').read_text() == 'new context'
+    assert (workspace / 'work' / 'weeks' / 'review.md').read_text() == 'review'
+    assert not journal.pending()
+
+
+def test_rollback_restores_the_workspace(workspace, monkeypatch):
+    with monkeypatch.context() as m:
+        _crash_after(m, 2)
+        with pytest.raises(Crash):
+            _plan(workspace).commit()
+
+    assert ArchiveJournal(workspace).recover('rollback')['action'] == 'rolled-back'
+
+    assert (workspace / 'work' / 'daily' / '2025-11-10.md').read_text() == 'monday'
+    assert (workspace / 'work' / 'context.md').read_text() == 'old context'
+    assert not (workspace / 'archive' / 'daily' / '2025-11-10.md').exists()
+    assert not (workspace / 'work' / 'weeks' / 'review.md').exists()
+    assert sorted(p.name for p in (workspace / 'archive').iterdir()) == ['daily']
+
+
+def test_crash_while_planning_leaves_nothing_behind_targets(workspace):
+    _plan(workspace)  # Process dies before commit(): only staged files exist
+
+    assert sorted(p.name for p in (workspace / 'work').iterdir()) == ['context.md', 'daily', 'weeks']
+    assert list((workspace / 'work' / 'weeks').iterdir()) == []
+
+    journal = ArchiveJournal(workspace)
+    assert journal.pending()
+    assert journal.recover()['action'] == 'discarded-uncommitted-plan'
+    assert not journal.pending()
+    assert (workspace / 'work' / 'context.md').read_text() == 'old context'
+
+
+def test_discard_drops_staged_files(workspace):
+    journal = _plan(workspace)
+    journal.discard()
+
+    assert not journal.pending()
+    assert list((workspace / 'archive').iterdir()) == []
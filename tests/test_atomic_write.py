@@ -0,0 +1,51 @@
+"""Tests for atomic writes and hand-edit-aware generated files."""
+
+import json
+
+from atomic_write import GeneratedFiles, write_atomic, write_if_changed
+
+
+def test_write_if_changed_leaves_identical_content_alone(tmp_path):
+    path = tmp_path / 'out.md'
+    assert write_if_changed(path, 'a')
+    mtime = path.stat().st_mtime_ns
+
+    assert not write_if_changed(path, 'a')
+    assert path.stat().st_mtime_ns == mtime
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_atomic_keeps_file_mode(tmp_path):
+    path = tmp_path / 'out.md'
+    path.write_text('old')
+    path.chmod(0o600)
+
+    write_atomic(path, 'new')
+
+    assert path.read_text() == 'new'
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_generated_file_keeps_hand_edits(tmp_path):
+    generated = GeneratedFiles(tmp_path / '.generated.json')
+    week = tmp_path / 'week.md'
+
+    assert generated.write(week, 'v1') == 'written'
+    assert generated.write(week, 'v1') == 'unchanged'
+    week.write_text('v1 plus notes')
+
+    assert generated.write(week, 'v2') == 'edited'
+    assert week.read_text() == 'v1 plus notes'
+    assert generated.write(week, 'v2', force=True) == 'written'
+
+
+def test_unrecorded_file_is_adopted(tmp_path):
+    week = tmp_path / 'week.md'
+    week.write_text('written before tracking')
+    generated = GeneratedFiles(tmp_path / '.generated.json')
+
+    assert not generated.is_edited(week)
+    assert generated.write(week, 'v2') == 'written'
+    assert week.read_text() == 'v2'
+    assert list(json.loads((tmp_path / '.generated.json').read_text())) == ['week.md']
+    assert GeneratedFiles(tmp_path / '.generated.json').write(week, 'v3') == 'written'
@@ -0,0 +1,43 @@
+"""Tests for the dated-file index."""
+
+from date_index import DateIndex, get_date_index
+
+
+def _touch(directory, *names):
+    for name in names:
+        (directory / name).write_text('x')
+
+
+def test_lookups_by_day_week_and_month(tmp_path):
+    _touch(tmp_path, '2025-11-10-mon.md', '2025-11-14-fri.md', '2025-11-17-next.md',
+           '2025-11-decisions.md', 'notes.md', '2025-11-12-skip.txt')
+
+    index = DateIndex(tmp_path)
+
+    assert [p.name for p in index.for_day('2025-11-10')] == ['2025-11-10-mon.md']
+    assert [p.name for p in index.for_week('2025-11-10')] == ['2025-11-10-mon.md', '2025-11-14-fri.md']
+    assert [p.name for p in index.for_month('2025-11')] == [
+        '2025-11-10-mon.md', '2025-11-14-fri.md', '2025-11-17-next.md', '2025-11-decisions.md']
+
+
+def test_discard_removes_only_that_file(tmp_path):
+    _touch(tmp_path, '2025-11-10-a.md', '2025-11-10-b.md', '2025-11-decisions.md')
+    index = DateIndex(tmp_path)
+
+    index.discard(tmp_path / '2025-11-10-a.md')
+    index.discard(tmp_path / '2025-11-decisions.md')
+    index.discard(tmp_path / 'undated.md')
+
+    assert [p.name for p in index.for_day('2025-11-10')] == ['2025-11-10-b.md']
+    assert [p.name for p in index.for_month('2025-11')] == ['2025-11-10-b.md']
+
+
+def test_shared_index_rescans_after_directory_changes(tmp_path):
+    _touch(tmp_path, '2025-11-10-a.md')
+    index = get_date_index(tmp_path)
+    assert get_date_index(tmp_path) is index
+
+    (tmp_path / '2025-11-10-a.md').rename(tmp_path / '2025-11-11-a.md')
+
+    assert [p.name for p in get_date_index(tmp_path).for_day('2025-11-11')] == ['2025-11-11-a.md']
+    assert get_date_index(tmp_path).for_day('2025-11-10') == []
@@ -0,0 +1,138 @@
+"""Tests for the job scheduler: cron triggers, catch-up, the DAG and the lock."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+import job_scheduler
+from job_scheduler import CronSchedule, Job, JobHistory, JobScheduler, command_job
+from workspace_lock import WorkspaceLock
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    return JobScheduler(JobHistory(tmp_path / 'history.json'), WorkspaceLock(tmp_path / 'workspace.lock'))
+
+
+def _recorder(calls, name, code=0):
+    def func(moment):
+        calls.append((name, moment))
+        return code
+    return func
+
+
+def test_cron_next_after():
+    weekdays = CronSchedule('30 17 * * 1-5')
+
+    assert weekdays.next_after(datetime(2025, 11, 14, 17, 30)) == datetime(2025, 11, 17, 17, 30)
+    assert CronSchedule('0 8 1 * *').next_after(datetime(2025, 11, 14)) == datetime(2025, 12, 1, 8, 0)
+    with pytest.raises(ValueError):
+        CronSchedule('61 * * * *')
+
+
+def test_catch_up_runs_as_of_the_missed_trigger(scheduler):
+    calls = []
+    scheduler.add(Job('archive', _recorder(calls, 'archive'), cron='0 17 * * 5'))
+    scheduler.add(Job('rollup', _recorder(calls, 'rollup'), after=['archive']))
+    scheduler.history.last_tick = '2025-11-14T16:00:00'
+
+    results = scheduler.tick(datetime(2025, 11, 17, 9, 0))
+
+    assert results == {'archive': 'ok', 'rollup': 'ok'}
+    assert sorted(calls) == [('archive', datetime(2025, 11, 14, 17, 0)), ('rollup', datetime(2025, 11, 14, 17, 0))]
+    assert scheduler.tick(datetime(2025, 11, 17, 9, 5)) == {}
+
+
+def test_command_job_fills_placeholders_from_trigger_time(monkeypatch):
+    import bradan
+
+    argv = []
+    monkeypatch.setattr(bradan, 'main', lambda args: argv.extend(args) or 0)
+    job = command_job('archive', ['archive', '--week-start', '{monday}'],
+                      inputs={'--docs': 'inbox/docs-{today}.json'})
+
+    assert job.func(datetime(2025, 11, 14, 17, 0)) == 0
+    assert argv[:3] == ['archive', '--week-start', '2025-11-10']
+    assert argv[4].endswith('inbox/docs-2025-11-14.json')
+    assert job.missing_inputs(datetime(2025, 11, 14)) == ['inbox/docs-2025-11-14.json']
+
+
+def test_failed_dependency_skips_downstream(scheduler):
+    calls = []
+    scheduler.add(Job('week', _recorder(calls, 'week', code=1)))
+    scheduler.add(Job('summary', _recorder(calls, 'summary'), after=['week']))
+
+    assert scheduler.run(['summary']) == {'week': 'failed', 'summary': 'skipped'}
+    assert [name for name, _ in calls] == ['week']
+    assert scheduler.history.latency('week')['failures'] == 1
+
+
+def test_dependency_without_inputs_does_not_block(scheduler, tmp_path, monkeypatch):
+    monkeypatch.setattr(job_scheduler, 'PROJECT_ROOT', tmp_path)
+    calls = []
+    scheduler.add(Job('link-notes', _recorder(calls, 'link-notes'), inputs=['inbox/docs.json']))
+    scheduler.add(Job('inbox', _recorder(calls, 'inbox'), after=['link-notes']))
+
+    assert scheduler.run(['inbox']) == {'link-notes': 'skipped', 'inbox': 'ok'}
+    assert [name for name, _ in calls] == ['inbox']
+
+
+def test_default_jobs_order_jobs_that_fire_together():
+    scheduler = JobScheduler()
+    for name, spec in job_scheduler.DEFAULT_JOBS.items():
+        scheduler.add(command_job(name, spec['command'], spec.get('after', ()), spec.get('cron'), spec.get('inputs')))
+
+    order = scheduler.order()
+    assert order.index('week') < order.index('summary')
+    assert order.index('archive') < order.index('rollup')
+    assert order.index('link-notes') < order.index('inbox')
+
+
+def test_cycles_and_unknown_jobs_are_rejected(scheduler):
+    scheduler.add(Job('a', _recorder([], 'a'), after=['b']))
+    scheduler.add(Job('b', _recorder([], 'b'), after=['a']))
+
+    with pytest.raises(ValueError):
+        scheduler.order()
+    with pytest.raises(ValueError):
+        scheduler.run([])
+    with pytest.raises(ValueError):
+        scheduler.run(['missing'])
+
+
+def test_workspace_lock_is_reentrant_in_process(scheduler, tmp_path):
+    inner = []
+
+    def job(moment):
+        # A job run in-process takes the lock the scheduler already holds
+        with WorkspaceLock(tmp_path / 'workspace.lock'):
+            inner.append(True)
+
+    scheduler.add(Job('archive', job))
+    assert scheduler.run(['archive']) == {'archive': 'ok'}
+    assert inner == [True]
+
+
+def test_busy_lock_skips_a_tick(scheduler, tmp_path):
+    scheduler.add(Job('archive', _recorder([], 'archive'), cron='0 17 * * 5'))
+    scheduler.history.last_tick = '2025-11-14T16:00:00'
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        # Another process's lock, simulated from a thread with its own flock
+        import fcntl
+        with open(tmp_path / 'workspace.lock', 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait(5)
+    try:
+        assert scheduler.tick(datetime(2025, 11, 14, 17, 5)) == {}
+    finally:
+        release.set()
+        thread.join()
@@ -0,0 +1,75 @@
+"""Tests for the backlink graph."""
+
+from link_graph import LinkGraph, get_link_graph
+
+
+def _write(root, rel_path, content=''):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_links_resolve_and_backlinks(tmp_path):
+    _write(tmp_path, 'work/meetings/2025-11-05-sync.md')
+    _write(tmp_path, 'work/weeks/week-46.md')
+    _write(tmp_path, 'work/daily/2025-11-05.md',
+           '@meetings/2025-11-05-sync.md and [[work/weeks/week-46.md|Week]] and [[missing]]')
+
+    graph = get_link_graph(tmp_path)
+
+    assert graph.linked_from('work/meetings/2025-11-05-sync.md') == ['work/daily/2025-11-05.md']
+    assert graph.linked_from('work/weeks/week-46.md') == ['work/daily/2025-11-05.md']
+    assert [link['raw'] for link in graph.broken_links()] == ['[[missing]]']
+    assert LinkGraph(tmp_path).files == graph.files
+
+
+def test_broken_link_heals_when_its_target_appears(tmp_path):
+    _write(tmp_path, 'work/daily/2025-11-05.md', 'see [[notes.md]]')
+    graph = LinkGraph(tmp_path)
+    graph.refresh()
+    assert len(graph.broken_links()) == 1
+
+    _write(tmp_path, 'work/daily/notes.md', 'notes')
+    graph.refresh()
+
+    assert graph.broken_links() == []
+    assert graph.linked_from('work/daily/notes.md') == ['work/daily/2025-11-05.md']
+
+
+def test_link_breaks_and_moves_on_when_its_target_goes(tmp_path):
+    _write(tmp_path, 'work/daily/2025-11-05.md', 'see [[notes]]')
+    _write(tmp_path, 'work/daily/notes.md')
+    _write(tmp_path, 'archive/notes.md')
+    graph = LinkGraph(tmp_path)
+    graph.refresh()
+    assert graph.links_from('work/daily/2025-11-05.md')[0]['target'] == 'work/daily/notes.md'
+
+    (tmp_path / 'work/daily/notes.md').unlink()
+    graph.refresh()
+    assert graph.links_from('work/daily/2025-11-05.md')[0]['target'] == 'archive/notes.md'
+
+    (tmp_path / 'archive/notes.md').unlink()
+    graph.update_file(tmp_path / 'archive/notes.md')
+    assert [link['raw'] for link in graph.broken_links()] == ['[[notes]]']
+
+
+def test_update_file_relinks_a_new_target(tmp_path):
+    _write(tmp_path, 'work/daily/2025-11-05.md', 'see [[notes.md]]')
+    graph = LinkGraph(tmp_path)
+    graph.refresh()
+
+    graph.update_file(_write(tmp_path, 'work/daily/notes.md'))
+
+    assert graph.linked_from('work/daily/notes.md') == ['work/daily/2025-11-05.md']
+
+
+def test_plan_moves_rewrites_referrers(tmp_path):
+    _write(tmp_path, 'work/meetings/2025-11-05-sync.md')
+    _write(tmp_path, 'work/daily/2025-11-05.md', 'met @meetings/2025-11-05-sync.md')
+    graph = get_link_graph(tmp_path)
+
+    plan = graph.plan_moves([('work/meetings/2025-11-05-sync.md', 'archive/meetings/2025-11/2025-11-05-sync.md')])
+
+    assert plan['rewrites'] == {'work/daily/2025-11-05.md': {
+        'content': 'met [[archive/meetings/2025-11/2025-11-05-sync.md]]', 'links': 1}}
@@ -0,0 +1,71 @@
+"""Tests for the Slack export zip reader."""
+
+import json
+import zipfile
+
+import pytest
+
+from slack_export import SlackExportReader, ingest_slack_export
+
+USERS = [{'id': 'U1', 'name': 'alice', 'profile': {'display_name': 'Alice'}}]
+DAYS = {
+    'general/2025-11-04.json': [{'ts': '1762250000.000100', 'user': 'U1', 'text': "I'll send the draft today."}],
+    'general/2025-11-05.json': [{'ts': '1762336400.000100', 'user': 'U1', 'text': 'hello'},
+                                {'ts': '1762336500.000100', 'user': 'U2', 'text': 'hi'}],
+    'random/2025-11-05.json': [{'ts': '1762336600.000100', 'user': 'U2', 'text': 'lunch?'}],
+}
+
+
+def make_export(path, prefix=''):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(prefix + 'users.json', json.dumps(USERS))
+        archive.writestr(prefix + 'channels.json', json.dumps([{'name': 'general'}, {'name': 'random'}]))
+        for name, messages in DAYS.items():
+            archive.writestr(prefix + name, json.dumps(messages))
+        if prefix:
+            archive.writestr('__MACOSX/' + prefix + 'general/._2025-11-05.json', 'not json')
+    return path
+
+
+@pytest.mark.parametrize('prefix', ['', 'export/', 'acme Slack export Nov 1 2025/'])
+def test_layouts_read_the_same(tmp_path, prefix):
+    reader = SlackExportReader(make_export(tmp_path / 'export.zip', prefix))
+
+    messages = list(reader.iter_messages())
+
+    assert reader.channels() == ['general', 'random']
+    assert [m['ts'] for m in messages] == [
+        '1762250000.000100', '1762336400.000100', '1762336500.000100', '1762336600.000100'
+    ]
+    assert messages[0]['channel'] == 'general'
+    assert messages[0]['user_name'] == 'Alice'
+
+
+def test_cursors_skip_seen_messages(tmp_path):
+    zip_path = make_export(tmp_path / 'export.zip', 'export/')
+
+    first = ingest_slack_export(str(zip_path))
+    second = ingest_slack_export(str(zip_path))
+
+    assert first['messages_ingested'] == 4
+    assert len(first['commitments']) == 1
+    assert second['messages_ingested'] == 0
+    assert second['cursors'] == first['cursors'] == {'general': '1762336500.000100', 'random': '1762336600.000100'}
+
+
+def test_inbox_gets_one_batch_per_day_file(tmp_path):
+    class RecordingInbox:
+        def __init__(self):
+            self.batches = []
+
+        def add_slack_messages(self, messages):
+            self.batches.append([m['ts'] for m in messages])
+
+    inbox = RecordingInbox()
+    ingest_slack_export(str(make_export(tmp_path / 'export.zip')), inbox=inbox)
+
+    assert inbox.batches == [
+        ['1762250000.000100'],
+        ['1762336400.000100', '1762336500.000100'],
+        ['1762336600.000100'],
+    ]
@@ -0,0 +1,107 @@
+"""Tests for the Slack outbox and the reminder producers that feed it."""
+
+import threading
+import time
+from datetime import datetime
+
+from meeting_scheduler import MeetingReminderScheduler
+from slack_notifier import create_action_reminder, create_meeting_reminder
+from slack_outbox import MCPTransport, SlackOutbox
+
+ACTIONS = [{'task': 'Send the SPIF draft', 'meeting': 'Pricing sync', 'owner': 'Eamon'}]
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_producers_queue_and_flush_as_one_digest(tmp_path):
+    outbox = SlackOutbox(tmp_path / 'outbox.jsonl', sleep=lambda s: None)
+
+    action = create_action_reminder(ACTIONS, outbox=outbox)
+    meeting = create_meeting_reminder('Pricing sync', '2:00 PM', '30 min', ['Riley'], ['Draft'], [], outbox=outbox)
+
+    assert action['queued_id'] and meeting['queued_id']
+    delivered = outbox.flush(settle=False)
+    assert len(delivered) == 1
+    assert delivered[0]['message'].startswith('📬 *2 updates*')
+    assert outbox.pending() == []
+
+
+def test_settle_holds_recent_batches(tmp_path):
+    clock = FakeClock()
+    outbox = SlackOutbox(tmp_path / 'outbox.jsonl', window_seconds=120, clock=clock, sleep=lambda s: None)
+    outbox.enqueue({'recipient': 'me', 'message': 'a'})
+
+    assert outbox.flush(settle=True) == []
+    clock.now += 121
+    assert [p['message'] for p in outbox.flush(settle=True)] == ['a']
+
+
+def test_enqueue_during_flush_is_kept(tmp_path):
+    path = tmp_path / 'outbox.jsonl'
+
+    class EnqueueingTransport(MCPTransport):
+        def deliver(self, payload):
+            if not self.sent:
+                SlackOutbox(path).enqueue({'recipient': 'other', 'message': 'late'})
+            return super().deliver(payload)
+
+    outbox = SlackOutbox(path, transport=EnqueueingTransport(), sleep=lambda s: None)
+    outbox.enqueue({'recipient': 'me', 'message': 'first'})
+
+    assert len(outbox.flush(settle=False)) == 1
+    assert [e['message'] for e in outbox.pending()] == ['late']
+
+
+def test_concurrent_flushes_send_each_batch_once(tmp_path):
+    path = tmp_path / 'outbox.jsonl'
+    for recipient in ('a', 'b', 'c'):
+        SlackOutbox(path).enqueue({'recipient': recipient, 'message': 'hi'})
+
+    sent = []
+
+    class SlowTransport:
+        def deliver(self, payload):
+            time.sleep(0.02)
+            sent.append(payload['recipient'])
+            return None
+
+    threads = [
+        threading.Thread(target=SlackOutbox(path, transport=SlowTransport(), rate=1000, burst=10).flush,
+                         kwargs={'settle': False})
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(sent) == ['a', 'b', 'c']
+
+
+def test_meeting_scheduler_coalesces_reminders_due_together(tmp_path):
+    meetings = tmp_path / 'meetings'
+    meetings.mkdir()
+    for name in ('pricing', 'hiring'):
+        (meetings / f'{name}.md').write_text(
+            f"# Meeting: {name}\n**Date:** 2025-11-10\n**Time:** 2:00 pm - 2:30 pm\n"
+        )
+    (tmp_path / 'daily').mkdir()
+    daily = tmp_path / 'daily' / '2025-11-10.md'
+    daily.write_text("- @meetings/pricing.md\n- @meetings/hiring.md\n")
+
+    digests = []
+    outbox = SlackOutbox(tmp_path / 'outbox.jsonl', sleep=lambda s: None)
+    scheduler = MeetingReminderScheduler(daily, on_reminder=digests.append, outbox=outbox)
+    scheduler.load()
+
+    queued = scheduler.pop_due(datetime(2025, 11, 10, 13, 50))
+
+    assert len(queued) == 2
+    assert len(digests) == 1
+    assert digests[0]['message'].startswith('📬 *2 updates*')
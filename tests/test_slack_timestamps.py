@@ -0,0 +1,39 @@
+"""Tests for Slack timestamp bucketing."""
+
+from datetime import datetime
+
+import pytest
+
+from slack_context_extractor import SlackContextExtractor
+from slack_timestamps import convert_timestamps, day_key, format_slack_ts, group_by_period, week_key
+
+TS = '1762336400.000100'
+
+
+def test_day_and_week_keys_match_datetime():
+    day = datetime.fromtimestamp(float(TS)).date()
+
+    assert day_key(TS) == day.isoformat()
+    assert week_key(TS) == datetime.fromordinal(day.toordinal() - day.weekday()).date().isoformat()
+    assert format_slack_ts(TS) == day.strftime('%B %d, %Y')
+
+
+@pytest.mark.parametrize('ts', ['', 'abc', None, '99999999999999999999.1', '-99999999999999.0'])
+def test_invalid_and_out_of_range_timestamps_are_unknown(ts):
+    assert day_key(ts) == 'unknown'
+    assert week_key(ts) == 'unknown'
+    assert format_slack_ts(ts) == 'Unknown date'
+    assert convert_timestamps([ts]) == [('unknown', 'unknown', 'Unknown date')]
+    assert SlackContextExtractor()._format_timestamp(ts) == 'Unknown date'
+
+
+def test_group_by_period_and_channel():
+    items = [
+        {'timestamp': TS, 'channel': 'general'},
+        {'timestamp': '99999999999999999999', 'channel': 'general'},
+        {'timestamp': TS, 'channel': 'random'},
+    ]
+
+    grouped = group_by_period(items, 'week', by_channel=True)
+
+    assert list(grouped) == [(week_key(TS), 'general'), ('unknown', 'general'), (week_key(TS), 'random')]
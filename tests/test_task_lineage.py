@@ -0,0 +1,60 @@
+"""Tests for carry-forward task lineage."""
+
+import os
+
+import pytest
+
+from task_lineage import TaskLineage
+
+
+def _write(root, date_str, *tasks):
+    path = root / 'work' / 'daily' / f'{date_str}.md'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('# Daily\n\n' + ''.join(f'- {task}\n' for task in tasks))
+    # Make sure the edit is visible even on coarse-mtime filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    _write(tmp_path, '2025-11-03', '[ ] Email Bob re SPIF', '[ ] Book offsite')
+    _write(tmp_path, '2025-11-04', '[ ] Email Bob re: SPIF', '[x] Book offsite')
+    return tmp_path
+
+
+def test_lineage_follows_edited_task_text(workspace):
+    lineage = TaskLineage(str(workspace))
+
+    assert lineage.carried_days('Email Bob re SPIF') == 2
+    assert lineage.cycle_time('Book offsite') == 1
+    assert lineage.age('Email Bob re SPIF', today='2025-11-10') == 7
+
+
+def test_editing_latest_daily_refolds_only_that_day(workspace, monkeypatch):
+    lineage = TaskLineage(str(workspace))
+    monkeypatch.setattr(TaskLineage, '_reset', lambda self: pytest.fail('full rebuild'))
+
+    _write(workspace, '2025-11-04', '[x] Email Bob re: SPIF', '[ ] New task')
+    assert lineage.refresh() == 1
+
+    assert lineage.cycle_time('Email Bob re SPIF') == 1
+    assert lineage.carried_days('Email Bob re SPIF') == 1
+    assert lineage.cycle_time('Book offsite') is None
+    assert lineage.carried_days('New task') == 1
+
+    _write(workspace, '2025-11-04', '[x] Email Bob re: SPIF')
+    lineage.refresh()
+    assert lineage.find('New task') is None
+    assert {t['first_seen'] for t in lineage.tasks.values()} == {'2025-11-03'}
+
+
+def test_editing_older_daily_rebuilds(workspace):
+    lineage = TaskLineage(str(workspace))
+
+    _write(workspace, '2025-11-03', '[ ] Email Bob re SPIF')
+    assert lineage.refresh() == 2
+
+    assert lineage.find('Book offsite')['first_seen'] == '2025-11-04'
+    assert TaskLineage(str(workspace)).tasks == lineage.tasks
@@ -0,0 +1,51 @@
+"""Tests for timing spans and the summary tree."""
+
+import pytest
+
+import tracing
+from tracing import span
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    yield
+    tracing.disable()
+
+
+def _run(path, files):
+    tracing.enable(path)
+    with span('week'):
+        for _ in range(files):
+            with span('read'):
+                pass
+        with span('write'):
+            pass
+    tracing.disable()
+
+
+def test_disabled_spans_record_nothing():
+    with span('idle'):
+        pass
+    assert tracing.disable() == []
+
+
+def test_spans_nest_under_their_parent(tmp_path):
+    _run(tmp_path / 'trace.jsonl', 2)
+
+    spans = tracing.load(tmp_path / 'trace.jsonl')
+    week = next(s for s in spans if s['name'] == 'week')
+
+    assert week['parent_id'] is None
+    assert [s['parent_id'] for s in spans if s['name'] != 'week'] == [week['span_id']] * 3
+
+
+def test_appended_runs_keep_their_own_trees(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    _run(path, 2)
+    _run(path, 3)
+
+    lines = tracing.summary_tree(tracing.load(path)).splitlines()
+    names = [line.split('%', 1)[1].rstrip() for line in lines]
+
+    assert names[0] == '  week x2'
+    assert sorted(names[1:]) == ['    read x5', '    write x2']
@@ -0,0 +1,36 @@
+"""Tests for week aggregates and the rolling active context built from them."""
+
+from datetime import datetime
+
+from week_aggregates import build_week_aggregate
+from weekly_archival import WeeklyArchival
+
+
+def _day(top_3=(), follow_ups=(), done=()):
+    return {'top_3': list(top_3), 'meetings': [], 'follow_ups': list(follow_ups), 'follow_ups_done': list(done)}
+
+
+def test_follow_up_ticked_later_in_the_week_is_closed():
+    aggregate = build_week_aggregate([
+        _day(['Ship'], ['Email Ana', 'Book room']),
+        _day(['Ship'], done=['Email Ana']),
+    ], '2025-11-week-45')
+
+    assert aggregate['priorities'] == ['Ship']
+    assert aggregate['follow_ups'] == ['Book room']
+    assert aggregate['follow_ups_done'] == ['Email Ana']
+
+
+def test_active_context_drops_follow_ups_closed_in_later_weeks(tmp_path):
+    archival = WeeklyArchival(str(tmp_path), context_weeks=3)
+
+    archival.update_active_context([_day(['Ship'], ['Email Ana', 'Book room'])], datetime(2025, 11, 3))
+    archival.update_active_context([_day(['Ship'], ['Call Bo'], done=['Email Ana'])], datetime(2025, 11, 10))
+    archival.update_active_context([_day(['Plan'])], datetime(2025, 11, 17))
+
+    content = (tmp_path / 'work' / 'active-context.md').read_text()
+    follow_ups = content.split('## Open Follow-Ups')[1].split('##')[0]
+
+    assert 'Email Ana' not in follow_ups
+    assert '- [ ] Book room _(since Nov 03)_' in follow_ups
+    assert '- [ ] Call Bo _(since Nov 10)_' in follow_ups
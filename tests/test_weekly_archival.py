@@ -0,0 +1,55 @@
+"""Tests for the journaled weekly archival command."""
+
+import json
+
+import pytest
+
+from atomic_write import content_hash
+from weekly_archival import archive_week_command
+
+DAILY = """# Monday, November 10, 2025
+
+## Top 3 Priorities
+
+### 1. Ship the deck
+
+## Follow-Up Items
+
+- [ ] Email Ana
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    daily = tmp_path / 'work' / 'daily'
+    daily.mkdir(parents=True)
+    (daily / '2025-11-10.md').write_text(DAILY)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_archive_moves_dailies_and_records_the_review(workspace):
+    result = archive_week_command('2025-11-10')
+
+    assert result['success'], result
+    assert result['review_status'] == 'written'
+    assert not (workspace / 'work' / 'daily' / '2025-11-10.md').exists()
+
+    review = workspace / result['review_file']
+    hashes = json.loads((review.parent / '.generated.json').read_text())
+    assert hashes[review.name] == content_hash(review.read_text())
+    assert not (workspace / 'archive' / '.archive-staging').exists()
+
+
+def test_archive_keeps_a_hand_edited_week_file(workspace):
+    weeks = workspace / 'work' / 'weeks'
+    weeks.mkdir(parents=True)
+    review = weeks / '2025-11-10-week-46.md'
+    review.write_text('my notes')
+    (weeks / '.generated.json').write_text(json.dumps({review.name: content_hash('generated')}))
+
+    result = archive_week_command('2025-11-10')
+
+    assert result['success'], result
+    assert result['review_status'] == 'edited'
+    assert review.read_text() == 'my notes'